@@ -0,0 +1,70 @@
+"""Encode/decode throughput and payload size of the backup codecs.
+
+Compares the format backups used before codecs (stdlib ``json`` with
+``indent=2``) with the ``json`` and ``compact`` codecs, on a synthetic
+household in the backup layout. Requires Home Assistant to be importable.
+
+    python benchmarks/bench_codec.py [--children N] [--tasks N] [--history N] [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+from collections.abc import Callable
+
+from dataset import make_household
+
+from custom_components.kids_tasks import codec
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Return the best wall time of ``func`` in milliseconds.
+
+    The garbage collector is paused while timing, like ``timeit`` does.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return min(timings) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--children", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--history", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = make_household(args.children, args.tasks, args.history)
+    del data["system"]
+    data = {"version": 1, "timestamp": "2026-10-01T18:00:00.000000", **data}
+
+    formats: dict[str, tuple[Callable[[], str], Callable[[str], object]]] = {
+        "stdlib json, indent=2 (before)": (lambda: json.dumps(data, indent=2), json.loads),
+        "codec json": (lambda: codec.CODECS["json"].encode(data), codec.decode),
+        "codec compact": (lambda: codec.CODECS["compact"].encode(data), codec.decode),
+    }
+
+    print(f"orjson: {'yes' if codec.orjson is not None else 'no'}")
+    print(f"{'format':32} {'size':>10} {'encode':>10} {'decode':>10}")
+    for name, (encode, decode) in formats.items():
+        payload = encode()
+        size = len(payload.encode("utf-8")) / 1024 / 1024
+        encode_ms = best_of(args.repeat, encode)
+        decode_ms = best_of(args.repeat, lambda: decode(payload))
+        print(f"{name:32} {size:7.2f} MiB {encode_ms:7.1f} ms {decode_ms:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
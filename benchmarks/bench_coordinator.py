@@ -0,0 +1,213 @@
+"""Latency of the coordinator operations at several household sizes.
+
+Drives ``KidsTasksDataUpdateCoordinator`` on synthetic households, with an
+in-memory stand-in for the storage (it encodes and decodes like ``Store``,
+without touching the disk) and a ``hass.bus`` stand-in that only counts the
+fired events. Measures loading, the first and later refreshes, saving, the
+daily/weekly/monthly resets and ``async_complete_task``. Requires Home
+Assistant to be importable.
+
+Scales are ``CHILDRENxTASKSxREWARDSxHISTORY``:
+
+    python benchmarks/bench_coordinator.py [--scales 2x20x5x200,10x1000x50x20000] [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import logging
+import statistics
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from dataset import make_household
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from custom_components.kids_tasks.const import TASK_STATUS_TODO
+from custom_components.kids_tasks.coordinator import KidsTasksDataUpdateCoordinator
+
+DEFAULT_SCALES = "2x20x5x200,5x200x20x5000,10x1000x50x20000"
+
+
+class MemoryStorage:
+    """In-memory stand-in for ``KidsTasksStorage``.
+
+    Loads decode and writes encode the whole document with Home Assistant's
+    JSON helpers, like ``Store`` does; delayed saves wait for ``flush``.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize with the document to load."""
+        self.payload = json_bytes(data)
+        self.writes = 0
+        self._data_func: Callable[[], dict[str, Any]] | None = None
+
+    async def async_load(self) -> dict[str, Any]:
+        """Return the last written document."""
+        return json_loads(self.payload)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[dict[str, Any]], None]) -> CALLBACK_TYPE:
+        """Listeners are not called: nothing reaches the disk."""
+        return lambda: None
+
+    @callback
+    def async_delay_save(self, data_func: Callable[[], dict[str, Any]], delay: float = 0) -> None:
+        """Keep the data to write until ``flush``."""
+        self._data_func = data_func
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Write the data now."""
+        self._data_func = None
+        self._write(data)
+
+    def flush(self) -> None:
+        """Write the pending delayed save, if any."""
+        data_func, self._data_func = self._data_func, None
+        if data_func is not None:
+            self._write(data_func())
+
+    def _write(self, data: dict[str, Any]) -> None:
+        self.payload = json_bytes(data)
+        self.writes += 1
+
+
+class CountingBus:
+    """Stand-in for ``hass.bus`` that only counts the fired events."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.events: Counter[str] = Counter()
+
+    @callback
+    def async_fire(self, event_type: str, event_data: Any = None, *args: Any, **kwargs: Any) -> None:
+        """Count the event."""
+        self.events[event_type] += 1
+
+    @callback
+    def async_listen(self, *args: Any, **kwargs: Any) -> CALLBACK_TYPE:
+        """Nothing is ever delivered."""
+        return lambda: None
+
+    async_listen_once = async_listen
+
+
+async def shutdown_debouncer(coordinator: KidsTasksDataUpdateCoordinator) -> None:
+    """Shut the refresh debouncer down (a coroutine on older releases, like 2024.1)."""
+    result = coordinator._debounced_refresh.async_shutdown()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def timed(repeat: int, func: Callable[[], Awaitable[Any]]) -> list[float]:
+    """Return the wall times of ``repeat`` awaits of ``func``, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(timings: list[float]) -> str:
+    """Return the median (and 95th percentile for samples) of timings."""
+    median = statistics.median(timings)
+    if len(timings) < 20:
+        return f"{median:9.2f}"
+    p95 = statistics.quantiles(timings, n=20)[-1]
+    return f"{median:9.2f} (p95 {p95:.2f})"
+
+
+async def bench_scale(
+    children: int, tasks: int, rewards: int, history: int, repeat: int, samples: int
+) -> dict[str, str]:
+    """Measure the coordinator operations on one household."""
+    data = make_household(children, tasks, history, rewards)
+    results: dict[str, str] = {}
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        real_bus, bus = hass.bus, CountingBus()
+        hass.bus = bus
+        store = MemoryStorage(data)
+        coordinator = KidsTasksDataUpdateCoordinator(hass, store, "benchmark", save_delay=0)
+
+        async def save(invalidate: bool) -> None:
+            if invalidate:
+                coordinator._invalidate_snapshots()
+            else:
+                coordinator.async_mark_changed(tasks=[next(iter(coordinator.tasks))])
+            await coordinator.async_save_data()
+            store.flush()
+
+        try:
+            results["load"] = summarize(await timed(repeat, coordinator._load_data))
+            results["first refresh (load + resets)"] = summarize(
+                await timed(1, coordinator._async_update_data)
+            )
+            results["refresh, nothing changed"] = summarize(
+                await timed(repeat, coordinator._async_update_data)
+            )
+            results["save, one task changed"] = summarize(await timed(repeat, lambda: save(False)))
+            results["save, everything changed"] = summarize(await timed(repeat, lambda: save(True)))
+            results["daily reset"] = summarize(
+                await timed(repeat, coordinator.async_reset_all_daily_tasks)
+            )
+            results["weekly reset"] = summarize(
+                await timed(repeat, coordinator.async_reset_all_weekly_tasks)
+            )
+            results["monthly reset"] = summarize(
+                await timed(repeat, coordinator.async_reset_all_monthly_tasks)
+            )
+
+            pairs = [
+                (task.id, child_id)
+                for task in coordinator.tasks.values()
+                for child_id in task.assigned_child_ids
+                if task.get_status_for_child(child_id) == TASK_STATUS_TODO
+            ][:samples]
+            completions = []
+            for task_id, child_id in pairs:
+                completions += await timed(
+                    1, lambda: coordinator.async_complete_task(task_id, child_id)
+                )
+            results[f"complete task ({len(pairs)} calls)"] = summarize(completions)
+            results["events fired"] = f"{sum(bus.events.values()):9d}"
+        finally:
+            coordinator.async_cancel_timers()
+            await shutdown_debouncer(coordinator)
+            await coordinator.async_flush_data()
+            hass.bus = real_bus
+            await hass.async_stop(force=True)
+
+    return results
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=DEFAULT_SCALES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--samples", type=int, default=200, help="async_complete_task calls")
+    args = parser.parse_args()
+
+    # Missing notification services and the like are expected here
+    logging.basicConfig(level=logging.CRITICAL)
+
+    for scale in args.scales.split(","):
+        children, tasks, rewards, history = (int(value) for value in scale.split("x"))
+        print(f"\n{children} children, {tasks} tasks, {rewards} rewards, {history} history entries (ms)")
+        results = await bench_scale(children, tasks, rewards, history, args.repeat, args.samples)
+        for operation, value in results.items():
+            print(f"  {operation:38} {value}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""CPU and attribute bytes of the entity state writes per refresh.
+
+Sets up the sensor, button, select and number platforms on a synthetic
+household, then, for every refresh, computes the state of every entity the
+way a state write does (state, ``native_value``, ``extra_state_attributes``
+and the other attributes). Reports the CPU time per refresh and the JSON
+size of the attributes, in total and per entity class. Requires Home
+Assistant to be importable.
+
+    python benchmarks/bench_entities.py [--children N] [--tasks N] [--rewards N] [--history N] [--refreshes N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Any
+
+from bench_coordinator import CountingBus, MemoryStorage, shutdown_debouncer
+from dataset import make_household
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.kids_tasks import button, number, select, sensor
+from custom_components.kids_tasks.const import DOMAIN, TASK_STATUS_TODO
+from custom_components.kids_tasks.coordinator import KidsTasksDataUpdateCoordinator
+
+PLATFORMS = (sensor, button, select, number)
+
+
+async def setup_entities(hass: HomeAssistant, coordinator: KidsTasksDataUpdateCoordinator) -> list[Entity]:
+    """Return the entities the platforms create for the household."""
+    entry = SimpleNamespace(entry_id="benchmark")
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+    entities: list[Entity] = []
+    for platform in PLATFORMS:
+        await platform.async_setup_entry(hass, entry, entities.extend)
+    for entity in entities:
+        entity.hass = hass
+    return entities
+
+
+def write_states(entities: list[Entity]) -> dict[str, list[float]]:
+    """Compute every state, returning ``[cpu seconds, attribute bytes, count]`` per class."""
+    per_class: dict[str, list[float]] = defaultdict(lambda: [0.0, 0, 0])
+    for entity in entities:
+        start = time.process_time()
+        calculated = entity._async_calculate_state()
+        elapsed = time.process_time() - start
+        totals = per_class[type(entity).__name__]
+        totals[0] += elapsed
+        totals[1] += len(json_bytes(calculated.attributes))
+        totals[2] += 1
+    return per_class
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--children", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--rewards", type=int, default=50)
+    parser.add_argument("--history", type=int, default=10_000)
+    parser.add_argument("--refreshes", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    data = make_household(args.children, args.tasks, args.history, args.rewards)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        real_bus = hass.bus
+        hass.bus = CountingBus()
+        coordinator = KidsTasksDataUpdateCoordinator(hass, MemoryStorage(data), "benchmark", save_delay=0)
+        try:
+            await coordinator.async_refresh()
+            entities = await setup_entities(hass, coordinator)
+            todo = [
+                (task.id, child_id)
+                for task in coordinator.tasks.values()
+                for child_id in task.assigned_child_ids
+                if task.get_status_for_child(child_id) == TASK_STATUS_TODO
+            ]
+
+            refreshes: list[dict[str, list[float]]] = []
+            for index in range(args.refreshes):
+                # Each refresh follows a change, like a completed task
+                if index < len(todo):
+                    await coordinator.async_complete_task(*todo[index])
+                await coordinator.async_refresh()
+                refreshes.append(write_states(entities))
+        finally:
+            coordinator.async_cancel_timers()
+            await shutdown_debouncer(coordinator)
+            await coordinator.async_flush_data()
+            hass.bus = real_bus
+            await hass.async_stop(force=True)
+
+    print(
+        f"{args.children} children, {args.tasks} tasks, {args.rewards} rewards, "
+        f"{args.history} history entries: {len(entities)} entities"
+    )
+    print(f"{'entity class':34} {'count':>6} {'CPU ms/refresh':>15} {'attr KiB':>10}")
+    total_cpu: list[float] = [0.0] * len(refreshes)
+    total_bytes = 0
+    for name in sorted(refreshes[0], key=lambda name: -refreshes[0][name][0]):
+        cpu = [refresh[name][0] * 1000 for refresh in refreshes]
+        for index, value in enumerate(cpu):
+            total_cpu[index] += value
+        attr_bytes = refreshes[-1][name][1]
+        total_bytes += attr_bytes
+        count = int(refreshes[0][name][2])
+        print(f"{name:34} {count:6d} {statistics.median(cpu):15.2f} {attr_bytes / 1024:10.1f}")
+    print(f"{'total per refresh':34} {len(entities):6d} {statistics.median(total_cpu):15.2f} {total_bytes / 1024:10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""Memory used by the models of a large household once loaded.
+
+Decodes a synthetic household (10 children, 1,000 tasks, 10,000 history
+entries by default) from JSON, like storage does, then measures with
+``tracemalloc`` what the ``from_dict`` models keep alive. Requires Home
+Assistant to be importable (the integration package imports it).
+
+    python benchmarks/bench_memory.py [--children N] [--tasks N] [--history N]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from dataset import make_household
+
+from custom_components.kids_tasks.models import Child, Reward, Task
+
+
+def load_models(data: dict) -> tuple[dict, dict, dict]:
+    """Build the models the coordinator keeps in memory."""
+    return (
+        {child_id: Child.from_dict(child) for child_id, child in data["children"].items()},
+        {task_id: Task.from_dict(task) for task_id, task in data["tasks"].items()},
+        {reward_id: Reward.from_dict(reward) for reward_id, reward in data["rewards"].items()},
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--children", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--history", type=int, default=10_000)
+    args = parser.parse_args()
+
+    payload = json.dumps(make_household(args.children, args.tasks, args.history))
+
+    gc.collect()
+    tracemalloc.start()
+    data = json.loads(payload)
+    decoded, _ = tracemalloc.get_traced_memory()
+
+    models = load_models(data)
+    del data
+    gc.collect()
+    loaded, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    children, tasks, _rewards = models
+    statuses = sum(len(task.child_statuses) for task in tasks.values())
+    entries = sum(len(child.points_history) for child in children.values())
+    print(
+        f"{len(children)} children, {len(tasks)} tasks ({statuses} child statuses), "
+        f"{entries} history entries"
+    )
+    print(f"decoded JSON:  {decoded / 1024 / 1024:8.2f} MiB")
+    print(f"loaded models: {loaded / 1024 / 1024:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
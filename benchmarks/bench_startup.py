@@ -0,0 +1,97 @@
+"""Time to load a large store into models at startup.
+
+Decodes a synthetic household from its JSON payload and builds the models
+with ``from_dict``, the work done by the first coordinator refresh. Reports
+the stdlib ``json`` decoder and Home Assistant's orjson-based ``json_loads``
+(what ``Store`` uses), and what reading every timestamp afterwards costs.
+Requires Home Assistant to be importable.
+
+    python benchmarks/bench_startup.py [--children N] [--tasks N] [--history N] [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+from collections.abc import Callable
+
+from dataset import make_household
+
+from homeassistant.util.json import json_loads
+
+from custom_components.kids_tasks.models import Child, Reward, Task
+
+
+def load_models(data: dict) -> tuple[dict, dict, dict]:
+    """Build the models the coordinator keeps in memory."""
+    return (
+        {child_id: Child.from_dict(child) for child_id, child in data["children"].items()},
+        {task_id: Task.from_dict(task) for task_id, task in data["tasks"].items()},
+        {reward_id: Reward.from_dict(reward) for reward_id, reward in data["rewards"].items()},
+    )
+
+
+def read_timestamps(children: dict, tasks: dict) -> None:
+    """Read every timestamp of the models once."""
+    for child in children.values():
+        child.created_at
+        for entry in child.points_history:
+            entry.timestamp
+    for task in tasks.values():
+        task.created_at
+        for child_status in task.child_statuses.values():
+            child_status.completed_at
+            child_status.validated_at
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Return the best wall time of ``func`` in milliseconds.
+
+    The garbage collector is paused while timing, like ``timeit`` does.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return min(timings) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--children", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--history", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = json.dumps(make_household(args.children, args.tasks, args.history))
+    print(f"payload: {len(payload) / 1024 / 1024:.2f} MiB, {args.history} history entries")
+
+    data = json_loads(payload)
+    decode_json = best_of(args.repeat, lambda: json.loads(payload))
+    decode_ha = best_of(args.repeat, lambda: json_loads(payload))
+    build = best_of(args.repeat, lambda: load_models(data))
+
+    def build_and_read() -> None:
+        children, tasks, _ = load_models(data)
+        read_timestamps(children, tasks)
+
+    build_read = best_of(args.repeat, build_and_read)
+
+    print(f"decode (json):          {decode_json:8.1f} ms")
+    print(f"decode (HA json_loads): {decode_ha:8.1f} ms")
+    print(f"build models:           {build:8.1f} ms")
+    print(f"build + read all dates: {build_read:8.1f} ms")
+    print(f"startup (HA decode + build): {decode_ha + build:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
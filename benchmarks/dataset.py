@@ -0,0 +1,164 @@
+"""Synthetic household used by the benchmarks.
+
+Builds data in the storage layout (``children``/``tasks``/``rewards``/``system``)
+with the same shapes the integration writes, so it can be fed to the model
+``from_dict`` methods, the coordinator or the storage layer.
+"""
+from __future__ import annotations
+
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+# Make ``custom_components.kids_tasks`` importable when run from a checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.kids_tasks.const import (  # noqa: E402
+    CATEGORIES,
+    TASK_STATUS_PENDING_VALIDATION,
+    TASK_STATUS_TODO,
+    TASK_STATUS_VALIDATED,
+)
+
+ACTION_TYPES = ("task_validated", "task_completed", "task_penalty", "reward_claimed", "manual_adjustment")
+FREQUENCIES = ("daily", "daily", "weekly", "monthly", "none")
+WEEKLY_DAYS = (None, None, ["mon", "tue", "wed", "thu", "fri"], ["sat", "sun"], ["wed"])
+
+
+def make_household(
+    children: int = 10,
+    tasks: int = 1000,
+    history: int = 10_000,
+    rewards: int = 50,
+    seed: int = 42,
+) -> dict[str, Any]:
+    """Return a household in the storage layout.
+
+    Tasks mix frequencies, deadlines, penalties, weekday restrictions (on
+    daily tasks) and due dates (on one-off tasks). ``history`` entries are
+    spread evenly across the children, newest first.
+    """
+    rng = random.Random(seed)
+    now = datetime(2026, 10, 1, 18, 0)
+
+    def new_id() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128)))
+
+    child_ids = [new_id() for _ in range(children)]
+    task_ids = [new_id() for _ in range(tasks)]
+    task_names = {task_id: f"Tâche {index}" for index, task_id in enumerate(task_ids)}
+
+    tasks_data: dict[str, Any] = {}
+    for task_id in task_ids:
+        assigned = rng.sample(child_ids, k=min(len(child_ids), rng.randint(1, 3)))
+        statuses = {}
+        for child_id in assigned:
+            status = rng.choice((TASK_STATUS_TODO, TASK_STATUS_TODO, TASK_STATUS_VALIDATED, TASK_STATUS_PENDING_VALIDATION))
+            done_at = (now - timedelta(minutes=rng.randint(0, 600))).isoformat() if status != TASK_STATUS_TODO else None
+            statuses[child_id] = {
+                "child_id": child_id,
+                "status": status,
+                "completed_at": done_at,
+                "validated_at": done_at if status == TASK_STATUS_VALIDATED else None,
+                "penalty_applied_at": None,
+                "penalty_applied": False,
+                "validation_history": [],
+            }
+        frequency = rng.choice(FREQUENCIES)
+        due_date = None
+        if frequency == "none" and rng.random() < 0.5:
+            due_date = (now + timedelta(days=rng.randint(-3, 30))).isoformat()
+        tasks_data[task_id] = {
+            "id": task_id,
+            "name": task_names[task_id],
+            "description": "Description de la tâche",
+            "category": rng.choice(CATEGORIES),
+            "icon": None,
+            "points": rng.choice((5, 10, 15, 20)),
+            "coins": rng.choice((0, 1, 2)),
+            "frequency": frequency,
+            "status": TASK_STATUS_TODO,
+            "assigned_child_ids": assigned,
+            "child_statuses": statuses,
+            "created_at": (now - timedelta(days=rng.randint(1, 365))).isoformat(),
+            "last_completed_at": None,
+            "due_date": due_date,
+            "validation_required": True,
+            "active": True,
+            "suspended": False,
+            "suspended_until": None,
+            "weekly_days": rng.choice(WEEKLY_DAYS) if frequency == "daily" else None,
+            "deadline_time": rng.choice((None, "19:00", "20:30")),
+            "penalty_points": rng.choice((0, 0, 5)),
+            "deadline_passed": False,
+            "completed_by_child_id": None,
+        }
+
+    children_data: dict[str, Any] = {}
+    per_child = history // max(children, 1)
+    for index, child_id in enumerate(child_ids):
+        entries = []
+        for position in range(per_child):
+            task_id = rng.choice(task_ids)
+            entries.append(
+                {
+                    "timestamp": (now - timedelta(hours=6 * position, minutes=rng.randint(0, 59))).isoformat(),
+                    "action_type": rng.choice(ACTION_TYPES),
+                    "points_delta": rng.choice((-5, 5, 10, 15)),
+                    "description": f"Tâche '{task_names[task_id]}' validée",
+                    "related_entity_id": task_id,
+                    "related_entity_name": task_names[task_id],
+                    "child_id": child_id,
+                }
+            )
+        children_data[child_id] = {
+            "id": child_id,
+            "name": f"Enfant {index}",
+            "points": rng.randint(0, 2000),
+            "coins": rng.randint(0, 200),
+            "level": 1,
+            "avatar": "🧒",
+            "person_entity_id": None,
+            "avatar_type": "emoji",
+            "avatar_data": None,
+            "card_gradient_start": None,
+            "card_gradient_end": None,
+            "cosmetic_items": [],
+            "cosmetic_collection": {},
+            "active_cosmetics": {},
+            "points_history": entries,
+            "created_at": (now - timedelta(days=400)).isoformat(),
+            "card_customizations": {},
+        }
+
+    rewards_data = {}
+    for index in range(rewards):
+        reward_id = new_id()
+        rewards_data[reward_id] = {
+            "id": reward_id,
+            "name": f"Récompense {index}",
+            "description": "",
+            "cost": rng.choice((50, 100, 200)),
+            "coin_cost": 0,
+            "category": "fun",
+            "icon": None,
+            "active": True,
+            "limited_quantity": None,
+            "remaining_quantity": None,
+            "reward_type": "real",
+            "cosmetic_data": None,
+        }
+
+    return {
+        "children": children_data,
+        "tasks": tasks_data,
+        "rewards": rewards_data,
+        "system": {
+            "last_daily_reset": now.date().isoformat(),
+            "last_weekly_reset": None,
+            "last_monthly_reset": None,
+        },
+    }
@@ -9,13 +9,16 @@ import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN, STORAGE_VERSION, STORAGE_KEY
+from .const import DOMAIN, CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY
 from .coordinator import KidsTasksDataUpdateCoordinator
+from .history import HistoryArchive
+from .journal import Journal
 from .services import async_setup_services
+from .storage import KidsTasksStorage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,12 +35,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Kids Tasks from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
-    # Initialize storage
-    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    # Initialize storage (one store per collection)
+    store = KidsTasksStorage(hass)
     
     # Create coordinator
-    coordinator = KidsTasksDataUpdateCoordinator(hass, store, entry.entry_id)
+    save_delay = entry.options.get(CONF_SAVE_DELAY, entry.data.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY))
+    coordinator = KidsTasksDataUpdateCoordinator(hass, store, entry.entry_id, save_delay)
     await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(coordinator.async_cancel_timers)
+    # Journal entries covered by a snapshot on disk can be compacted
+    entry.async_on_unload(store.async_add_listener(coordinator.journal.async_snapshot_written))
+    
+    # Make sure coalesced writes reach the disk when Home Assistant stops
+    async def _async_flush_on_stop(event: Event) -> None:
+        await coordinator.async_flush_data()
+    
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_on_stop)
+    )
     
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
@@ -56,12 +71,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        # Write pending changes before the coordinator goes away
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        await coordinator.async_flush_data()
+        
         # Remove services when unloading
         services_to_remove = [
             "add_child", "add_task", "add_reward", "complete_task", 
-            "validate_task", "claim_reward", "reset_task", "clear_all_data",
+            "validate_task", "validate_all_tasks", "claim_reward", "reset_task", "clear_all_data",
             "cleanup_old_entities", "reset_all_daily_tasks", "reset_all_weekly_tasks",
-            "reset_all_monthly_tasks", "set_points", "set_coins", "set_level"
+            "reset_all_monthly_tasks", "set_points", "set_coins", "set_level", "batch"
         ]
         
         for service_name in services_to_remove:
@@ -75,21 +94,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove a config entry."""
     # This is called when the user removes the integration
-    from .const import STORAGE_KEY
-    
-    # Clear the storage data when integration is removed
-    storage = hass.helpers.storage.Store(1, STORAGE_KEY)
-    await storage.async_remove()
+    # Clear the storage data when integration is removed, with the journal and
+    # the history archive: a new entry would otherwise replay or show them
+    await KidsTasksStorage(hass).async_remove()
+    await Journal(hass).async_remove()
+    await HistoryArchive(hass).async_clear()
     
     # Force removal of any remaining entities
-    entity_registry = hass.data["entity_registry"]
-    entities_to_remove = []
-    
-    for entity_id, entity_entry in entity_registry.entities.items():
-        if entity_entry.config_entry_id == entry.entry_id:
-            entities_to_remove.append(entity_id)
+    registry = er.async_get(hass)
+    entities_to_remove = [
+        entity_entry.entity_id
+        for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id)
+    ]
     
     for entity_id in entities_to_remove:
-        entity_registry.async_remove(entity_id)
+        registry.async_remove(entity_id)
     
-    _LOGGER.info("Kids Tasks integration removed, storage cleared, and %d entities removed", len(entities_to_remove))
\ No newline at end of file
+    _LOGGER.info("Kids Tasks integration removed, storage, journal and history cleared, and %d entities removed", len(entities_to_remove))
\ No newline at end of file
@@ -0,0 +1,355 @@
+# ============================================================================
+# backup.py
+# ============================================================================
+
+"""File backups of the Kids Tasks data."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import uuid
+from collections.abc import Iterable, Iterator, Mapping
+from typing import IO, Any
+
+from homeassistant.core import HomeAssistant
+
+from .codec import Codec, decode, get_codec, json_dumps, json_loads
+from .const import DOMAIN
+from .models import Child, Reward, Task
+
+# Backups are written there, and relative restore paths are resolved there
+BACKUP_DIR = f"{DOMAIN}_backups"
+
+# First line of a backup file: one JSON line per object follows
+STREAM_FORMAT = f"{DOMAIN}_stream"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+MODELS = {"children": Child, "tasks": Task, "rewards": Reward}
+
+# Hex digits kept from the SHA-256 of an object
+HASH_LENGTH = 16
+
+# Longest chain of differential backups followed on restore
+MAX_CHAIN_LENGTH = 1000
+
+# kind -> object id -> content hash
+Manifest = dict[str, dict[str, str]]
+
+
+def resolve_backup_path(hass: HomeAssistant, path: str) -> str:
+    """Return the absolute path of a backup file (executor).
+
+    Relative paths are in the backup directory; absolute paths must be in
+    the configuration directory or an allowed external directory.
+    """
+    backup_dir = hass.config.path(BACKUP_DIR)
+    full_path = os.path.realpath(os.path.join(backup_dir, path))
+    config_dir = os.path.realpath(hass.config.config_dir)
+    if not (full_path.startswith(config_dir + os.sep) or hass.config.is_allowed_path(full_path)):
+        raise ValueError(f"Backup path is not allowed: {path}")
+    return full_path
+
+
+def object_hash(data: dict[str, Any]) -> str:
+    """Return the content hash of a child, task or reward dict."""
+    return hashlib.sha256(json_dumps(data, sort_keys=True).encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def state_hash(manifest: Manifest) -> str:
+    """Return the hash of a whole state from the hashes of its objects."""
+    return hashlib.sha256(json_dumps(manifest, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _without_history(data: dict[str, Any], include_history: bool) -> dict[str, Any]:
+    """Return an object dict as backed up, without its points history if excluded."""
+    if include_history or "points_history" not in data:
+        return data
+    return {key: value for key, value in data.items() if key != "points_history"}
+
+
+def hash_objects(
+    collections: Mapping[str, Mapping[str, dict[str, Any]]],
+    include_history: bool,
+    revisions: Mapping[str, Mapping[str, int]],
+    cache: Mapping[str, Mapping[str, tuple[int, bool, str]]],
+) -> dict[str, dict[str, tuple[int, bool, str]]]:
+    """Return ``(revision, include_history, hash)`` of every object (executor).
+
+    Objects whose revision did not change since ``cache`` was computed keep
+    their cached hash and are not serialized again.
+    """
+    hashes: dict[str, dict[str, tuple[int, bool, str]]] = {}
+    for kind, objects in collections.items():
+        kind_revisions = revisions.get(kind, {})
+        kind_cache = cache.get(kind, {})
+        kind_hashes = hashes[kind] = {}
+        for obj_id, obj in objects.items():
+            revision = kind_revisions.get(obj_id, -1)
+            cached = kind_cache.get(obj_id)
+            if cached is None or cached[0] != revision or cached[1] != include_history or revision < 0:
+                cached = (revision, include_history, object_hash(_without_history(obj, include_history)))
+            kind_hashes[obj_id] = cached
+    return hashes
+
+
+def write_backup(
+    path: str,
+    codec: Codec,
+    header: dict[str, Any],
+    collections: Mapping[str, Mapping[str, dict[str, Any]]],
+    include_history: bool,
+    hashes: Mapping[str, Mapping[str, tuple[int, bool, str]]],
+    base_path: str | None = None,
+) -> dict[str, Any]:
+    """Write a full backup, or a differential one against ``base_path`` (executor).
+
+    A differential backup holds the objects whose hash differs from the state
+    of its base (itself full or differential) and the ids deleted since.
+    Returns the header written and the uncompressed size.
+    """
+    manifest = {
+        kind: {obj_id: entry[2] for obj_id, entry in hashes.get(kind, {}).items()}
+        for kind in collections
+    }
+    header = {
+        **header,
+        "backup_id": uuid.uuid4().hex,
+        "include_history": include_history,
+        "state_hash": state_hash(manifest),
+    }
+
+    if base_path is None:
+        header["type"] = "full"
+        header["hashes"] = manifest
+        objects = collections
+    else:
+        chain = read_backup_chain(base_path)
+        base_header = chain[-1][1]
+        if base_header.get("include_history", True) != include_history:
+            raise ValueError("A differential backup must include history like its base")
+        base_manifest = chain_manifest(header for _path, header in chain)
+        objects = {
+            kind: {
+                obj_id: obj
+                for obj_id, obj in collections[kind].items()
+                if base_manifest.get(kind, {}).get(obj_id) != manifest[kind][obj_id]
+            }
+            for kind in collections
+        }
+        header["type"] = "delta"
+        header["base"] = {
+            "backup_id": base_header["backup_id"],
+            "file": os.path.relpath(base_path, os.path.dirname(path)),
+        }
+        header["hashes"] = {
+            kind: {obj_id: manifest[kind][obj_id] for obj_id in kind_objects}
+            for kind, kind_objects in objects.items()
+        }
+        header["deleted"] = {
+            kind: [obj_id for obj_id in base_manifest.get(kind, {}) if obj_id not in collections[kind]]
+            for kind in collections
+        }
+
+    size = write_backup_file(path, codec, header, objects, include_history)
+    return {"header": header, "size": size}
+
+
+def write_backup_file(
+    path: str,
+    codec: Codec,
+    header: dict[str, Any],
+    collections: Mapping[str, Mapping[str, dict[str, Any]]],
+    include_history: bool = True,
+) -> int:
+    """Stream the collections to a gzip file, one JSON line per object (executor).
+
+    The file is written next to ``path`` and moved into place once complete.
+    Returns the uncompressed size in bytes.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    size = 0
+    try:
+        with gzip.open(tmp_path, "wb") as f:
+            for line in _iter_lines(codec, header, collections, include_history):
+                data = line.encode("utf-8")
+                f.write(data)
+                size += len(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return size
+
+
+def _iter_lines(
+    codec: Codec,
+    header: dict[str, Any],
+    collections: Mapping[str, Mapping[str, dict[str, Any]]],
+    include_history: bool,
+) -> Iterator[str]:
+    """Yield the header line, then a ``[collection, id, object]`` line per object."""
+    yield json_dumps({**header, "format": STREAM_FORMAT, "codec": codec.name}) + "\n"
+    for collection, objects in collections.items():
+        for obj_id, obj in objects.items():
+            obj = _without_history(obj, include_history)
+            yield json_dumps([collection, obj_id, codec.pack_object(collection, obj)]) + "\n"
+
+
+def _open_text(path: str) -> IO[str]:
+    """Open a backup file for reading, gzip-compressed or not."""
+    with open(path, "rb") as raw:
+        compressed = raw.read(2) == _GZIP_MAGIC
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def read_backup_header(path: str) -> dict[str, Any]:
+    """Return the header of a streamed backup file (executor)."""
+    with _open_text(path) as f:
+        try:
+            header = json_loads(f.readline())
+        except ValueError:
+            header = None
+    if not isinstance(header, dict) or header.get("format") != STREAM_FORMAT:
+        raise ValueError(f"Not a streamed backup file: {path}")
+    return header
+
+
+def read_backup_chain(path: str) -> list[tuple[str, dict[str, Any]]]:
+    """Return the ``(path, header)`` of a backup and its bases, full backup first (executor)."""
+    chain = [(path, read_backup_header(path))]
+    while chain[-1][1].get("type") == "delta":
+        if len(chain) > MAX_CHAIN_LENGTH:
+            raise ValueError(f"Differential backup chain of {path} is too long")
+        delta_path, header = chain[-1]
+        base = header["base"]
+        base_path = os.path.normpath(os.path.join(os.path.dirname(delta_path), base["file"]))
+        try:
+            base_header = read_backup_header(base_path)
+        except FileNotFoundError:
+            raise ValueError(f"Base backup {base['file']} of {delta_path} is missing") from None
+        if base_header.get("backup_id") != base["backup_id"]:
+            raise ValueError(f"Base backup {base['file']} of {delta_path} was replaced")
+        chain.append((base_path, base_header))
+    chain.reverse()
+    return chain
+
+
+def chain_manifest(headers: Iterable[dict[str, Any]]) -> Manifest:
+    """Return the object hashes of the state a chain of backup headers leads to."""
+    manifest: Manifest = {kind: {} for kind in MODELS}
+    for header in headers:
+        if header.get("type") != "delta":
+            manifest = {kind: {} for kind in MODELS}
+        for kind, obj_ids in header.get("deleted", {}).items():
+            for obj_id in obj_ids:
+                manifest.setdefault(kind, {}).pop(obj_id, None)
+        for kind, kind_hashes in header.get("hashes", {}).items():
+            manifest.setdefault(kind, {}).update(kind_hashes)
+    return manifest
+
+
+def read_backup(path: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]], list[str]]:
+    """Read a backup, applying a differential one on top of its bases (executor).
+
+    When the backup has object hashes, the restored models are checked
+    against them. Returns the header, the models and the files read.
+    """
+    try:
+        read_backup_header(path)
+    except ValueError:
+        # Not a streamed backup: a single document, without hashes
+        header, models = read_backup_file(path)
+        return header, models, [path]
+
+    chain = read_backup_chain(path)
+
+    models: dict[str, dict[str, Any]] = {kind: {} for kind in MODELS}
+    for file_path, header in chain:
+        _header, objects = read_backup_file(file_path)
+        for kind, obj_ids in header.get("deleted", {}).items():
+            for obj_id in obj_ids:
+                models.get(kind, {}).pop(obj_id, None)
+        for kind, kind_objects in objects.items():
+            models[kind].update(kind_objects)
+
+    header = chain[-1][1]
+    if "hashes" in header:
+        verify_models(models, chain_manifest(header for _path, header in chain), header)
+    return header, models, [file_path for file_path, _header in chain]
+
+
+def verify_models(
+    models: Mapping[str, Mapping[str, Any]], manifest: Manifest, header: dict[str, Any]
+) -> None:
+    """Check the restored models against the hashes of the backup."""
+    include_history = header.get("include_history", True)
+    restored = {
+        kind: {
+            obj_id: object_hash(_without_history(model.to_dict(), include_history))
+            for obj_id, model in models.get(kind, {}).items()
+        }
+        for kind in MODELS
+    }
+    expected = {kind: manifest.get(kind, {}) for kind in MODELS}
+    if restored != expected:
+        mismatched = sum(
+            1
+            for kind in MODELS
+            for obj_id in restored[kind].keys() | expected[kind].keys()
+            if restored[kind].get(obj_id) != expected[kind].get(obj_id)
+        )
+        raise ValueError(f"Backup verification failed: {mismatched} objects differ")
+    if header.get("state_hash") not in (None, state_hash(restored)):
+        raise ValueError("Backup verification failed: state hash differs")
+
+
+def read_backup_file(path: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Read a backup file into models, one object at a time (executor).
+
+    Accepts the streamed format, gzip-compressed or not, and single-document
+    backups (``backup_data`` strings saved to a file). Returns the header and
+    the models of each collection; a differential file only has its changes.
+    """
+    with _open_text(path) as f:
+        first_line = f.readline()
+        try:
+            header = json_loads(first_line)
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("format") != STREAM_FORMAT:
+            # A single JSON document, possibly spread over several lines
+            return _read_document(first_line + f.read())
+        return header, _read_objects(f, get_codec(header.get("codec", "json")))
+
+
+def _read_objects(f: IO[str], codec: Codec) -> dict[str, dict[str, Any]]:
+    """Build the models of the object lines of a streamed backup."""
+    models: dict[str, dict[str, Any]] = {collection: {} for collection in MODELS}
+    for line in f:
+        if not line.strip():
+            continue
+        collection, obj_id, packed = json_loads(line)
+        if collection in MODELS:
+            models[collection][obj_id] = MODELS[collection].from_dict(
+                codec.unpack_object(collection, packed)
+            )
+    return models
+
+
+def _read_document(payload: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Build the models of a single-document backup."""
+    data = decode(payload)
+    models = {
+        collection: {
+            obj_id: model.from_dict(obj_data)
+            for obj_id, obj_data in data.pop(collection, {}).items()
+        }
+        for collection, model in MODELS.items()
+    }
+    return data, models
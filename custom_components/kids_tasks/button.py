@@ -9,10 +9,10 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import KidsTasksDataUpdateCoordinator
+from .entity import KidsTasksEntity
 
 
 async def async_setup_entry(
@@ -38,12 +38,12 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class TaskCompleteButton(CoordinatorEntity, ButtonEntity):
+class TaskCompleteButton(KidsTasksEntity, ButtonEntity):
     """Button to complete a task."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, task_id: str) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("tasks", task_id))
         self.task_id = task_id
         self._attr_unique_id = f"{DOMAIN}_complete_{task_id}"
         self._attr_icon = "mdi:check"
@@ -68,12 +68,12 @@ class TaskCompleteButton(CoordinatorEntity, ButtonEntity):
         pass
 
 
-class TaskValidateButton(CoordinatorEntity, ButtonEntity):
+class TaskValidateButton(KidsTasksEntity, ButtonEntity):
     """Button to validate a task."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, task_id: str) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("tasks", task_id))
         self.task_id = task_id
         self._attr_unique_id = f"{DOMAIN}_validate_{task_id}"
         self._attr_icon = "mdi:check-decagram"
@@ -0,0 +1,323 @@
+# ============================================================================
+# codec.py
+# ============================================================================
+
+"""Encoding of the Kids Tasks data for persistence, backups and exports."""
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Bundled with Home Assistant, but not required
+    orjson = None
+
+from .const import CATEGORIES, FREQUENCIES, REWARD_CATEGORIES, TASK_STATUSES
+
+# Compact format: datetimes are microseconds since this (naive) epoch
+COMPACT_EPOCH = datetime(2020, 1, 1)
+
+# Compact format: enum-like values are their index in these lists.
+# Only append to them, previously written payloads depend on the order.
+COMPACT_ENUMS: dict[str, list[str]] = {
+    "status": list(TASK_STATUSES),
+    "frequency": list(FREQUENCIES),
+    "category": [*CATEGORIES, *REWARD_CATEGORIES, "cosmetic"],
+    "action_type": [
+        "task_validated",
+        "task_completed",
+        "task_penalty",
+        "reward_claimed",
+        "manual_adjustment",
+        "set_level",
+        "set_value",
+    ],
+    "reward_type": ["real", "cosmetic"],
+    "avatar_type": ["emoji", "url", "inline", "person_entity"],
+}
+
+CHILD_DATETIMES = ("created_at",)
+TASK_DATETIMES = ("created_at", "last_completed_at", "due_date", "suspended_until")
+CHILD_STATUS_DATETIMES = ("completed_at", "validated_at", "penalty_applied_at")
+
+# Compact format: points history entries are rows of these fields
+HISTORY_FIELDS = (
+    "timestamp",
+    "action_type",
+    "points_delta",
+    "description",
+    "related_entity_id",
+    "related_entity_name",
+    "child_id",
+)
+
+
+def json_dumps(data: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize to JSON, with orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def json_loads(payload: str | bytes) -> Any:
+    """Parse JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+class Codec(ABC):
+    """Turn the data in the storage layout into a payload and back.
+
+    The layout is ``children``/``tasks``/``rewards`` plus top-level metadata
+    (``version``, ``timestamp``...), as written by the models' ``to_dict``.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode(self, data: dict[str, Any]) -> str:
+        """Return the payload of ``data``."""
+
+    def decode(self, payload: str | bytes) -> dict[str, Any]:
+        """Return the data of a payload written by any codec."""
+        return decode(payload)
+
+    @abstractmethod
+    def pack_object(self, collection: str, data: dict[str, Any]) -> Any:
+        """Return a single child, task or reward dict as this codec writes it."""
+
+    @abstractmethod
+    def unpack_object(self, collection: str, packed: Any) -> dict[str, Any]:
+        """Return the dict of an object written by ``pack_object``."""
+
+
+class JsonCodec(Codec):
+    """Plain JSON, the format the integration has always written."""
+
+    name = "json"
+
+    def __init__(self, indent: bool = False) -> None:
+        """Initialize the codec."""
+        self.indent = indent
+
+    def encode(self, data: dict[str, Any]) -> str:
+        """Return the JSON document of ``data``."""
+        return json_dumps(data, indent=self.indent)
+
+    def pack_object(self, collection: str, data: dict[str, Any]) -> Any:
+        """Return the object dict unchanged."""
+        return data
+
+    def unpack_object(self, collection: str, packed: Any) -> dict[str, Any]:
+        """Return the object dict unchanged."""
+        return packed
+
+
+class CompactCodec(Codec):
+    """JSON with compact datetimes, enum-like values and history entries.
+
+    Naive datetimes become integers (microseconds since ``COMPACT_EPOCH``),
+    known enum-like values become their index in ``COMPACT_ENUMS`` and points
+    history entries become rows of ``HISTORY_FIELDS``. Anything else (aware
+    datetimes, unknown values, extra keys) is written unchanged.
+    """
+
+    name = "compact"
+
+    def encode(self, data: dict[str, Any]) -> str:
+        """Return the compact JSON document of ``data``."""
+        return json_dumps(self.pack(data))
+
+    def pack(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return ``data`` in the compact layout."""
+        packed = {
+            key: value for key, value in data.items() if key not in ("children", "tasks", "rewards")
+        }
+        packed["codec"] = self.name
+        for collection in ("children", "tasks", "rewards"):
+            packed[collection] = {
+                obj_id: self.pack_object(collection, obj)
+                for obj_id, obj in data.get(collection, {}).items()
+            }
+        return packed
+
+    def unpack(self, packed: dict[str, Any]) -> dict[str, Any]:
+        """Return the data of a compact layout."""
+        data = {key: value for key, value in packed.items() if key != "codec"}
+        for collection in ("children", "tasks", "rewards"):
+            data[collection] = {
+                obj_id: self.unpack_object(collection, obj)
+                for obj_id, obj in packed.get(collection, {}).items()
+            }
+        return data
+
+    def pack_object(self, collection: str, data: dict[str, Any]) -> Any:
+        """Return a single child, task or reward dict in the compact layout."""
+        if collection == "children":
+            return self._pack_child(data)
+        if collection == "tasks":
+            return self._pack_task(data)
+        return _pack_record(data)
+
+    def unpack_object(self, collection: str, packed: Any) -> dict[str, Any]:
+        """Return the dict of an object in the compact layout."""
+        if collection == "children":
+            return self._unpack_child(packed)
+        if collection == "tasks":
+            return self._unpack_task(packed)
+        return _unpack_record(packed)
+
+    @staticmethod
+    def _pack_child(child: dict[str, Any]) -> dict[str, Any]:
+        packed = _pack_record(child, CHILD_DATETIMES)
+        if "points_history" in child:
+            packed["points_history"] = [_pack_history_entry(entry) for entry in child["points_history"]]
+        return packed
+
+    @staticmethod
+    def _unpack_child(child: dict[str, Any]) -> dict[str, Any]:
+        data = _unpack_record(child, CHILD_DATETIMES)
+        if "points_history" in child:
+            data["points_history"] = [_unpack_history_entry(entry) for entry in child["points_history"]]
+        return data
+
+    @staticmethod
+    def _pack_task(task: dict[str, Any]) -> dict[str, Any]:
+        packed = _pack_record(task, TASK_DATETIMES)
+        if "child_statuses" in task:
+            packed["child_statuses"] = {
+                child_id: _pack_record(status, CHILD_STATUS_DATETIMES)
+                for child_id, status in task["child_statuses"].items()
+            }
+        return packed
+
+    @staticmethod
+    def _unpack_task(task: dict[str, Any]) -> dict[str, Any]:
+        data = _unpack_record(task, TASK_DATETIMES)
+        if "child_statuses" in task:
+            data["child_statuses"] = {
+                child_id: _unpack_record(status, CHILD_STATUS_DATETIMES)
+                for child_id, status in task["child_statuses"].items()
+            }
+        return data
+
+
+def _pack_datetime(value: Any) -> Any:
+    """Return a naive ISO datetime as an integer, anything else unchanged."""
+    if value.__class__ is not str:
+        return value
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if moment.tzinfo is not None:
+        return value
+    delta = moment - COMPACT_EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _unpack_datetime(value: Any) -> Any:
+    """Return a packed datetime as its ISO string."""
+    if value.__class__ is not int:
+        return value
+    return (COMPACT_EPOCH + timedelta(microseconds=value)).isoformat()
+
+
+def _pack_enum(key: str, value: Any) -> Any:
+    """Return the index of a known enum-like value."""
+    values = COMPACT_ENUMS.get(key)
+    if values is None or value.__class__ is not str:
+        return value
+    try:
+        return values.index(value)
+    except ValueError:
+        return value
+
+
+def _unpack_enum(key: str, value: Any) -> Any:
+    """Return the value of a packed enum index."""
+    values = COMPACT_ENUMS.get(key)
+    if values is None or value.__class__ is not int or not 0 <= value < len(values):
+        return value
+    return values[value]
+
+
+def _pack_record(record: dict[str, Any], datetimes: tuple[str, ...] = ()) -> dict[str, Any]:
+    """Pack the datetimes and enum-like values of a model dict."""
+    packed = {key: _pack_enum(key, value) for key, value in record.items()}
+    for key in datetimes:
+        if key in packed:
+            packed[key] = _pack_datetime(packed[key])
+    return packed
+
+
+def _unpack_record(record: dict[str, Any], datetimes: tuple[str, ...] = ()) -> dict[str, Any]:
+    """Unpack the datetimes and enum-like values of a model dict."""
+    data = {key: _unpack_enum(key, value) for key, value in record.items()}
+    for key in datetimes:
+        if key in data:
+            data[key] = _unpack_datetime(data[key])
+    return data
+
+
+def _pack_history_entry(entry: dict[str, Any]) -> Any:
+    """Return a points history entry as a row, or unchanged if it has other keys."""
+    if entry.keys() != set(HISTORY_FIELDS):
+        return entry
+    return [
+        _pack_datetime(entry["timestamp"]),
+        _pack_enum("action_type", entry["action_type"]),
+        *(entry[key] for key in HISTORY_FIELDS[2:]),
+    ]
+
+
+def _unpack_history_entry(row: Any) -> dict[str, Any]:
+    """Return the points history entry of a row."""
+    if not isinstance(row, list):
+        return row
+    entry = dict(zip(HISTORY_FIELDS, row))
+    entry["timestamp"] = _unpack_datetime(entry["timestamp"])
+    entry["action_type"] = _unpack_enum("action_type", entry["action_type"])
+    return entry
+
+
+CODECS: dict[str, Codec] = {
+    "json": JsonCodec(indent=True),
+    "compact": CompactCodec(),
+}
+
+
+def get_codec(name: str) -> Codec:
+    """Return the codec registered under ``name``."""
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown codec: {name}") from None
+
+
+def decode(payload: str | bytes) -> dict[str, Any]:
+    """Return the data of a payload, whichever codec wrote it.
+
+    Compact payloads are marked with their ``codec``; payloads without it are
+    plain JSON, like the backups written before codecs existed.
+    """
+    data = json_loads(payload)
+    if not isinstance(data, dict):
+        raise ValueError("Payload is not a JSON object")
+    codec = data.get("codec")
+    if codec == CompactCodec.name:
+        return CODECS[codec].unpack(data)
+    if codec is not None and codec != JsonCodec.name:
+        raise ValueError(f"Unknown codec: {codec}")
+    return data
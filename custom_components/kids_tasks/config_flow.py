@@ -15,7 +15,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
-from .const import DOMAIN, CATEGORIES, FREQUENCIES
+from .const import DOMAIN, CATEGORIES, FREQUENCIES, CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +24,7 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required("name", default="Kids Tasks"): str,
         vol.Optional("validation_required", default=True): bool,
         vol.Optional("notifications_enabled", default=True): bool,
+        vol.Optional(CONF_SAVE_DELAY, default=DEFAULT_SAVE_DELAY): int,
     }
 )
 
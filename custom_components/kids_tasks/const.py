@@ -9,10 +9,13 @@ STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}.storage"
 
 # Default configuration
-DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_SAVE_DELAY = 10  # Seconds during which mutations are coalesced into a single write
 DEFAULT_VALIDATION_REQUIRED = True
 DEFAULT_NOTIFICATIONS_ENABLED = True
 
+# Configuration keys
+CONF_SAVE_DELAY = "save_delay"
+
 # Task statuses
 TASK_STATUS_TODO = "todo"
 TASK_STATUS_IN_PROGRESS = "in_progress"
@@ -5,27 +5,55 @@
 """Data update coordinator for Kids Tasks integration."""
 from __future__ import annotations
 
+import copy
 import logging
-from datetime import datetime, timedelta, date
+import os
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from datetime import datetime, date
 from typing import Any
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .backup import hash_objects, read_backup, resolve_backup_path, write_backup
+from .codec import decode as decode_payload, get_codec
+from .const import DOMAIN, DEFAULT_SAVE_DELAY
+from .cosmetics import CosmeticsCatalog
+from .history import HistoryArchive
+from .index import RewardIndex, TaskIndex
+from .journal import STATUS_FIELDS, Journal
 from .models import Child, Task, Reward
+from .scheduler import (
+    RESET_FREQUENCIES,
+    DeadlineScheduler,
+    next_reset_boundary,
+    reset_period_start,
+)
+from .storage import KidsTasksStorage
 
 _LOGGER = logging.getLogger(__name__)
 
+COLLECTIONS = ("children", "tasks", "rewards")
+
 
 class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
-    def __init__(self, hass: HomeAssistant, store: Store, config_entry_id: str = None) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        store: KidsTasksStorage,
+        config_entry_id: str = None,
+        save_delay: float = DEFAULT_SAVE_DELAY,
+    ) -> None:
         """Initialize."""
         self.store = store
         self.config_entry_id = config_entry_id
+        self.save_delay = save_delay
+        self._save_pending = False
         self.children: dict[str, Child] = {}
         self.tasks: dict[str, Task] = {}
         self.rewards: dict[str, Reward] = {}
@@ -38,34 +66,116 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         # Verrouillage pour éviter les resets concurrents
         self._reset_in_progress = False
         
+        # Timers armed for the next daily/weekly/monthly reset boundary
+        self._reset_timers: dict[str, CALLBACK_TYPE] = {}
+        
+        # Storage is only read once: afterwards the in-memory models are authoritative
+        self._data_loaded = False
+        
+        # Incremental snapshots: serialized dict of every object, refreshed only
+        # for objects marked as changed since the previous snapshot
+        self._revision = 0
+        self._snapshots: dict[str, dict[str, dict[str, Any]]] = {kind: {} for kind in COLLECTIONS}
+        self._snapshot_revisions: dict[str, dict[str, int]] = {kind: {} for kind in COLLECTIONS}
+        self._dirty: dict[str, set[str]] = {kind: set() for kind in COLLECTIONS}
+        # Content hash of each snapshot for differential backups: (revision, include_history, hash)
+        self._backup_hashes: dict[str, dict[str, tuple[int, bool, str]]] = {}
+        
+        # Targeted entity updates: (kind, id) pairs touched since the last
+        # refresh. last_changes is None when every listener must be updated.
+        self._changes: set[tuple[str, str]] = set()
+        self._full_update = True
+        self._changes_date: date | None = None
+        self.last_changes: set[tuple[str, str]] | None = None
+        
+        # Deadlines are handled by a timer armed for the earliest one
+        self.deadline_scheduler = DeadlineScheduler(hass, self._async_handle_deadlines)
+        
+        # Derived views of the tasks, re-indexed per changed task
+        self.task_index = TaskIndex()
+        self.reward_index = RewardIndex()
+        
+        # Cosmetics catalog shipped with the integration, read on demand
+        self.cosmetics_catalog = CosmeticsCatalog(hass)
+        
+        # Points, coins, status and claim events, replayed past the last snapshot
+        self.journal = Journal(hass)
+        
+        # Points history entries older than the 20 kept on each child
+        self.history_archive = HistoryArchive(hass)
+        
+        # Entities currently added, by the (kind, id) of the object they show
+        self._entity_ids: dict[tuple[str, str], set[str]] = {}
+        
+        # Batches in progress: saves and refreshes are deferred to the end
+        self._batch_depth = 0
+        self._batch_save = False
+        self._batch_refresh = False
+        
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # No polling: resets and deadlines are driven by timers and every
+            # mutation requests its own refresh
+            update_interval=None,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         try:
-            # Load data from storage
-            await self._load_data()
-            
-            # Check for deadline violations
-            await self._check_task_deadlines()
-            
-            # Check for automatic task resets
-            await self._check_automatic_resets()
+            # Load data from storage on first refresh only, later refreshes
+            # work on the in-memory models and only run the time-based checks
+            if not self._data_loaded:
+                await self._load_data()
+                self._data_loaded = True
+                self._invalidate_snapshots()
+                self._rebuild_task_views()
+                
+                # Catch up on resets missed while Home Assistant was stopped
+                await self._check_automatic_resets()
+                for frequency in RESET_FREQUENCIES:
+                    self._async_arm_reset_timer(frequency)
             
             # Return current state
-            return {
-                "children": {child_id: child.to_dict() for child_id, child in self.children.items()},
-                "tasks": {task_id: task.to_dict() for task_id, task in self.tasks.items()},
-                "rewards": {reward_id: reward.to_dict() for reward_id, reward in self.rewards.items()},
-            }
+            self._refresh_snapshots()
+            self.last_changes = self._collect_changes()
+            return {kind: self._snapshots[kind] for kind in COLLECTIONS}
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+    def _collect_changes(self) -> set[tuple[str, str]] | None:
+        """Return the change set to publish, or None for a full update."""
+        today = datetime.now().date()
+        # Day-based sensors ("today", "this week") change at midnight even
+        # when no object did, and a failed refresh marked every entity unavailable
+        full_update = (
+            self._full_update
+            or not self.last_update_success
+            or today != self._changes_date
+        )
+        changes = self._changes
+        self._changes = set()
+        self._full_update = False
+        self._changes_date = today
+        return None if full_update else changes
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose context is in the last change set.
+        
+        Entities subscribe with a ``(kind, id)`` context; listeners without a
+        context (household-wide sensors) are updated on every refresh.
+        """
+        changes = self.last_changes
+        if changes is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+        
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changes:
+                update_callback()
+
     async def _load_data(self) -> None:
         """Load data from storage."""
         data = await self.store.async_load() or {}
@@ -113,18 +223,93 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                 self.last_monthly_reset = datetime.fromisoformat(system_data["last_monthly_reset"]).date()
             except ValueError:
                 self.last_monthly_reset = None
+        
+        # Events journaled after the snapshot was written (e.g. before a crash)
+        entries = await self.journal.async_load(system_data.get("journal_seq", 0))
+        replayed_tasks: set[str] = set()
+        for entry in entries:
+            self._replay_journal_entry(entry)
+            if entry.get("event") == "status":
+                replayed_tasks.add(entry["task_id"])
+        for task_id in replayed_tasks:
+            if task_id in self.tasks:
+                self.tasks[task_id]._update_global_status()
+        self.journal.track(self.children.values(), self.tasks.values())
+        if entries:
+            _LOGGER.info("Replayed %d journal entries", len(entries))
+            await self.async_save_data()
+
+    def _replay_journal_entry(self, entry: dict[str, Any]) -> None:
+        """Apply a journal entry: entries hold the resulting values, so replay is idempotent."""
+        event = entry.get("event")
+        if event in ("points", "coins"):
+            child = self.children.get(entry["child_id"])
+            if child is None:
+                return
+            if event == "points":
+                child.points = entry["balance"]
+                child.level = (child.points // 100) + 1
+            else:
+                child.coins = entry["balance"]
+        elif event == "status":
+            task = self.tasks.get(entry["task_id"])
+            if task is not None and entry["child_id"] in task.child_statuses:
+                child_status = task.child_statuses[entry["child_id"]]
+                child_status.status = entry["to"]
+                # Entries journaled before the timestamps were recorded only have the status
+                for field in STATUS_FIELDS:
+                    if field in entry:
+                        setattr(child_status, field, entry[field])
+        elif event == "claim":
+            reward = self.rewards.get(entry["reward_id"])
+            if reward is not None:
+                reward.remaining_quantity = entry["remaining"]
 
-    async def _check_task_deadlines(self) -> None:
-        """Check for tasks that have passed their deadline and apply penalties."""
+    @callback
+    def async_cancel_timers(self) -> None:
+        """Cancel the timers armed by the coordinator."""
+        self.deadline_scheduler.async_stop()
+        for unsub in self._reset_timers.values():
+            unsub()
+        self._reset_timers.clear()
+
+    @callback
+    def _async_arm_reset_timer(self, frequency: str) -> None:
+        """Arm the timer for the next reset boundary of a frequency."""
+        if (unsub := self._reset_timers.pop(frequency, None)) is not None:
+            unsub()
+        
+        async def _async_reset(_fired_at: datetime) -> None:
+            self._reset_timers.pop(frequency, None)
+            try:
+                # Boundaries can coincide (Monday 1st): whichever timer runs first
+                # performs every due reset, the others find nothing to do
+                async with self.transaction():
+                    await self._check_automatic_resets()
+                    await self.async_request_refresh()
+            finally:
+                self._async_arm_reset_timer(frequency)
+        
+        when = next_reset_boundary(frequency, datetime.now())
+        self._reset_timers[frequency] = async_track_point_in_time(
+            self.hass, _async_reset, when.astimezone()
+        )
+
+    async def _async_handle_deadlines(self, task_ids: list[str], now: datetime) -> None:
+        """Apply penalties for the tasks whose deadline was just reached."""
         penalties_applied = False
+        deadlines_passed = False
         
-        for task_id, task in self.tasks.items():
+        for task_id in task_ids:
+            task = self.tasks.get(task_id)
             # Skip bonus tasks (frequency = "none") - they don't have deadlines
-            if task.frequency == "none":
+            if task is None or task.frequency == "none":
                 continue
                 
-            if task.check_deadline():  # Returns True if deadline just passed
+            if task.check_deadline(now):  # Returns True if deadline just passed
+                deadlines_passed = True
                 _LOGGER.info(f"Task '{task.name}' (ID: {task_id}) deadline passed")
+                self.async_mark_changed(tasks=[task_id])
                 
                 # Apply penalties only to assigned children who haven't completed the task
                 for child_id in task.get_assigned_child_ids():
@@ -151,6 +336,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                                 task.child_statuses[child_id].penalty_applied = True
                                 task.child_statuses[child_id].penalty_applied_at = datetime.now()
                             
+                            self.async_mark_changed(children=[child_id])
                             penalties_applied = True
                             
                             _LOGGER.info(
@@ -180,6 +366,8 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         # Save data if penalties were applied
         if penalties_applied:
             await self.async_save_data()
+        if deadlines_passed:
+            await self.async_request_refresh()
 
     async def _check_automatic_resets(self) -> None:
         """Check if tasks need to be automatically reset based on frequency."""
@@ -189,49 +377,33 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             
         self._reset_in_progress = True
         try:
-            now = datetime.now()
-            today = now.date()
-            
-            # Check daily tasks (reset at midnight)
-            if self.last_daily_reset is None or self.last_daily_reset < today:
-                daily_tasks = [task for task in self.tasks.values() if task.frequency == "daily"]
-                if daily_tasks:
-                    penalty_tasks = [t for t in daily_tasks if t.penalty_points > 0]
-                    _LOGGER.info("Auto-resetting %d daily tasks (%d with penalties) - last reset was %s", len(daily_tasks), len(penalty_tasks), self.last_daily_reset)
-                    await self._reset_tasks_with_penalty(daily_tasks, "daily")
-                    # Only update timestamp after successful reset
-                    self.last_daily_reset = today
-                    await self.async_save_data()  # Ensure timestamp is saved immediately
-                    _LOGGER.info("Daily reset completed - updated timestamp to %s", today)
+            today = datetime.now().date()
             
-            # Check weekly tasks (reset on Monday) - only if not already done this week
-            week_start = today - timedelta(days=today.weekday())  # Start of current week (Monday)
-            if self.last_weekly_reset is None or self.last_weekly_reset < week_start:
-                weekly_tasks = [task for task in self.tasks.values() if task.frequency == "weekly"]
-                if weekly_tasks:
-                    penalty_tasks = [t for t in weekly_tasks if t.penalty_points > 0]
-                    _LOGGER.info("Auto-resetting %d weekly tasks (%d with penalties) - last reset was %s", len(weekly_tasks), len(penalty_tasks), self.last_weekly_reset)
-                    await self._reset_tasks_with_penalty(weekly_tasks, "weekly")
-                    # Only update timestamp after successful reset
-                    self.last_weekly_reset = week_start
-                    await self.async_save_data()  # Ensure timestamp is saved immediately
-                    _LOGGER.info("Weekly reset completed - updated timestamp to %s", week_start)
-            
-            # Check monthly tasks (reset on 1st of month) - only if not already done this month
-            month_start = today.replace(day=1)  # Start of current month
-            if self.last_monthly_reset is None or self.last_monthly_reset < month_start:
-                monthly_tasks = [task for task in self.tasks.values() if task.frequency == "monthly"]
-                if monthly_tasks:
-                    penalty_tasks = [t for t in monthly_tasks if t.penalty_points > 0]
-                    _LOGGER.info("Auto-resetting %d monthly tasks (%d with penalties) - last reset was %s", len(monthly_tasks), len(penalty_tasks), self.last_monthly_reset)
-                    await self._reset_tasks_with_penalty(monthly_tasks, "monthly")
-                    # Only update timestamp after successful reset
-                    self.last_monthly_reset = month_start
-                    await self.async_save_data()  # Ensure timestamp is saved immediately
-                    _LOGGER.info("Monthly reset completed - updated timestamp to %s", month_start)
+            # Daily tasks reset at midnight, weekly on Monday, monthly on the 1st
+            for frequency in RESET_FREQUENCIES:
+                await self._async_reset_if_due(frequency, today)
         finally:
             self._reset_in_progress = False
 
+    async def _async_reset_if_due(self, frequency: str, today: date) -> None:
+        """Reset the tasks of a frequency if not already done this period."""
+        period_start = reset_period_start(frequency, today)
+        last_reset = getattr(self, f"last_{frequency}_reset")
+        if last_reset is not None and last_reset >= period_start:
+            return
+        
+        tasks = self.tasks_by_frequency(frequency)
+        if not tasks:
+            return
+        
+        penalty_tasks = [t for t in tasks if t.penalty_points > 0]
+        _LOGGER.info("Auto-resetting %d %s tasks (%d with penalties) - last reset was %s", len(tasks), frequency, len(penalty_tasks), last_reset)
+        await self._reset_tasks_with_penalty(tasks, frequency)
+        # Only update timestamp after successful reset
+        setattr(self, f"last_{frequency}_reset", period_start)
+        await self.async_save_data()  # Ensure timestamp is saved immediately
+        _LOGGER.info("%s reset completed - updated timestamp to %s", frequency.capitalize(), period_start)
+
     async def _reset_tasks_with_penalty(self, tasks: list, frequency: str) -> bool:
         """Reset a list of tasks and apply penalties for uncompleted ones. Returns True if any changes were made."""
         penalties_applied = False
@@ -274,6 +446,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                                     task.child_statuses[child_id].penalty_applied = True
                                     task.child_statuses[child_id].penalty_applied_at = datetime.now()
 
+                                self.async_mark_changed(children=[child_id])
                                 penalties_applied = True
 
                                 _LOGGER.info(
@@ -321,29 +494,255 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                             task.child_statuses[child_id].status = "validated"
                             task.child_statuses[child_id].validated_at = datetime.now()
                     task._update_global_status()
+            
+            # Once the final status is known: indexes and journal follow it
+            self.async_mark_changed(tasks=[task.id])
         
         # Note: Saving is handled by the caller to ensure atomic operations
         return tasks_reset or penalties_applied
 
-    async def async_save_data(self) -> None:
-        """Save data to storage."""
-        data = {
-            "children": {child_id: child.to_dict() for child_id, child in self.children.items()},
-            "tasks": {task_id: task.to_dict() for task_id, task in self.tasks.items()},
-            "rewards": {reward_id: reward.to_dict() for reward_id, reward in self.rewards.items()},
+    @callback
+    def async_mark_changed(
+        self,
+        children: Iterable[str] = (),
+        tasks: Iterable[str] = (),
+        rewards: Iterable[str] = (),
+    ) -> None:
+        """Record that objects were added, modified or removed.
+        
+        Each marked object gets a new revision and is re-serialized on the next
+        snapshot; every other object keeps its previously serialized dict.
+        """
+        tasks = tuple(tasks)
+        rewards = tuple(rewards)
+        for kind, ids in (("children", children), ("tasks", tasks), ("rewards", rewards)):
+            objects = self._collection(kind)
+            dirty = self._dirty[kind]
+            for obj_id in ids:
+                obj = objects.get(obj_id)
+                if obj is not None:
+                    self._revision += 1
+                    obj.revision = self._revision
+                dirty.add(obj_id)
+                self._changes.add((kind, obj_id))
+                if kind == "children":
+                    self.journal.record_child(obj_id, obj)
+                    if obj is not None:
+                        self.history_archive.async_append(obj_id, obj.pop_spilled_history())
+                elif kind == "tasks":
+                    self.journal.record_task(obj_id, obj)
+        
+        # Deadlines and indexes depend on the task status: update them after every change
+        for task_id in tasks:
+            task = self.tasks.get(task_id)
+            had_pending = self.task_index.has_pending(task_id)
+            if task is not None:
+                self.deadline_scheduler.async_schedule(task)
+                self.task_index.update_task(task)
+            else:
+                self.deadline_scheduler.async_unschedule(task_id)
+                self.task_index.remove_task(task_id)
+            
+            # Nothing left to validate (validated, rejected, reset or removed)
+            if had_pending and not self.task_index.has_pending(task_id):
+                self.hass.async_create_task(self._async_dismiss_validation_notification(task_id))
+        
+        for reward_id in rewards:
+            reward = self.rewards.get(reward_id)
+            if reward is not None:
+                self.reward_index.update_reward(reward)
+            else:
+                self.reward_index.remove_reward(reward_id)
+        
+        # Child sensors count the child's tasks: a task change also concerns the
+        # children assigned to it, before (last snapshot) and after the change
+        for task_id in tasks:
+            task = self.tasks.get(task_id)
+            if task is not None:
+                for child_id in task.assigned_child_ids:
+                    self._changes.add(("children", child_id))
+            previous = self._snapshots["tasks"].get(task_id)
+            if previous is not None:
+                for child_id in previous.get("assigned_child_ids", []):
+                    self._changes.add(("children", child_id))
+
+    def _rebuild_task_views(self) -> None:
+        """Rebuild the deadline timer and the indexes after the data was replaced."""
+        self.deadline_scheduler.async_rebuild(self.tasks.values())
+        self.task_index.rebuild(self.tasks.values(), datetime.now().date())
+        self.reward_index.rebuild(self.rewards.values())
+
+    def tasks_for_child(self, child_id: str) -> list[Task]:
+        """Return the tasks assigned to a child."""
+        return [self.tasks[task_id] for task_id in self.task_index.tasks_for_child(child_id)]
+
+    def tasks_by_frequency(self, frequency: str) -> list[Task]:
+        """Return the tasks with a frequency."""
+        return [self.tasks[task_id] for task_id in self.task_index.tasks_by_frequency(frequency)]
+
+    def count_validated_today(self, child_id: str | None = None) -> int:
+        """Return the tasks validated today by a child, or by the whole household."""
+        self.task_index.ensure_day(self.tasks.values(), datetime.now().date())
+        return self.task_index.validated_today(child_id)
+
+    def _mark_child_tasks_for_update(self, child_id: str) -> None:
+        """Update the entities of the child's tasks, which display the child's name."""
+        for task_id in self.task_index.tasks_for_child(child_id):
+            self._changes.add(("tasks", task_id))
+
+    def _collection(self, kind: str) -> dict[str, Any]:
+        """Return the in-memory collection for a snapshot kind."""
+        if kind == "children":
+            return self.children
+        if kind == "tasks":
+            return self.tasks
+        return self.rewards
+
+    def _invalidate_snapshots(self) -> None:
+        """Drop all serialized dicts, e.g. after the collections were replaced."""
+        for kind in COLLECTIONS:
+            objects = self._collection(kind)
+            for obj in objects.values():
+                self._revision += 1
+                obj.revision = self._revision
+            self._snapshots[kind] = {}
+            self._snapshot_revisions[kind] = {}
+            self._dirty[kind] = set(objects)
+        self._full_update = True
+
+    def _refresh_snapshots(self) -> None:
+        """Re-serialize the objects changed since the previous snapshot.
+        
+        Collections are copied on write so that dicts already handed out (as
+        coordinator.data or to a pending storage write) are never mutated.
+        """
+        for kind in COLLECTIONS:
+            dirty = self._dirty[kind]
+            if not dirty:
+                continue
+            objects = self._collection(kind)
+            snapshot = dict(self._snapshots[kind])
+            revisions = self._snapshot_revisions[kind]
+            for obj_id in dirty:
+                obj = objects.get(obj_id)
+                if obj is None:
+                    snapshot.pop(obj_id, None)
+                    revisions.pop(obj_id, None)
+                elif revisions.get(obj_id) != obj.revision:
+                    snapshot[obj_id] = obj.to_dict()
+                    revisions[obj_id] = obj.revision
+            self._snapshots[kind] = snapshot
+            dirty.clear()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Serialize the current state for storage."""
+        self._save_pending = False
+        self._refresh_snapshots()
+        return {
+            "children": self._snapshots["children"],
+            "tasks": self._snapshots["tasks"],
+            "rewards": self._snapshots["rewards"],
             "system": {
                 "last_daily_reset": self.last_daily_reset.isoformat() if self.last_daily_reset else None,
                 "last_weekly_reset": self.last_weekly_reset.isoformat() if self.last_weekly_reset else None,
                 "last_monthly_reset": self.last_monthly_reset.isoformat() if self.last_monthly_reset else None,
+                "journal_seq": self.journal.seq,
             }
         }
+
+    async def async_save_data(self) -> None:
+        """Schedule a write of the current state to storage.
         
-        await self.store.async_save(data)
+        Writes are coalesced: every mutation made within ``save_delay`` seconds
+        ends up in a single write, serialized when the write actually happens.
+        """
+        if self._batch_depth:
+            self._batch_save = True
+            return
+        self._save_pending = True
+        self.store.async_delay_save(self._data_to_save, self.save_delay)
+
+    async def async_flush_data(self) -> None:
+        """Write any pending changes to storage immediately."""
+        if self._save_pending:
+            await self.store.async_save(self._data_to_save())
+        await self.journal.async_flush()
+        await self.history_archive.async_flush()
+
+    @asynccontextmanager
+    async def async_batch(self) -> AsyncIterator[None]:
+        """Group mutations so they end with a single save and a single refresh.
+        
+        Saves and refreshes requested inside the block are deferred until the
+        outermost batch exits, even if it exits with an exception.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                save, refresh = self._batch_save, self._batch_refresh
+                self._batch_save = self._batch_refresh = False
+                if save:
+                    await self.async_save_data()
+                if refresh:
+                    await self.async_request_refresh()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Apply mutations atomically: one save and one refresh, rollback on error.
+        
+        Behaves like ``async_batch()``; in addition, an exception leaving the
+        block restores the children, tasks, rewards and reset dates as they
+        were when it was entered. Events, notifications and removed entities
+        are not undone.
+        """
+        state = self._capture_state()
+        async with self.async_batch():
+            try:
+                yield
+            except BaseException:
+                _LOGGER.warning("Transaction failed, restoring the previous state")
+                self._restore_state(state)
+                raise
+
+    def _capture_state(self) -> tuple[dict[str, dict[str, dict[str, Any]]], tuple[Any, ...]]:
+        """Return the current snapshots and reset dates.
+        
+        Snapshot dicts are copied on write, so keeping references is enough.
+        """
+        self._refresh_snapshots()
+        return (
+            {kind: self._snapshots[kind] for kind in COLLECTIONS},
+            (self.last_daily_reset, self.last_weekly_reset, self.last_monthly_reset),
+        )
+
+    def _restore_state(self, state: tuple[dict[str, dict[str, dict[str, Any]]], tuple[Any, ...]]) -> None:
+        """Rebuild the models from a state returned by ``_capture_state``."""
+        snapshots, reset_dates = state
+        # Models keep references to the containers they are built from
+        snapshots = copy.deepcopy(snapshots)
+        self.children = {
+            child_id: Child.from_dict(data) for child_id, data in snapshots["children"].items()
+        }
+        self.tasks = {task_id: Task.from_dict(data) for task_id, data in snapshots["tasks"].items()}
+        self.rewards = {
+            reward_id: Reward.from_dict(data) for reward_id, data in snapshots["rewards"].items()
+        }
+        self.last_daily_reset, self.last_weekly_reset, self.last_monthly_reset = reset_dates
+        # Compensating entries bring the journal back to the restored values
+        self.journal.record_all(self.children, self.tasks)
+        self._invalidate_snapshots()
+        self._rebuild_task_views()
+        # Persist and publish the restored state when the batch ends
+        self._batch_save = self._batch_refresh = True
 
     # Child management methods
     async def async_add_child(self, child: Child) -> None:
         """Add a new child."""
         self.children[child.id] = child
+        self.async_mark_changed(children=[child.id])
         await self.async_save_data()
         await self.async_request_refresh()
         
@@ -370,27 +769,34 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             for key, value in updates.items():
                 if hasattr(child, key):
                     setattr(child, key, value)
+            self.async_mark_changed(children=[child_id])
+            if "name" in updates:
+                self._mark_child_tasks_for_update(child_id)
             await self.async_save_data()
             await self.async_request_refresh()
 
     async def async_remove_child(self, child_id: str, force_remove_entities: bool = False) -> None:
         """Remove a child and optionally force remove their entities."""
         if child_id in self.children:
+            # The child's entity unique_ids are built from its name
+            from .sensor import get_safe_child_name
+            safe_child_name = get_safe_child_name(self, child_id)
+            
             # Remove child data
             del self.children[child_id]
             
             # Remove tasks assigned to this child
-            tasks_to_remove = [task_id for task_id, task in self.tasks.items() 
-                             if child_id in task.assigned_child_ids]
+            tasks_to_remove = self.task_index.tasks_for_child(child_id)
             for task_id in tasks_to_remove:
                 del self.tasks[task_id]
             
+            self.async_mark_changed(children=[child_id], tasks=tasks_to_remove)
             await self.async_save_data()
             await self.async_request_refresh()
             
             # Force remove entities if requested
             if force_remove_entities:
-                await self._async_force_remove_child_entities(child_id)
+                await self._async_force_remove_child_entities(child_id, safe_child_name)
 
     # Task management methods
     async def async_add_task(self, task: Task) -> None:
@@ -398,6 +804,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         try:
             _LOGGER.info("Adding task to coordinator: %s", task.name)
             self.tasks[task.id] = task
+            self.async_mark_changed(tasks=[task.id])
             _LOGGER.info("Task added to memory, saving data...")
             await self.async_save_data()
             _LOGGER.info("Data saved, requesting refresh...")
@@ -427,29 +834,22 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         if task_id in self.tasks:
             # Remove task data
             del self.tasks[task_id]
+            self.async_mark_changed(tasks=[task_id])
             
             # Remove task entities from registry
             try:
-                from homeassistant.helpers import entity_registry
-                er = entity_registry.async_get(self.hass)
-                
-                # Find all entities related to this task
-                entities_to_remove = []
-                safe_task_id = task_id.replace("-", "_")
-                
-                for entity_id, entity_entry in er.entities.items():
-                    # Look for task sensor entities
-                    if (entity_id.startswith(f'sensor.kidtasks_task_{safe_task_id}') and
-                        entity_entry.config_entry_id and 
-                        entity_entry.config_entry_id in self.hass.data.get(DOMAIN, {})):
-                        entities_to_remove.append(entity_id)
-                
-                # Remove the entities
-                for entity_id in entities_to_remove:
-                    er.async_remove(entity_id)
-                    _LOGGER.info("Removed task entity: %s", entity_id)
-                
-                _LOGGER.info("Removed %d entities for task %s", len(entities_to_remove), task_id)
+                removed = self._async_remove_object_entities(
+                    "tasks",
+                    task_id,
+                    {
+                        f"kidtasks_task_{task_id}",
+                        f"{DOMAIN}_complete_{task_id}",
+                        f"{DOMAIN}_validate_{task_id}",
+                        f"{DOMAIN}_points_{task_id}",
+                        f"{DOMAIN}_status_{task_id}",
+                    },
+                )
+                _LOGGER.info("Removed %d entities for task %s", removed, task_id)
                 
             except Exception as e:
                 _LOGGER.error("Failed to remove task entities for task %s: %s", task_id, e)
@@ -533,6 +933,8 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                         }
                     )
         
+        # After the award: the journal records the child's balance as marked
+        self.async_mark_changed(children=[child_id], tasks=[task_id])
         await self.async_save_data()
         await self.async_request_refresh()
         return True
@@ -545,75 +947,91 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("DEBUG VALIDATION: Task %s not found", task_id)
             return False
         
+        validated_any = self._validate_pending_children(task_id)
+        
+        if validated_any:
+            await self.async_save_data()
+            await self.async_request_refresh()
+        
+        return validated_any
+
+    async def async_validate_all_pending(self) -> int:
+        """Validate every pending (task, child) pair, oldest completion first.
+        
+        Returns the number of validations performed.
+        """
+        validated_count = 0
+        for task_id in dict.fromkeys(
+            task_id for _, task_id, _ in self.task_index.pending_validations()
+        ):
+            validated_count += self._validate_pending_children(task_id)
+        
+        if validated_count:
+            _LOGGER.info("Validated %d pending task completions", validated_count)
+            await self.async_save_data()
+            await self.async_request_refresh()
+        
+        return validated_count
+
+    def _validate_pending_children(self, task_id: str) -> int:
+        """Validate a task for its children awaiting validation and award them.
+        
+        Saving and refreshing are left to the caller. Returns the number of
+        children validated.
+        """
         task = self.tasks[task_id]
-        validated_any = False
+        validated_count = 0
         
-        _LOGGER.info("DEBUG VALIDATION: Task %s has child_statuses: %s", task_id, list(task.child_statuses.keys()))
         _LOGGER.info("DEBUG VALIDATION: Global task status: %s", task.status)
         
-        # Use new system with individual child statuses only
-        for child_id, child_status in task.child_statuses.items():
-            _LOGGER.info("DEBUG VALIDATION: Child %s has status: %s", child_id, child_status.status)
-            if child_status.status == "pending_validation":
-                _LOGGER.info("DEBUG VALIDATION: Validating for child %s", child_id)
-                if task.validate_for_child(child_id):
-                    validated_any = True
-                    _LOGGER.info("DEBUG VALIDATION: Successfully validated for child %s", child_id)
+        # Only the children listed in the pending-validation index
+        for child_id in self.task_index.pending_children(task_id):
+            _LOGGER.info("DEBUG VALIDATION: Validating for child %s", child_id)
+            if task.validate_for_child(child_id):
+                validated_count += 1
+                _LOGGER.info("DEBUG VALIDATION: Successfully validated for child %s", child_id)
+                
+                # Award points and coins to the child who completed the task
+                child = self.children.get(child_id)
+                if child:
+                    # Add points with tracking
+                    level_up = False
+                    if task.points > 0:
+                        level_up = child.add_points(
+                            task.points,
+                            description=f"Tâche '{task.name}' validée",
+                            action_type="task_validated",
+                            related_entity_id=task.id,
+                            related_entity_name=task.name
+                        )
+                    # Add coins (no tracking for coins yet)
+                    if task.coins > 0:
+                        child.add_coins(task.coins)
                     
-                    # Award points and coins to the child who completed the task
-                    child = self.children.get(child_id)
-                    if child:
-                        # Add points with tracking
-                        level_up = False
-                        if task.points > 0:
-                            level_up = child.add_points(
-                                task.points,
-                                description=f"Tâche '{task.name}' validée",
-                                action_type="task_validated",
-                                related_entity_id=task.id,
-                                related_entity_name=task.name
-                            )
-                        # Add coins (no tracking for coins yet)
-                        if task.coins > 0:
-                            child.add_coins(task.coins)
-                        
-                        # Fire events
+                    # Fire events
+                    self.hass.bus.async_fire(
+                        f"{DOMAIN}_task_validated",
+                        {
+                            "task_id": task_id,
+                            "child_id": child.id,
+                            "points_awarded": task.points,
+                            "coins_awarded": task.coins,
+                        }
+                    )
+                    
+                    if level_up:
                         self.hass.bus.async_fire(
-                            f"{DOMAIN}_task_validated",
+                            f"{DOMAIN}_level_up",
                             {
-                                "task_id": task_id,
                                 "child_id": child.id,
-                                "points_awarded": task.points,
-                                "coins_awarded": task.coins,
+                                "new_level": child.level,
                             }
                         )
-                        
-                        if level_up:
-                            self.hass.bus.async_fire(
-                                f"{DOMAIN}_level_up",
-                                {
-                                    "child_id": child.id,
-                                    "new_level": child.level,
-                                }
-                            )
-        
-        if validated_any:
-            # Clear any persistent notification for this task
-            try:
-                await self.hass.services.async_call(
-                    "persistent_notification",
-                    "dismiss",
-                    {
-                        "notification_id": f"kids_tasks_validation_{task_id}",
-                    }
-                )
-            except Exception as e:
-                _LOGGER.debug("Could not dismiss notification (may not exist): %s", e)
-            
-            await self.async_save_data()
-            await self.async_request_refresh()
+                
+                # After the award: the journal records the child's balance as marked
+                self.async_mark_changed(children=[child_id], tasks=[task_id])
         
-        return validated_any
+        return validated_count
 
     # Reward management methods
     async def async_add_reward(self, reward: Reward) -> None:
@@ -621,6 +1039,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         try:
             _LOGGER.info("Adding reward to coordinator: %s", reward.name)
             self.rewards[reward.id] = reward
+            self.async_mark_changed(rewards=[reward.id])
             _LOGGER.info("Reward added to memory, saving data...")
             await self.async_save_data()
             _LOGGER.info("Data saved, requesting refresh...")
@@ -649,29 +1068,14 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         if reward_id in self.rewards:
             # Remove reward data
             del self.rewards[reward_id]
+            self.async_mark_changed(rewards=[reward_id])
             
             # Remove reward entities from registry
             try:
-                from homeassistant.helpers import entity_registry
-                er = entity_registry.async_get(self.hass)
-                
-                # Find all entities related to this reward
-                entities_to_remove = []
-                safe_reward_id = reward_id.replace("-", "_")
-                
-                for entity_id, entity_entry in er.entities.items():
-                    # Look for reward sensor entities
-                    if (entity_id.startswith(f'sensor.kidtasks_reward_{safe_reward_id}') and
-                        entity_entry.config_entry_id and 
-                        entity_entry.config_entry_id in self.hass.data.get(DOMAIN, {})):
-                        entities_to_remove.append(entity_id)
-                
-                # Remove the entities
-                for entity_id in entities_to_remove:
-                    er.async_remove(entity_id)
-                    _LOGGER.info("Removed reward entity: %s", entity_id)
-                
-                _LOGGER.info("Removed %d entities for reward %s", len(entities_to_remove), reward_id)
+                removed = self._async_remove_object_entities(
+                    "rewards", reward_id, {f"kidtasks_reward_{reward_id}"}
+                )
+                _LOGGER.info("Removed %d entities for reward %s", removed, reward_id)
                 
             except Exception as e:
                 _LOGGER.error("Failed to remove reward entities for reward %s: %s", reward_id, e)
@@ -712,6 +1116,9 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             if reward.coin_cost > 0:
                 child.coins -= reward.coin_cost
         
+        self.journal.record_claim(reward, child_id)
+        self.async_mark_changed(children=[child_id], rewards=[reward_id])
+        
         # Fire event
         self.hass.bus.async_fire(
             f"{DOMAIN}_reward_claimed",
@@ -744,6 +1151,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         success = child.activate_cosmetic(cosmetic_type, reward_id)
         
         if success:
+            self.async_mark_changed(children=[child_id])
             await self.async_save_data()
             await self.async_request_refresh()
         
@@ -751,6 +1159,9 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_request_refresh(self) -> None:
         """Request a data refresh."""
+        if self._batch_depth:
+            self._batch_refresh = True
+            return
         try:
             refresh_result = self.async_refresh()
             if refresh_result is not None:
@@ -766,6 +1177,10 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         self.children.clear()
         self.tasks.clear() 
         self.rewards.clear()
+        self.journal.rebase(self.children.values(), self.tasks.values())
+        self._invalidate_snapshots()
+        self._rebuild_task_views()
+        await self.history_archive.async_clear()
         
         await self.async_save_data()
         
@@ -786,6 +1201,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         
         # Use the task's reset method to properly reset all child statuses
         task.reset()
+        self.async_mark_changed(tasks=[task_id])
         
         await self.async_save_data()
         await self.async_request_refresh()
@@ -816,6 +1232,8 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         if coins != 0:
             child.add_coins(coins)
         
+        self.async_mark_changed(children=[child_id])
+        
         # Check for level up
         if level_up:
             self.hass.bus.async_fire(
@@ -846,6 +1264,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             description=f"Retrait manuel de {points} points",
             action_type="manual_adjustment"
         )
+        self.async_mark_changed(children=[child_id])
         
         await self.async_save_data()
         await self.async_request_refresh()
@@ -860,6 +1279,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         success = child.remove_coins(coins)
         
         if success:
+            self.async_mark_changed(children=[child_id])
             await self.async_save_data()
             await self.async_request_refresh()
         
@@ -879,6 +1299,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             description=description or f"Points définis à {points}",
             action_type="set_value"
         )
+        self.async_mark_changed(children=[child_id])
         
         # Fire level up event if needed
         if level_up:
@@ -904,6 +1325,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         
         child = self.children[child_id]
         child.set_coins(coins)
+        self.async_mark_changed(children=[child_id])
         
         await self.async_save_data()
         await self.async_request_refresh()
@@ -923,6 +1345,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             description=description or f"Niveau défini à {level}",
             action_type="set_level"
         )
+        self.async_mark_changed(children=[child_id])
         
         # Fire level change event (could be up or down)
         if child.level != old_level:
@@ -951,6 +1374,9 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         for key, value in updates.items():
             if hasattr(child, key):
                 setattr(child, key, value)
+        self.async_mark_changed(children=[child_id])
+        if "name" in updates:
+            self._mark_child_tasks_for_update(child_id)
         
         await self.async_save_data()
         await self.async_request_refresh()
@@ -976,6 +1402,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                 if child_id not in task.child_statuses:
                     task.child_statuses[child_id] = TaskChildStatus(child_id=child_id)
         
+        self.async_mark_changed(tasks=[task_id])
         await self.async_save_data()
         await self.async_request_refresh()
         return True
@@ -987,6 +1414,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         
         task = self.tasks[task_id]
         task.suspend(until_date)
+        self.async_mark_changed(tasks=[task_id])
         
         await self.async_save_data()
         await self.async_request_refresh()
@@ -999,6 +1427,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         
         task = self.tasks[task_id]
         task.resume()
+        self.async_mark_changed(tasks=[task_id])
         
         await self.async_save_data()
         await self.async_request_refresh()
@@ -1013,6 +1442,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         for key, value in updates.items():
             if hasattr(reward, key):
                 setattr(reward, key, value)
+        self.async_mark_changed(rewards=[reward_id])
         
         await self.async_save_data()
         await self.async_request_refresh()
@@ -1021,188 +1451,191 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
     async def async_reset_all_daily_tasks(self) -> None:
         """Reset all daily tasks to todo status and deduct points for uncompleted recurring tasks."""
         
-        for task in self.tasks.values():
-            if task.frequency == "daily":
-                        
-                # Vérifier chaque enfant assigné pour appliquer des pénalités
-                assigned_children = task.get_assigned_child_ids()
-                for child_id in assigned_children:
-                    if child_id in self.children:
-                        child = self.children[child_id]
-                        child_status = task.get_status_for_child(child_id)
+        for task in self.tasks_by_frequency("daily"):
+                    
+            # Vérifier chaque enfant assigné pour appliquer des pénalités
+            assigned_children = task.get_assigned_child_ids()
+            for child_id in assigned_children:
+                if child_id in self.children:
+                    child = self.children[child_id]
+                    child_status = task.get_status_for_child(child_id)
+                    
+                    # Si l'enfant n'a pas validé la tâche, appliquer une pénalité
+                    if child_status != "validated":
+                        # Pour reset manuel: utiliser penalty_points si défini, sinon moitié des points (minimum 1)
+                        penalty_points = task.penalty_points if task.penalty_points > 0 else max(1, task.points // 2)
+                        old_points = child.points
+                        old_level = child.level
                         
-                        # Si l'enfant n'a pas validé la tâche, appliquer une pénalité
-                        if child_status != "validated":
-                            # Pour reset manuel: utiliser penalty_points si défini, sinon moitié des points (minimum 1)
-                            penalty_points = task.penalty_points if task.penalty_points > 0 else max(1, task.points // 2)
-                            old_points = child.points
-                            old_level = child.level
-                            
-                            # Apply penalty with tracking
-                            if penalty_points > 0:
-                                child.add_points(
-                                    -penalty_points,
-                                    description=f"Reset manuel quotidien - Tâche '{task.name}' non terminée",
-                                    action_type="task_penalty",
-                                    related_entity_id=task.id,
-                                    related_entity_name=task.name
-                                )
-                            
-                            # Marquer la pénalité dans le statut de l'enfant
-                            if child_id in task.child_statuses:
-                                task.child_statuses[child_id].penalty_applied = True
-                                task.child_statuses[child_id].penalty_applied_at = datetime.now()
-                            
-                            
-                            # Envoyer un événement pour la pénalité
-                            self.hass.bus.async_fire(
-                                "kids_tasks_penalty_applied",
-                                {
-                                    "task_id": task.id,
-                                    "task_name": task.name,
-                                    "child_id": child_id,
-                                    "child_name": child.name,
-                                    "penalty_points": penalty_points,
-                                    "old_points": old_points,
-                                    "new_points": child.points,
-                                    "old_level": old_level,
-                                    "new_level": child.level,
-                                    "frequency": "daily",
-                                    "reset_type": "manual"
-                                },
+                        # Apply penalty with tracking
+                        if penalty_points > 0:
+                            child.add_points(
+                                -penalty_points,
+                                description=f"Reset manuel quotidien - Tâche '{task.name}' non terminée",
+                                action_type="task_penalty",
+                                related_entity_id=task.id,
+                                related_entity_name=task.name
                             )
-                
-                # Utiliser la méthode reset() du modèle pour remettre la tâche à zéro
-                task.reset()
-        
+                        
+                        # Marquer la pénalité dans le statut de l'enfant
+                        if child_id in task.child_statuses:
+                            task.child_statuses[child_id].penalty_applied = True
+                            task.child_statuses[child_id].penalty_applied_at = datetime.now()
+                        self.async_mark_changed(children=[child_id])
+                        
+                        
+                        # Envoyer un événement pour la pénalité
+                        self.hass.bus.async_fire(
+                            "kids_tasks_penalty_applied",
+                            {
+                                "task_id": task.id,
+                                "task_name": task.name,
+                                "child_id": child_id,
+                                "child_name": child.name,
+                                "penalty_points": penalty_points,
+                                "old_points": old_points,
+                                "new_points": child.points,
+                                "old_level": old_level,
+                                "new_level": child.level,
+                                "frequency": "daily",
+                                "reset_type": "manual"
+                            },
+                        )
+            
+            # Utiliser la méthode reset() du modèle pour remettre la tâche à zéro
+            task.reset()
+            self.async_mark_changed(tasks=[task.id])
+    
         await self.async_save_data()
         await self.async_request_refresh()
 
     async def async_reset_all_weekly_tasks(self) -> None:
         """Reset all weekly tasks to todo status and deduct points for uncompleted tasks."""
         
-        for task in self.tasks.values():
-            if task.frequency == "weekly":
-                _LOGGER.debug(f"Resetting weekly task: {task.name} (ID: {task.id})")
-                
-                # Vérifier chaque enfant assigné pour appliquer des pénalités
-                assigned_children = task.get_assigned_child_ids()
-                for child_id in assigned_children:
-                    if child_id in self.children:
-                        child = self.children[child_id]
-                        child_status = task.get_status_for_child(child_id)
+        for task in self.tasks_by_frequency("weekly"):
+            _LOGGER.debug(f"Resetting weekly task: {task.name} (ID: {task.id})")
+            
+            # Vérifier chaque enfant assigné pour appliquer des pénalités
+            assigned_children = task.get_assigned_child_ids()
+            for child_id in assigned_children:
+                if child_id in self.children:
+                    child = self.children[child_id]
+                    child_status = task.get_status_for_child(child_id)
+                    
+                    # Si l'enfant n'a pas validé la tâche, appliquer une pénalité
+                    if child_status != "validated":
+                        # Pour reset manuel: utiliser penalty_points si défini, sinon moitié des points (minimum 1)
+                        penalty_points = task.penalty_points if task.penalty_points > 0 else max(1, task.points // 2)
+                        old_points = child.points
+                        old_level = child.level
                         
-                        # Si l'enfant n'a pas validé la tâche, appliquer une pénalité
-                        if child_status != "validated":
-                            # Pour reset manuel: utiliser penalty_points si défini, sinon moitié des points (minimum 1)
-                            penalty_points = task.penalty_points if task.penalty_points > 0 else max(1, task.points // 2)
-                            old_points = child.points
-                            old_level = child.level
-                            
-                            # Apply penalty with tracking
-                            if penalty_points > 0:
-                                child.add_points(
-                                    -penalty_points,
-                                    description=f"Reset manuel hebdomadaire - Tâche '{task.name}' non terminée",
-                                    action_type="task_penalty",
-                                    related_entity_id=task.id,
-                                    related_entity_name=task.name
-                                )
-                            
-                            # Marquer la pénalité dans le statut de l'enfant
-                            if child_id in task.child_statuses:
-                                task.child_statuses[child_id].penalty_applied = True
-                                task.child_statuses[child_id].penalty_applied_at = datetime.now()
-                            
-                            
-                            # Envoyer un événement pour la pénalité
-                            self.hass.bus.async_fire(
-                                "kids_tasks_penalty_applied",
-                                {
-                                    "task_id": task.id,
-                                    "task_name": task.name,
-                                    "child_id": child_id,
-                                    "child_name": child.name,
-                                    "penalty_points": penalty_points,
-                                    "old_points": old_points,
-                                    "new_points": child.points,
-                                    "old_level": old_level,
-                                    "new_level": child.level,
-                                    "frequency": "weekly",
-                                    "reset_type": "manual"
-                                },
+                        # Apply penalty with tracking
+                        if penalty_points > 0:
+                            child.add_points(
+                                -penalty_points,
+                                description=f"Reset manuel hebdomadaire - Tâche '{task.name}' non terminée",
+                                action_type="task_penalty",
+                                related_entity_id=task.id,
+                                related_entity_name=task.name
                             )
-                
-                # Utiliser la méthode reset() du modèle pour remettre la tâche à zéro
-                task.reset()
-        
+                        
+                        # Marquer la pénalité dans le statut de l'enfant
+                        if child_id in task.child_statuses:
+                            task.child_statuses[child_id].penalty_applied = True
+                            task.child_statuses[child_id].penalty_applied_at = datetime.now()
+                        self.async_mark_changed(children=[child_id])
+                        
+                        
+                        # Envoyer un événement pour la pénalité
+                        self.hass.bus.async_fire(
+                            "kids_tasks_penalty_applied",
+                            {
+                                "task_id": task.id,
+                                "task_name": task.name,
+                                "child_id": child_id,
+                                "child_name": child.name,
+                                "penalty_points": penalty_points,
+                                "old_points": old_points,
+                                "new_points": child.points,
+                                "old_level": old_level,
+                                "new_level": child.level,
+                                "frequency": "weekly",
+                                "reset_type": "manual"
+                            },
+                        )
+            
+            # Utiliser la méthode reset() du modèle pour remettre la tâche à zéro
+            task.reset()
+            self.async_mark_changed(tasks=[task.id])
+    
         await self.async_save_data()
         await self.async_request_refresh()
 
     async def async_reset_all_monthly_tasks(self) -> None:
         """Reset all monthly tasks to todo status and deduct points for uncompleted tasks."""
         
-        for task in self.tasks.values():
-            if task.frequency == "monthly":
-                _LOGGER.debug(f"Resetting monthly task: {task.name} (ID: {task.id})")
-                
-                # Vérifier chaque enfant assigné pour appliquer des pénalités
-                assigned_children = task.get_assigned_child_ids()
-                for child_id in assigned_children:
-                    if child_id in self.children:
-                        child = self.children[child_id]
-                        child_status = task.get_status_for_child(child_id)
+        for task in self.tasks_by_frequency("monthly"):
+            _LOGGER.debug(f"Resetting monthly task: {task.name} (ID: {task.id})")
+            
+            # Vérifier chaque enfant assigné pour appliquer des pénalités
+            assigned_children = task.get_assigned_child_ids()
+            for child_id in assigned_children:
+                if child_id in self.children:
+                    child = self.children[child_id]
+                    child_status = task.get_status_for_child(child_id)
+                    
+                    # Si l'enfant n'a pas validé la tâche, appliquer une pénalité
+                    if child_status != "validated":
+                        # Pour reset manuel: utiliser penalty_points si défini, sinon moitié des points (minimum 1)
+                        penalty_points = task.penalty_points if task.penalty_points > 0 else max(1, task.points // 2)
+                        old_points = child.points
+                        old_level = child.level
                         
-                        # Si l'enfant n'a pas validé la tâche, appliquer une pénalité
-                        if child_status != "validated":
-                            # Pour reset manuel: utiliser penalty_points si défini, sinon moitié des points (minimum 1)
-                            penalty_points = task.penalty_points if task.penalty_points > 0 else max(1, task.points // 2)
-                            old_points = child.points
-                            old_level = child.level
-                            
-                            # Apply penalty with tracking
-                            if penalty_points > 0:
-                                child.add_points(
-                                    -penalty_points,
-                                    description=f"Reset manuel mensuel - Tâche '{task.name}' non terminée",
-                                    action_type="task_penalty",
-                                    related_entity_id=task.id,
-                                    related_entity_name=task.name
-                                )
-                            
-                            # Marquer la pénalité dans le statut de l'enfant
-                            if child_id in task.child_statuses:
-                                task.child_statuses[child_id].penalty_applied = True
-                                task.child_statuses[child_id].penalty_applied_at = datetime.now()
-                            
-                            
-                            # Envoyer un événement pour la pénalité
-                            self.hass.bus.async_fire(
-                                "kids_tasks_penalty_applied",
-                                {
-                                    "task_id": task.id,
-                                    "task_name": task.name,
-                                    "child_id": child_id,
-                                    "child_name": child.name,
-                                    "penalty_points": penalty_points,
-                                    "old_points": old_points,
-                                    "new_points": child.points,
-                                    "old_level": old_level,
-                                    "new_level": child.level,
-                                    "frequency": "monthly",
-                                    "reset_type": "manual"
-                                },
+                        # Apply penalty with tracking
+                        if penalty_points > 0:
+                            child.add_points(
+                                -penalty_points,
+                                description=f"Reset manuel mensuel - Tâche '{task.name}' non terminée",
+                                action_type="task_penalty",
+                                related_entity_id=task.id,
+                                related_entity_name=task.name
                             )
-                
-                # Utiliser la méthode reset() du modèle pour remettre la tâche à zéro
-                task.reset()
-        
+                        
+                        # Marquer la pénalité dans le statut de l'enfant
+                        if child_id in task.child_statuses:
+                            task.child_statuses[child_id].penalty_applied = True
+                            task.child_statuses[child_id].penalty_applied_at = datetime.now()
+                        self.async_mark_changed(children=[child_id])
+                        
+                        
+                        # Envoyer un événement pour la pénalité
+                        self.hass.bus.async_fire(
+                            "kids_tasks_penalty_applied",
+                            {
+                                "task_id": task.id,
+                                "task_name": task.name,
+                                "child_id": child_id,
+                                "child_name": child.name,
+                                "penalty_points": penalty_points,
+                                "old_points": old_points,
+                                "new_points": child.points,
+                                "old_level": old_level,
+                                "new_level": child.level,
+                                "frequency": "monthly",
+                                "reset_type": "manual"
+                            },
+                        )
+            
+            # Utiliser la méthode reset() du modèle pour remettre la tâche à zéro
+            task.reset()
+            self.async_mark_changed(tasks=[task.id])
+    
         await self.async_save_data()
         await self.async_request_refresh()
 
-    async def async_backup_data(self, include_history: bool = True) -> str:
-        """Create a backup of all data."""
-        import json
+    async def async_backup_data(self, include_history: bool = True, codec: str = "json") -> str:
+        """Create a backup of all data, encoded with ``codec`` in the executor."""
+        backup_codec = get_codec(codec)
         
         backup_data = {
             "version": 1,
@@ -1212,39 +1645,126 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             "rewards": {reward_id: reward.to_dict() for reward_id, reward in self.rewards.items()},
         }
         
-        return json.dumps(backup_data, indent=2)
+        return await self.hass.async_add_executor_job(backup_codec.encode, backup_data)
 
     async def async_restore_data(self, backup_json: str) -> bool:
-        """Restore data from a backup."""
-        import json
-        
+        """Restore data from a backup written by any codec."""
         try:
-            backup_data = json.loads(backup_json)
-            
-            # Clear existing data
-            self.children.clear()
-            self.tasks.clear()
-            self.rewards.clear()
-            
-            # Restore children
-            for child_id, child_data in backup_data.get("children", {}).items():
-                self.children[child_id] = Child.from_dict(child_data)
-            
-            # Restore tasks
-            for task_id, task_data in backup_data.get("tasks", {}).items():
-                self.tasks[task_id] = Task.from_dict(task_data)
-            
-            # Restore rewards
-            for reward_id, reward_data in backup_data.get("rewards", {}).items():
-                self.rewards[reward_id] = Reward.from_dict(reward_data)
-            
-            await self.async_save_data()
-            await self.async_request_refresh()
+            backup_data = await self.hass.async_add_executor_job(decode_payload, backup_json)
+            await self._async_replace_data(
+                {child_id: Child.from_dict(child_data) for child_id, child_data in backup_data.get("children", {}).items()},
+                {task_id: Task.from_dict(task_data) for task_id, task_data in backup_data.get("tasks", {}).items()},
+                {reward_id: Reward.from_dict(reward_data) for reward_id, reward_data in backup_data.get("rewards", {}).items()},
+            )
             return True
             
         except Exception as e:
             _LOGGER.error("Failed to restore backup: %s", e)
             return False
+
+    async def async_backup_to_file(
+        self,
+        include_history: bool = True,
+        codec: str = "json",
+        filename: str | None = None,
+        base: str | None = None,
+    ) -> dict[str, Any]:
+        """Stream a gzip-compressed backup to a file in the executor.
+        
+        Writes the current (copy-on-write) snapshots, so the data is not copied
+        and the loop is not blocked while the file is written. With ``base``
+        (a previous backup file), only the objects changed since are written.
+        Object hashes are cached by revision, so unchanged objects are not
+        serialized again to be compared.
+        """
+        backup_codec = get_codec(codec)
+        started = time.monotonic()
+        self._refresh_snapshots()
+        collections = {kind: self._snapshots[kind] for kind in COLLECTIONS}
+        revisions = {kind: dict(self._snapshot_revisions[kind]) for kind in COLLECTIONS}
+        hash_cache = self._backup_hashes
+        now = datetime.now()
+        header = {"version": 1, "timestamp": now.isoformat()}
+        filename = filename or f"{DOMAIN}_{now:%Y%m%d_%H%M%S}{'_delta' if base else ''}.jsonl.gz"
+        
+        def write() -> tuple[str, dict[str, Any], dict[str, Any], int]:
+            path = resolve_backup_path(self.hass, filename)
+            base_path = resolve_backup_path(self.hass, base) if base else None
+            hashes = hash_objects(collections, include_history, revisions, hash_cache)
+            result = write_backup(
+                path, backup_codec, header, collections, include_history, hashes, base_path
+            )
+            return path, hashes, result, os.path.getsize(path)
+        
+        path, self._backup_hashes, result, compressed_size = await self.hass.async_add_executor_job(write)
+        written = result["header"]
+        duration = time.monotonic() - started
+        _LOGGER.info("Backup written to %s (%d bytes) in %.2fs", path, compressed_size, duration)
+        return {
+            "path": path,
+            "type": written["type"],
+            "backup_id": written["backup_id"],
+            "base_backup_id": written.get("base", {}).get("backup_id"),
+            "format": codec,
+            "size": compressed_size,
+            "uncompressed_size": result["size"],
+            "duration_ms": round(duration * 1000, 1),
+            **{kind: len(objects) for kind, objects in collections.items()},
+            "written": {kind: len(kind_hashes) for kind, kind_hashes in written["hashes"].items()},
+            "deleted": {kind: len(obj_ids) for kind, obj_ids in written.get("deleted", {}).items()},
+        }
+
+    async def async_restore_from_file(self, path: str) -> dict[str, Any]:
+        """Restore data from a backup file, parsed in the executor.
+        
+        A differential backup is applied on top of its chain of bases, and the
+        result is checked against the object hashes of the backup. The current
+        data is only replaced once everything was read and checked.
+        """
+        started = time.monotonic()
+        
+        def read() -> tuple[str, int, dict[str, Any], dict[str, dict[str, Any]], int]:
+            full_path = resolve_backup_path(self.hass, path)
+            header, models, files = read_backup(full_path)
+            return full_path, sum(os.path.getsize(file) for file in files), header, models, len(files)
+        
+        full_path, size, header, models, files = await self.hass.async_add_executor_job(read)
+        await self._async_replace_data(models["children"], models["tasks"], models["rewards"])
+        duration = time.monotonic() - started
+        _LOGGER.info("Backup restored from %s (%d files) in %.2fs", full_path, files, duration)
+        return {
+            "path": full_path,
+            "type": header.get("type", "full"),
+            "backup_id": header.get("backup_id"),
+            "format": header.get("codec", "json"),
+            "backup_timestamp": header.get("timestamp"),
+            "files": files,
+            "verified": "hashes" in header,
+            "size": size,
+            "duration_ms": round(duration * 1000, 1),
+            **{kind: len(objects) for kind, objects in models.items()},
+        }
+
+    async def _async_replace_data(
+        self,
+        children: dict[str, Child],
+        tasks: dict[str, Task],
+        rewards: dict[str, Reward],
+    ) -> None:
+        """Replace every child, task and reward, then save and refresh."""
+        self.children.clear()
+        self.children.update(children)
+        self.tasks.clear()
+        self.tasks.update(tasks)
+        self.rewards.clear()
+        self.rewards.update(rewards)
+        
+        self.journal.rebase(self.children.values(), self.tasks.values())
+        self._invalidate_snapshots()
+        self._rebuild_task_views()
+        
+        await self.async_save_data()
+        await self.async_request_refresh()
     
     async def _send_validation_notification(self, task, child) -> None:
         """Send a Home Assistant notification for task validation."""
@@ -1278,69 +1798,84 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as e:
             _LOGGER.error("Failed to send validation notification: %s", e)
     
+    async def _async_dismiss_validation_notification(self, task_id: str) -> None:
+        """Dismiss the validation notification of a task."""
+        try:
+            await self.hass.services.async_call(
+                "persistent_notification",
+                "dismiss",
+                {
+                    "notification_id": f"kids_tasks_validation_{task_id}",
+                }
+            )
+        except Exception as e:
+            _LOGGER.debug("Could not dismiss notification (may not exist): %s", e)
+    
     # Removed heavy reload methods - now using events for better performance
 
-    async def _async_force_remove_child_entities(self, child_id: str) -> None:
+    async def _async_force_remove_child_entities(self, child_id: str, safe_child_name: str) -> None:
         """Force remove all entities associated with a child."""
         try:
-            from homeassistant.helpers import entity_registry
-            
-            # Get entity registry
-            er = entity_registry.async_get(self.hass)
-            
-            # Find all entities related to this child
-            entities_to_remove = []
-            
-            for entity_id, entity_entry in er.entities.items():
-                # Check if entity belongs to our domain and is related to this child
-                if (entity_entry.domain == DOMAIN and 
-                    entity_entry.unique_id and 
-                    child_id in entity_entry.unique_id):
-                    entities_to_remove.append(entity_id)
-            
-            # Remove the entities
-            for entity_id in entities_to_remove:
-                er.async_remove(entity_id)
-                
-            _LOGGER.info("Force removed %d entities for child %s", len(entities_to_remove), child_id)
+            removed = self._async_remove_object_entities(
+                "children",
+                child_id,
+                {
+                    f"kidtasks_{safe_child_name}_{suffix}"
+                    for suffix in ("points", "level", "tasks_today", "points_history")
+                },
+            )
+            _LOGGER.info("Force removed %d entities for child %s", removed, child_id)
             
         except Exception as e:
             _LOGGER.error("Failed to force remove entities for child %s: %s", child_id, e)
 
+    @callback
+    def async_register_entity(self, context: tuple[str, str], entity_id: str) -> None:
+        """Record an added entity under the object it shows."""
+        self._entity_ids.setdefault(context, set()).add(entity_id)
+
+    @callback
+    def async_unregister_entity(self, context: tuple[str, str], entity_id: str) -> None:
+        """Forget an entity being removed."""
+        entity_ids = self._entity_ids.get(context)
+        if entity_ids is not None:
+            entity_ids.discard(entity_id)
+            if not entity_ids:
+                del self._entity_ids[context]
+
+    @callback
+    def _async_remove_object_entities(self, kind: str, obj_id: str, unique_ids: set[str]) -> int:
+        """Remove the registry entries of a child, task or reward.
+        
+        Uses the entities registered by KidsTasksEntity, plus this config
+        entry's registry entries with one of the object's ``unique_ids`` (for
+        entities not added in this session). Returns how many were removed.
+        """
+        from homeassistant.helpers import entity_registry
+        
+        er = entity_registry.async_get(self.hass)
+        entities_to_remove = set(self._entity_ids.pop((kind, obj_id), ()))
+        if self.config_entry_id:
+            entities_to_remove.update(
+                entity_entry.entity_id
+                for entity_entry in entity_registry.async_entries_for_config_entry(er, self.config_entry_id)
+                if entity_entry.unique_id in unique_ids
+            )
+        
+        removed = 0
+        for entity_id in entities_to_remove:
+            if er.async_get(entity_id) is not None:
+                er.async_remove(entity_id)
+                removed += 1
+                _LOGGER.info("Removed entity: %s", entity_id)
+        
+        return removed
+
     # Cosmetic system methods
     async def async_load_cosmetics_catalog(self) -> dict:
-        """Load cosmetics catalog from files."""
-        import os
-        import json
-        
+        """Load cosmetics catalog from files (cached until a file changes)."""
         try:
-            # Define cosmetics directory path
-            cosmetics_dir = os.path.join(self.hass.config.config_dir, "custom_components", "kids_tasks", "cosmetics")
-            
-            catalog = {
-                "avatars": [],
-                "backgrounds": [],
-                "outfits": [],
-                "themes": []
-            }
-            
-            # Load each cosmetic type
-            for cosmetic_type in catalog.keys():
-                type_dir = os.path.join(cosmetics_dir, cosmetic_type)
-                if os.path.exists(type_dir):
-                    # Load catalog.json for this type
-                    catalog_file = os.path.join(type_dir, "catalog.json")
-                    if os.path.exists(catalog_file):
-                        # Use async file reading to avoid blocking the event loop
-                        import asyncio
-                        def read_catalog_file(file_path):
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                return json.load(f)
-                        
-                        # Execute file reading in thread pool to avoid blocking
-                        type_catalog = await self.hass.async_add_executor_job(read_catalog_file, catalog_file)
-                        catalog[cosmetic_type] = type_catalog.get("items", [])
-                        _LOGGER.info("Loaded %d %s from catalog", len(catalog[cosmetic_type]), cosmetic_type)
+            catalog = await self.cosmetics_catalog.async_load()
             
             # Fire event with loaded catalog
             self.hass.bus.async_fire(
@@ -1366,6 +1901,13 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         
         child = self.children[child_id]
         
+        # A cosmetic of the catalog can only be activated as its own type
+        await self.cosmetics_catalog.async_load()
+        catalog_item = self.cosmetics_catalog.get_item(cosmetic_id)
+        if catalog_item is not None and catalog_item[0] != cosmetic_type:
+            _LOGGER.error("Cosmetic %s is of type %s, not %s", cosmetic_id, catalog_item[0], cosmetic_type)
+            return False
+        
         # Check if child owns this cosmetic (from rewards or default)
         if not self._child_owns_cosmetic(child, cosmetic_id, cosmetic_type):
             _LOGGER.error("Child %s does not own cosmetic %s of type %s", child_id, cosmetic_id, cosmetic_type)
@@ -1376,6 +1918,7 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
             child.active_cosmetics = {}
         
         child.active_cosmetics[cosmetic_type] = cosmetic_id
+        self.async_mark_changed(children=[child_id])
         
         # Fire event
         self.hass.bus.async_fire(
@@ -1413,14 +1956,29 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
         
         return False
     
-    async def async_create_cosmetic_rewards_from_catalog(self) -> int:
-        """Create cosmetic rewards from the catalog for items that don't have rewards yet."""
+    async def async_create_cosmetic_rewards_from_catalog(self, sync_existing: bool = False) -> int:
+        """Create cosmetic rewards from the catalog for items that don't have rewards yet.
+        
+        With ``sync_existing``, rewards already unlocking a catalog item get the
+        item's current cost, coin cost and rarity. Returns the number of rewards created.
+        """
         catalog = await self.async_load_cosmetics_catalog()
         created_count = 0
+        updated_count = 0
         
         from .models import Reward
         import uuid
         
+        if sync_existing:
+            # Rewards already unlocking a catalog item, found by cosmetic id
+            for reward in self.rewards.values():
+                cosmetic_id = (reward.cosmetic_data or {}).get("cosmetic_id")
+                catalog_item = self.cosmetics_catalog.get_item(cosmetic_id) if cosmetic_id else None
+                if catalog_item is None or catalog_item[1].get("unlocked_by_default", False):
+                    continue
+                if self._sync_cosmetic_reward(reward, catalog_item[1]):
+                    updated_count += 1
+        
         for cosmetic_type, items in catalog.items():
             for item in items:
                 # Skip default items
@@ -1431,17 +1989,9 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                 if not cosmetic_id:
                     continue
                 
-                # Check if a reward already exists for this cosmetic
-                existing_reward = None
-                for reward in self.rewards.values():
-                    if (reward.reward_type == "cosmetic" and 
-                        reward.cosmetic_data and 
-                        reward.cosmetic_data.get("cosmetic_id") == cosmetic_id):
-                        existing_reward = reward
-                        break
-                
-                if existing_reward:
-                    continue  # Skip if reward already exists
+                # Skip if a reward already exists for this cosmetic
+                if self.reward_index.rewards_for_cosmetic(cosmetic_id):
+                    continue
                 
                 # Create new cosmetic reward
                 reward_id = str(uuid.uuid4())
@@ -1458,15 +2008,16 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                         "type": cosmetic_type,
                         "cosmetic_id": cosmetic_id,
                         "rarity": item.get("rarity", "common"),
-                        "catalog_data": item
+                        "catalog_data": dict(item)
                     }
                 )
                 
                 self.rewards[reward_id] = reward
+                self.async_mark_changed(rewards=[reward_id])
                 created_count += 1
                 _LOGGER.info("Created cosmetic reward for %s: %s", cosmetic_type, item.get("name", cosmetic_id))
         
-        if created_count > 0:
+        if created_count > 0 or updated_count > 0:
             await self.async_save_data()
             await self.async_request_refresh()
             
@@ -1475,21 +2026,49 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                 f"{DOMAIN}_cosmetic_rewards_created",
                 {
                     "count": created_count,
+                    "updated": updated_count,
                     "catalog_items": sum(len(items) for items in catalog.values())
                 }
             )
         
-        _LOGGER.info("Created %d cosmetic rewards from catalog", created_count)
+        _LOGGER.info("Created %d and updated %d cosmetic rewards from catalog", created_count, updated_count)
         return created_count
 
+    def _sync_cosmetic_reward(self, reward: Reward, item: dict[str, Any]) -> bool:
+        """Apply the catalog cost, coin cost and rarity to a cosmetic reward."""
+        cost = item.get("cost", 100)
+        coin_cost = item.get("coin_cost", 0)
+        rarity = item.get("rarity", "common")
+        if (
+            reward.cost == cost
+            and reward.coin_cost == coin_cost
+            and reward.cosmetic_data.get("rarity") == rarity
+        ):
+            return False
+        
+        reward.cost = cost
+        reward.coin_cost = coin_cost
+        reward.cosmetic_data = {**reward.cosmetic_data, "rarity": rarity, "catalog_data": dict(item)}
+        self.async_mark_changed(rewards=[reward.id])
+        _LOGGER.info("Synced cosmetic reward %s with the catalog", reward.name)
+        return True
+
     async def async_get_child_history(
         self, 
         child_id: str, 
         limit: int = 20, 
         since_date: str | None = None, 
-        action_type: str | None = None
-    ) -> list[dict[str, Any]]:
-        """Get child points history with optional filtering."""
+        action_type: str | list[str] | None = None,
+        cursor: str | None = None,
+        until_date: str | None = None,
+    ) -> dict[str, Any]:
+        """Get a page of the child's points history, most recent first.
+        
+        Reads the in-memory history, then the monthly archive as far back as
+        needed; archived months are searched through their per-action-type
+        indexes by timestamp. Returns ``{"entries": [...], "next_cursor": ...}``;
+        pass ``next_cursor`` back to get the following page (None on the last one).
+        """
         try:
             # Verify child exists
             if child_id not in self.children:
@@ -1500,55 +2079,104 @@ class KidsTasksDataUpdateCoordinator(DataUpdateCoordinator):
                 )
                 raise ValueError(f"Child with ID {child_id} does not exist")
             
-            child = self.children[child_id]
-            points_history = child.points_history or []
+            since = _parse_history_date(since_date, "since_date")
+            until = _parse_history_date(until_date, "until_date", end_of_day=True)
+            action_types = [action_type] if isinstance(action_type, str) else action_type or None
             
-            # Apply date filter if provided
-            if since_date:
+            # Cursor: timestamp of the last returned entry and how many entries
+            # with that timestamp were returned so far
+            before, seen_at_before = None, 0
+            if cursor:
                 try:
-                    since_datetime = datetime.fromisoformat(since_date)
-                    filtered_history = []
-                    for entry in points_history:
-                        if hasattr(entry, 'timestamp') and entry.timestamp:
-                            if entry.timestamp >= since_datetime:
-                                filtered_history.append(entry)
-                    points_history = filtered_history
-                except ValueError:
-                    _LOGGER.warning("Invalid date format for since_date: %s", since_date)
+                    before_str, _, seen_str = cursor.rpartition("|")
+                    before, seen_at_before = datetime.fromisoformat(before_str), int(seen_str)
+                except ValueError as err:
+                    raise ValueError(f"Invalid history cursor: {cursor}") from err
+            upper = min((bound for bound in (until, before) if bound is not None), default=None)
             
-            # Apply action type filter if provided
-            if action_type:
-                points_history = [
-                    entry for entry in points_history 
-                    if hasattr(entry, 'action_type') and entry.action_type == action_type
-                ]
+            entries: list[tuple[datetime, dict[str, Any]]] = []
+            skipped_at_before = 0
             
-            # Limit results
-            limited_history = points_history[:limit]
+            def _accept(timestamp: datetime, entry: dict[str, Any]) -> bool:
+                """Collect an entry within the bounds; return False once the page is complete."""
+                nonlocal skipped_at_before
+                if timestamp == before and skipped_at_before < seen_at_before:
+                    skipped_at_before += 1
+                    return True
+                entries.append((timestamp, entry))
+                # One more than the page size tells whether a next page exists
+                return len(entries) <= limit
             
-            # Format for response
-            formatted_history = []
-            for entry in limited_history:
-                # Use to_dict() method if available, or access attributes directly
-                if hasattr(entry, 'to_dict'):
-                    formatted_entry = entry.to_dict()
-                else:
-                    formatted_entry = {
-                        "timestamp": entry.timestamp.isoformat() if hasattr(entry, 'timestamp') and entry.timestamp else "",
-                        "action_type": getattr(entry, 'action_type', 'unknown'),
-                        "points_delta": getattr(entry, 'points_delta', 0),
-                        "description": getattr(entry, 'description', ''),
-                        "related_entity_name": getattr(entry, 'related_entity_name', None),
-                    }
-                formatted_history.append(formatted_entry)
+            child = self.children[child_id]
+            complete = False
+            # The in-memory history holds at most 20 entries, newest first
+            for hot_entry in child.points_history:
+                timestamp = hot_entry.timestamp
+                # Unreadable timestamp: skipped, like in the archive
+                if timestamp is None:
+                    continue
+                if upper is not None and timestamp > upper:
+                    continue
+                if since is not None and timestamp < since:
+                    complete = True
+                    break
+                if action_types and hot_entry.action_type not in action_types:
+                    continue
+                if not _accept(timestamp, hot_entry.to_dict()):
+                    complete = True
+                    break
+            
+            if not complete:
+                # Archived entries are older than the in-memory ones
+                oldest_hot = child.points_history[-1].timestamp if child.points_history else None
+                bounds = [timestamp for timestamp in (oldest_hot, upper) if timestamp is not None]
+                start_month = min(bounds).strftime("%Y-%m") if bounds else None
+                for month in await self.history_archive.async_months():
+                    if start_month is not None and month > start_month:
+                        continue
+                    if since is not None and month < since.strftime("%Y-%m"):
+                        break
+                    month_history = await self.history_archive.async_child_month(month, child_id)
+                    for timestamp, entry in reversed(month_history.between(since, upper, action_types)):
+                        if oldest_hot is not None and timestamp >= oldest_hot:
+                            continue
+                        if not _accept(timestamp, entry):
+                            complete = True
+                            break
+                    if complete:
+                        break
+            
+            next_cursor = None
+            if len(entries) > limit:
+                entries = entries[:limit]
+                last = entries[-1][0]
+                seen = sum(1 for timestamp, _ in entries if timestamp == last)
+                if last == before:
+                    seen += seen_at_before
+                next_cursor = f"{last.isoformat()}|{seen}"
             
-            _LOGGER.info(
-                "Retrieved %d history entries for child %s (out of %d total)", 
-                len(formatted_history), child_id, len(child.points_history or [])
+            _LOGGER.debug(
+                "Retrieved %d history entries for child %s", len(entries), child_id
             )
             
-            return formatted_history
+            return {"entries": [entry for _, entry in entries], "next_cursor": next_cursor}
             
         except Exception as e:
             _LOGGER.error("Failed to get child history for %s: %s", child_id, e)
-            raise
\ No newline at end of file
+            raise
+
+
+def _parse_history_date(value: str | None, name: str, end_of_day: bool = False) -> datetime | None:
+    """Parse an ISO date or datetime bound of a history query.
+    
+    A bare date used as an upper bound includes the whole day.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as err:
+        raise ValueError(f"Invalid date format for {name}: {value}") from err
+    if end_of_day and len(value) <= 10:
+        parsed = datetime.combine(parsed.date(), datetime.max.time())
+    return parsed
@@ -0,0 +1,96 @@
+# ============================================================================
+# cosmetics.py
+# ============================================================================
+
+"""Cosmetics catalog for Kids Tasks integration."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+COSMETICS_DIR = os.path.join(os.path.dirname(__file__), "cosmetics")
+COSMETIC_TYPES = ("avatars", "backgrounds", "outfits", "themes")
+
+
+def _read_catalog_if_changed(
+    file_path: str, known_mtime: float | None
+) -> tuple[float | None, list[dict[str, Any]] | None]:
+    """Return ``(mtime, items)``; items is None when the file did not change.
+
+    Runs in the executor. A missing file is an empty catalog without mtime.
+    """
+    try:
+        mtime = os.stat(file_path).st_mtime
+    except FileNotFoundError:
+        return None, None if known_mtime is None else []
+
+    if mtime == known_mtime:
+        return mtime, None
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        return mtime, json.load(f).get("items", [])
+
+
+class CosmeticsCatalog:
+    """In-memory copy of the ``catalog.json`` files shipped with the integration.
+
+    Each file is cached with its modification time: loading the catalog only
+    stats the files (concurrently) and re-reads the ones that changed.
+    """
+
+    def __init__(self, hass: HomeAssistant, cosmetics_dir: str = COSMETICS_DIR) -> None:
+        """Initialize an empty catalog."""
+        self.hass = hass
+        self.cosmetics_dir = cosmetics_dir
+        self._files: dict[str, tuple[float | None, list[dict[str, Any]]]] = {}
+        self._catalog: dict[str, list[dict[str, Any]]] | None = None
+        self._items_by_id: dict[str, tuple[str, dict[str, Any]]] = {}
+
+    async def async_load(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the catalog by type, re-reading only the files that changed.
+
+        The returned dict is shared with the cache and must not be modified.
+        """
+        changed = await asyncio.gather(
+            *(self._async_load_type(cosmetic_type) for cosmetic_type in COSMETIC_TYPES)
+        )
+
+        if self._catalog is None or any(changed):
+            self._catalog = {
+                cosmetic_type: self._files[cosmetic_type][1]
+                for cosmetic_type in COSMETIC_TYPES
+            }
+            self._items_by_id = {
+                item["id"]: (cosmetic_type, item)
+                for cosmetic_type, items in self._catalog.items()
+                for item in items
+                if item.get("id")
+            }
+
+        return self._catalog
+
+    async def _async_load_type(self, cosmetic_type: str) -> bool:
+        """Refresh the cached items of a type, returning True if they changed."""
+        catalog_file = os.path.join(self.cosmetics_dir, cosmetic_type, "catalog.json")
+        known_mtime = self._files[cosmetic_type][0] if cosmetic_type in self._files else None
+
+        mtime, items = await self.hass.async_add_executor_job(
+            _read_catalog_if_changed, catalog_file, known_mtime
+        )
+        if items is None and cosmetic_type in self._files:
+            return False
+
+        self._files[cosmetic_type] = (mtime, items or [])
+        _LOGGER.info("Loaded %d %s from catalog", len(items or []), cosmetic_type)
+        return True
+
+    def get_item(self, cosmetic_id: str) -> tuple[str, dict[str, Any]] | None:
+        """Return ``(cosmetic_type, item)`` for a cosmetic id of the loaded catalog."""
+        return self._items_by_id.get(cosmetic_id)
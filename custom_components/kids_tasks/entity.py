@@ -0,0 +1,31 @@
+# ============================================================================
+# entity.py
+# ============================================================================
+
+"""Base entity for Kids Tasks integration."""
+from __future__ import annotations
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import KidsTasksDataUpdateCoordinator
+
+
+class KidsTasksEntity(CoordinatorEntity[KidsTasksDataUpdateCoordinator]):
+    """Coordinator entity registered under the child, task or reward it shows.
+
+    Entities created with a ``(kind, id)`` context are recorded by the
+    coordinator while they are added, so removing that object only touches
+    its own entities.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        """Register the entity with the coordinator."""
+        await super().async_added_to_hass()
+        if self.coordinator_context is not None:
+            self.coordinator.async_register_entity(self.coordinator_context, self.entity_id)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the entity from the coordinator."""
+        if self.coordinator_context is not None:
+            self.coordinator.async_unregister_entity(self.coordinator_context, self.entity_id)
+        await super().async_will_remove_from_hass()
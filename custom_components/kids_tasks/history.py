@@ -0,0 +1,214 @@
+# ============================================================================
+# history.py
+# ============================================================================
+
+"""Monthly archive of the points history for Kids Tasks integration."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import os
+import shutil
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .codec import json_dumps, json_loads
+from .const import DOMAIN
+from .models import PointsHistoryEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Archived months kept in memory once read
+MAX_CACHED_MONTHS = 6
+
+ArchivedEntry = tuple[datetime, dict[str, Any]]
+
+
+def _append_month_lines(archive_dir: str, lines_by_month: dict[str, list[str]]) -> None:
+    """Append JSON lines to the month files (executor)."""
+    os.makedirs(archive_dir, exist_ok=True)
+    for month, lines in lines_by_month.items():
+        with open(os.path.join(archive_dir, f"{month}.jsonl"), "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+
+def _list_months(archive_dir: str) -> list[str]:
+    """Return the archived months, most recent first (executor)."""
+    try:
+        names = os.listdir(archive_dir)
+    except FileNotFoundError:
+        return []
+    return sorted((name[:-6] for name in names if name.endswith(".jsonl")), reverse=True)
+
+
+class ChildMonthHistory:
+    """Archived entries of a child for a month, in chronological order.
+
+    Entries are also filed by action type; both orderings are searched by
+    timestamp with ``bisect``.
+    """
+
+    __slots__ = ("timestamps", "entries", "by_action")
+
+    def __init__(self) -> None:
+        """Initialize an empty month."""
+        self.timestamps: list[datetime] = []
+        self.entries: list[dict[str, Any]] = []
+        self.by_action: dict[str, tuple[list[datetime], list[dict[str, Any]]]] = {}
+
+    def add(self, timestamp: datetime, entry: dict[str, Any]) -> None:
+        """Append an entry, dropping duplicates.
+
+        Entries of a child are archived oldest first, so an entry older than
+        the last one was already archived (e.g. spilled again after a rollback).
+        """
+        if self.timestamps:
+            if timestamp < self.timestamps[-1] or (
+                timestamp == self.timestamps[-1] and entry == self.entries[-1]
+            ):
+                return
+        self.timestamps.append(timestamp)
+        self.entries.append(entry)
+        timestamps, entries = self.by_action.setdefault(entry.get("action_type"), ([], []))
+        timestamps.append(timestamp)
+        entries.append(entry)
+
+    def between(
+        self,
+        since: datetime | None,
+        until: datetime | None,
+        action_types: Iterable[str] | None = None,
+    ) -> list[ArchivedEntry]:
+        """Return the ``(timestamp, entry)`` within ``[since, until]``, oldest first."""
+        if action_types is None:
+            return _slice(self.timestamps, self.entries, since, until)
+        parts = [
+            _slice(*self.by_action[action_type], since, until)
+            for action_type in action_types
+            if action_type in self.by_action
+        ]
+        if len(parts) == 1:
+            return parts[0]
+        return list(heapq.merge(*parts, key=lambda item: item[0]))
+
+
+def _slice(
+    timestamps: list[datetime],
+    entries: list[dict[str, Any]],
+    since: datetime | None,
+    until: datetime | None,
+) -> list[ArchivedEntry]:
+    """Return the entries whose timestamp is within ``[since, until]``."""
+    start = bisect_left(timestamps, since) if since is not None else 0
+    end = bisect_right(timestamps, until) if until is not None else len(timestamps)
+    return list(zip(timestamps[start:end], entries[start:end]))
+
+
+def _read_month(archive_dir: str, month: str) -> dict[str, ChildMonthHistory]:
+    """Read a month file into the entries of each child (executor)."""
+    by_child: dict[str, ChildMonthHistory] = {}
+    try:
+        with open(os.path.join(archive_dir, f"{month}.jsonl"), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json_loads(line)
+                    timestamp = datetime.fromisoformat(entry["timestamp"])
+                except (ValueError, KeyError):
+                    continue
+                by_child.setdefault(entry.get("child_id"), ChildMonthHistory()).add(timestamp, entry)
+    except FileNotFoundError:
+        pass
+    return by_child
+
+
+class HistoryArchive:
+    """Points history entries pushed out of the children's 20-entry window.
+
+    Entries are appended to one JSON-lines file per month under ``.storage``
+    and months are only read, in the executor, when a query reaches them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.archive_dir = hass.config.path(".storage", f"{DOMAIN}_history")
+        self._months: list[str] | None = None
+        self._cache: dict[str, dict[str, ChildMonthHistory]] = {}
+        self._buffer: dict[str, list[str]] = {}
+        self._write_task: asyncio.Task | None = None
+
+    @callback
+    def async_append(self, child_id: str, entries: Iterable[PointsHistoryEntry]) -> None:
+        """Archive entries of a child, oldest first."""
+        for entry in entries:
+            # An unreadable timestamp (logged when read) has no month to be filed under
+            if entry.timestamp is None:
+                continue
+            data = entry.to_dict()
+            data["child_id"] = child_id
+            month = entry.timestamp.strftime("%Y-%m")
+            self._buffer.setdefault(month, []).append(json_dumps(data) + "\n")
+
+            if self._months is not None and month not in self._months:
+                self._months = sorted([*self._months, month], reverse=True)
+            if month in self._cache:
+                self._cache[month].setdefault(child_id, ChildMonthHistory()).add(entry.timestamp, data)
+
+        if self._buffer and self._write_task is None:
+            self._write_task = self.hass.async_create_task(self._async_write())
+
+    async def _async_write(self) -> None:
+        """Write the buffered entries: the archive has a single writer."""
+        try:
+            while self._buffer:
+                lines_by_month, self._buffer = self._buffer, {}
+                await self.hass.async_add_executor_job(
+                    _append_month_lines, self.archive_dir, lines_by_month
+                )
+        except OSError as err:
+            _LOGGER.error("Failed to write the history archive: %s", err)
+        finally:
+            self._write_task = None
+
+    async def async_flush(self) -> None:
+        """Wait until the buffered entries are written."""
+        while self._write_task is not None:
+            await self._write_task
+
+    async def async_months(self) -> list[str]:
+        """Return the archived months (``YYYY-MM``), most recent first."""
+        if self._months is None:
+            await self.async_flush()
+            months = await self.hass.async_add_executor_job(_list_months, self.archive_dir)
+            self._months = sorted({*months, *self._buffer}, reverse=True)
+        return self._months
+
+    async def async_child_month(self, month: str, child_id: str) -> ChildMonthHistory:
+        """Return the archived entries of a child for a month."""
+        by_child = self._cache.get(month)
+        if by_child is None:
+            # Entries being appended must be on disk first
+            await self.async_flush()
+            by_child = await self.hass.async_add_executor_job(
+                _read_month, self.archive_dir, month
+            )
+            # Entries archived meanwhile are not in what was read: read again next time
+            if self._write_task is None:
+                if len(self._cache) >= MAX_CACHED_MONTHS:
+                    del self._cache[next(iter(self._cache))]
+                self._cache[month] = by_child
+        return by_child.get(child_id) or ChildMonthHistory()
+
+    async def async_clear(self) -> None:
+        """Delete every archived entry."""
+        await self.async_flush()
+        self._months = []
+        self._cache = {}
+        await self.hass.async_add_executor_job(
+            lambda: shutil.rmtree(self.archive_dir, ignore_errors=True)
+        )
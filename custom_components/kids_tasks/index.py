@@ -0,0 +1,223 @@
+# ============================================================================
+# index.py
+# ============================================================================
+
+"""Secondary indexes over the tasks and rewards of the Kids Tasks integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime
+
+from .const import TASK_STATUS_PENDING_VALIDATION, TASK_STATUS_VALIDATED
+from .models import Reward, Task
+
+
+class TaskIndex:
+    """Derived views of the tasks, maintained one changed task at a time.
+
+    The coordinator re-indexes a task whenever it is marked as changed, so
+    sensors read these views without scanning every task and child status.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty indexes."""
+        self._day: date | None = None
+        self._clear()
+
+    def _clear(self) -> None:
+        """Empty every index."""
+        # Attribute indexes: value -> task_ids, plus the keys each task is filed under
+        self._by_frequency: dict[str, set[str]] = {}
+        self._by_child: dict[str, set[str]] = {}
+        self._active: set[str] = set()
+        self._task_keys: dict[str, tuple[str, frozenset[str]]] = {}
+        # Validations of the day: task_id -> child_ids with a status validated today
+        self._validated_today: dict[str, frozenset[str]] = {}
+        # Same pairs restricted to the children assigned to the task, counted per child
+        self._assigned_validated_today: dict[str, frozenset[str]] = {}
+        self._child_validated_today: dict[str, int] = {}
+        self._household_validated_today = 0
+        # Pending validations: task_id -> {child_id: completed_at}
+        self._pending: dict[str, dict[str, datetime | None]] = {}
+        self._pending_sorted: list[tuple[datetime | None, str, str]] | None = None
+
+    def rebuild(self, tasks: Iterable[Task], today: date) -> None:
+        """Index every task from scratch."""
+        self._day = today
+        self._clear()
+        for task in tasks:
+            self.update_task(task)
+
+    def ensure_day(self, tasks: Iterable[Task], today: date) -> None:
+        """Roll the day counters over when the date changed."""
+        if self._day != today:
+            self.rebuild(tasks, today)
+
+    def update_task(self, task: Task) -> None:
+        """Re-index a task after it was added or modified."""
+        self.remove_task(task.id)
+
+        children = frozenset(task.assigned_child_ids)
+        self._task_keys[task.id] = (task.frequency, children)
+        _file(self._by_frequency, task.frequency, task.id)
+        for child_id in children:
+            _file(self._by_child, child_id, task.id)
+        if task.active:
+            self._active.add(task.id)
+
+        pending = {
+            child_id: child_status.completed_at
+            for child_id, child_status in task.child_statuses.items()
+            if child_status.status == TASK_STATUS_PENDING_VALIDATION
+        }
+        if pending:
+            self._pending[task.id] = pending
+            self._pending_sorted = None
+
+        validated = frozenset(
+            child_id
+            for child_id, child_status in task.child_statuses.items()
+            if child_status.status == TASK_STATUS_VALIDATED
+            and child_status.validated_at
+            and child_status.validated_at.date() == self._day
+        )
+        if not validated:
+            return
+
+        assigned = validated.intersection(task.assigned_child_ids)
+        self._validated_today[task.id] = validated
+        self._assigned_validated_today[task.id] = assigned
+        self._household_validated_today += len(validated)
+        for child_id in assigned:
+            self._child_validated_today[child_id] = self._child_validated_today.get(child_id, 0) + 1
+
+    def remove_task(self, task_id: str) -> None:
+        """Drop the contribution of a task."""
+        keys = self._task_keys.pop(task_id, None)
+        if keys is not None:
+            frequency, children = keys
+            _unfile(self._by_frequency, frequency, task_id)
+            for child_id in children:
+                _unfile(self._by_child, child_id, task_id)
+            self._active.discard(task_id)
+
+        if self._pending.pop(task_id, None) is not None:
+            self._pending_sorted = None
+
+        validated = self._validated_today.pop(task_id, None)
+        if validated is None:
+            return
+
+        self._household_validated_today -= len(validated)
+        for child_id in self._assigned_validated_today.pop(task_id):
+            remaining = self._child_validated_today[child_id] - 1
+            if remaining:
+                self._child_validated_today[child_id] = remaining
+            else:
+                del self._child_validated_today[child_id]
+
+    # Lookups return copies: callers may modify tasks (and so the index) while iterating
+    def tasks_by_frequency(self, frequency: str) -> list[str]:
+        """Return the ids of the tasks with a frequency."""
+        return list(self._by_frequency.get(frequency, ()))
+
+    def tasks_for_child(self, child_id: str) -> list[str]:
+        """Return the ids of the tasks assigned to a child."""
+        return list(self._by_child.get(child_id, ()))
+
+    @property
+    def active_task_count(self) -> int:
+        """Return the number of active tasks."""
+        return len(self._active)
+
+    def validated_today(self, child_id: str | None = None) -> int:
+        """Return the validations of the day, for one child or the household.
+
+        A child only counts the tasks it is assigned to; the household counts
+        every validated child status.
+        """
+        if child_id is None:
+            return self._household_validated_today
+        return self._child_validated_today.get(child_id, 0)
+
+    def has_pending(self, task_id: str) -> bool:
+        """Return True if a child of the task awaits validation."""
+        return task_id in self._pending
+
+    def pending_children(self, task_id: str) -> list[str]:
+        """Return the children of a task awaiting validation."""
+        return list(self._pending.get(task_id, ()))
+
+    @property
+    def pending_task_count(self) -> int:
+        """Return the number of tasks with at least one pending validation."""
+        return len(self._pending)
+
+    def pending_validations(self) -> list[tuple[datetime | None, str, str]]:
+        """Return the ``(completed_at, task_id, child_id)`` awaiting validation, oldest first.
+
+        The ordered list is cached until the next pending change.
+        """
+        if self._pending_sorted is None:
+            self._pending_sorted = sorted(
+                (
+                    (completed_at, task_id, child_id)
+                    for task_id, children in self._pending.items()
+                    for child_id, completed_at in children.items()
+                ),
+                # Statuses forced without completion time go first
+                key=lambda entry: (entry[0] or datetime.min, entry[1], entry[2]),
+            )
+        return self._pending_sorted
+
+
+class RewardIndex:
+    """Derived views of the rewards, maintained one changed reward at a time."""
+
+    def __init__(self) -> None:
+        """Initialize empty indexes."""
+        # Cosmetic rewards: cosmetic_id -> reward_ids, and the reverse mapping
+        self._by_cosmetic: dict[str, set[str]] = {}
+        self._cosmetic_of: dict[str, str] = {}
+
+    def rebuild(self, rewards: Iterable[Reward]) -> None:
+        """Index every reward from scratch."""
+        self._by_cosmetic = {}
+        self._cosmetic_of = {}
+        for reward in rewards:
+            self.update_reward(reward)
+
+    def update_reward(self, reward: Reward) -> None:
+        """Re-index a reward after it was added or modified."""
+        self.remove_reward(reward.id)
+        if reward.reward_type != "cosmetic" or not reward.cosmetic_data:
+            return
+
+        cosmetic_id = reward.cosmetic_data.get("cosmetic_id")
+        if cosmetic_id:
+            self._cosmetic_of[reward.id] = cosmetic_id
+            _file(self._by_cosmetic, cosmetic_id, reward.id)
+
+    def remove_reward(self, reward_id: str) -> None:
+        """Drop a reward from the indexes."""
+        cosmetic_id = self._cosmetic_of.pop(reward_id, None)
+        if cosmetic_id is not None:
+            _unfile(self._by_cosmetic, cosmetic_id, reward_id)
+
+    def rewards_for_cosmetic(self, cosmetic_id: str) -> list[str]:
+        """Return the ids of the cosmetic rewards unlocking a cosmetic."""
+        return sorted(self._by_cosmetic.get(cosmetic_id, ()))
+
+
+def _file(index: dict[str, set[str]], key: str, obj_id: str) -> None:
+    """Add a task or reward under a key of an attribute index."""
+    index.setdefault(key, set()).add(obj_id)
+
+
+def _unfile(index: dict[str, set[str]], key: str, obj_id: str) -> None:
+    """Remove a task or reward from a key of an attribute index, dropping empty keys."""
+    obj_ids = index.get(key)
+    if obj_ids is not None:
+        obj_ids.discard(obj_id)
+        if not obj_ids:
+            del index[key]
@@ -0,0 +1,276 @@
+# ============================================================================
+# journal.py
+# ============================================================================
+
+"""Append-only journal of the Kids Tasks domain events."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .codec import json_dumps, json_loads
+from .const import DOMAIN
+from .models import Child, Reward, Task
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lines already covered by a snapshot that trigger a compaction
+JOURNAL_COMPACT_LINES = 1000
+
+# Child status fields journaled with a status transition, restored on replay
+STATUS_FIELDS = ("completed_at", "validated_at", "penalty_applied", "penalty_applied_at")
+
+
+def _append_lines(path: str, lines: list[str]) -> None:
+    """Append JSON lines to the journal (executor)."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+def _read_entries(path: str) -> list[dict[str, Any]]:
+    """Read every journal entry, skipping a torn last line (executor)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+
+    entries = []
+    for line in lines:
+        try:
+            entries.append(json_loads(line))
+        except ValueError:
+            _LOGGER.warning("Skipping unreadable journal line: %s", line[:100])
+    return entries
+
+
+def _remove_files(*paths: str) -> None:
+    """Delete the journal files that exist (executor)."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _compact_file(path: str, archive_path: str, snapshot_seq: int) -> int:
+    """Move the entries covered by the snapshot to the archive (executor).
+
+    Returns the number of lines left in the journal.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return 0
+
+    covered: list[str] = []
+    tail: list[str] = []
+    for line in lines:
+        try:
+            seq = json_loads(line)["seq"]
+        except (ValueError, KeyError):
+            continue
+        (covered if seq <= snapshot_seq else tail).append(line)
+
+    if covered:
+        _append_lines(archive_path, covered)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(tail)
+    os.replace(tmp_path, path)
+    return len(tail)
+
+
+class Journal:
+    """JSON-lines journal of points, coins, status and claim events.
+
+    Events are derived from each object marked as changed by diffing it with
+    the last journaled values, and appended in the executor. Every snapshot
+    written to storage records the last sequence number it covers: at startup
+    the entries after it are replayed, and covered entries are periodically
+    moved to an archive file that keeps the full audit trail.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the journal."""
+        self.hass = hass
+        self.path = hass.config.path(".storage", f"{DOMAIN}.journal")
+        self.archive_path = f"{self.path}.archive"
+        self.seq = 0
+        # Last journaled values: child -> (points, coins), task -> {child: status}
+        self._balances: dict[str, tuple[int, int]] = {}
+        self._statuses: dict[str, dict[str, str]] = {}
+        self._buffer: list[str] = []
+        self._flush_task: asyncio.Task | None = None
+        self._line_count = 0
+        self._snapshot_seq = 0
+
+    async def async_load(self, snapshot_seq: int) -> list[dict[str, Any]]:
+        """Return the entries written after the snapshot, up to the last rebase."""
+        entries = await self.hass.async_add_executor_job(_read_entries, self.path)
+        self._line_count = len(entries)
+        self._snapshot_seq = snapshot_seq
+        self.seq = max([snapshot_seq, *(entry.get("seq", 0) for entry in entries)])
+
+        tail = [entry for entry in entries if entry.get("seq", 0) > snapshot_seq]
+        for index in range(len(tail) - 1, -1, -1):
+            if tail[index].get("event") == "rebase":
+                return tail[index + 1:]
+        return tail
+
+    @callback
+    def track(self, children: Iterable[Child], tasks: Iterable[Task]) -> None:
+        """Take the current values as the journaled ones, without events."""
+        self._balances = {child.id: (child.points, child.coins) for child in children}
+        self._statuses = {task.id: _child_statuses(task) for task in tasks}
+
+    @callback
+    def rebase(self, children: Iterable[Child], tasks: Iterable[Task]) -> None:
+        """Start over after the data was replaced: earlier entries are not replayed."""
+        self.track(children, tasks)
+        self._append({"event": "rebase"})
+
+    @callback
+    def record_child(self, child_id: str, child: Child | None) -> None:
+        """Journal the points and coins changes of a child."""
+        if child is None:
+            self._balances.pop(child_id, None)
+            return
+
+        points, coins = self._balances.get(child_id, (0, 0))
+        self._balances[child_id] = (child.points, child.coins)
+        if child.points != points:
+            entry = {
+                "event": "points",
+                "child_id": child_id,
+                "delta": child.points - points,
+                "balance": child.points,
+            }
+            latest = child.points_history[0] if child.points_history else None
+            if latest is not None and latest.points_delta == child.points - points:
+                entry["action_type"] = latest.action_type
+                entry["description"] = latest.description
+            self._append(entry)
+        if child.coins != coins:
+            self._append(
+                {
+                    "event": "coins",
+                    "child_id": child_id,
+                    "delta": child.coins - coins,
+                    "balance": child.coins,
+                }
+            )
+
+    @callback
+    def record_task(self, task_id: str, task: Task | None) -> None:
+        """Journal the status transitions of a task's children."""
+        if task is None:
+            self._statuses.pop(task_id, None)
+            return
+
+        previous = self._statuses.get(task_id, {})
+        current = _child_statuses(task)
+        self._statuses[task_id] = current
+        for child_id, status in current.items():
+            if previous.get(child_id, status) != status:
+                child_status = task.child_statuses[child_id].to_dict()
+                self._append(
+                    {
+                        "event": "status",
+                        "task_id": task_id,
+                        "child_id": child_id,
+                        "from": previous[child_id],
+                        "to": status,
+                        **{field: child_status[field] for field in STATUS_FIELDS},
+                    }
+                )
+
+    @callback
+    def record_all(self, children: dict[str, Child], tasks: dict[str, Task]) -> None:
+        """Journal the changes of every object, e.g. after a rollback."""
+        for child_id in self._balances.keys() | children.keys():
+            self.record_child(child_id, children.get(child_id))
+        for task_id in self._statuses.keys() | tasks.keys():
+            self.record_task(task_id, tasks.get(task_id))
+
+    @callback
+    def record_claim(self, reward: Reward, child_id: str) -> None:
+        """Journal a reward claim."""
+        self._append(
+            {
+                "event": "claim",
+                "reward_id": reward.id,
+                "child_id": child_id,
+                "remaining": reward.remaining_quantity,
+            }
+        )
+
+    @callback
+    def async_snapshot_written(self, data: dict[str, Any]) -> None:
+        """Note the sequence covered by a snapshot now on disk, compacting if due."""
+        self._snapshot_seq = data.get("system", {}).get("journal_seq", self._snapshot_seq)
+        if self._line_count - (self.seq - self._snapshot_seq) >= JOURNAL_COMPACT_LINES:
+            self._schedule_flush()
+
+    async def async_flush(self) -> None:
+        """Write the buffered entries now."""
+        if self._flush_task is not None:
+            await self._flush_task
+        if self._buffer:
+            self._schedule_flush()
+            await self._flush_task
+
+    async def async_remove(self) -> None:
+        """Delete the journal and its archive, dropping the buffered entries."""
+        self._buffer = []
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.hass.async_add_executor_job(_remove_files, self.path, self.archive_path)
+        self.seq = self._snapshot_seq = self._line_count = 0
+        self._balances = {}
+        self._statuses = {}
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        """Number, timestamp and buffer an entry."""
+        self.seq += 1
+        entry = {"seq": self.seq, "ts": datetime.now().isoformat(), **entry}
+        self._buffer.append(json_dumps(entry) + "\n")
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Start the writer task unless it is already running."""
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_task(self._async_write())
+
+    async def _async_write(self) -> None:
+        """Append the buffered entries, then compact: the journal has a single writer."""
+        try:
+            while self._buffer:
+                lines, self._buffer = self._buffer, []
+                await self.hass.async_add_executor_job(_append_lines, self.path, lines)
+                self._line_count += len(lines)
+
+            if self._line_count - (self.seq - self._snapshot_seq) >= JOURNAL_COMPACT_LINES:
+                self._line_count = await self.hass.async_add_executor_job(
+                    _compact_file, self.path, self.archive_path, self._snapshot_seq
+                )
+                _LOGGER.debug("Journal compacted up to entry %d", self._snapshot_seq)
+        except OSError as err:
+            _LOGGER.error("Failed to write the journal: %s", err)
+        finally:
+            self._flush_task = None
+            # Entries appended during the last executor job
+            if self._buffer:
+                self._schedule_flush()
+
+
+def _child_statuses(task: Task) -> dict[str, str]:
+    """Return the status of each child of a task."""
+    return {child_id: child_status.status for child_id, child_status in task.child_statuses.items()}
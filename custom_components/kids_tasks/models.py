@@ -5,14 +5,82 @@
 """Data models for Kids Tasks integration."""
 from __future__ import annotations
 
+import logging
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, time
 from typing import Any
 
 from .const import TASK_STATUS_TODO, FREQUENCY_DAILY, FREQUENCY_NONE
 
+_LOGGER = logging.getLogger(__name__)
 
-@dataclass
+
+def _intern(value: str | None) -> str | None:
+    """Share a single copy of a repeated string (ids, statuses, action types).
+    
+    Decoded JSON holds a separate copy of every occurrence; interning keeps one
+    per distinct value, which is what statuses and history entries repeat.
+    """
+    return sys.intern(value) if value is not None else None
+
+
+class _LazyDatetime(property):
+    """Datetime field that may hold its ISO string until it is first read.
+    
+    ``from_dict`` stores the raw strings: most timestamps (history, creation
+    dates, old validations) are never read, so they are never parsed.
+    Serializing a field that was not read returns the string unchanged.
+    Assignments go straight to the slot, so building a model costs no more
+    than with a plain field. A malformed string is logged and read as None.
+    """
+    
+    def __init__(self, slot: Any) -> None:
+        """Wrap the slot descriptor of the field."""
+        slot_get = slot.__get__
+        slot_set = slot.__set__
+        name = slot.__name__
+        
+        def fget(obj: Any) -> datetime | None:
+            value = slot_get(obj)
+            if value.__class__ is str:
+                try:
+                    parsed = datetime.fromisoformat(value)
+                except ValueError:
+                    _LOGGER.warning("Invalid %s on %s: %r", name, type(obj).__name__, value)
+                    parsed = None
+                slot_set(obj, parsed)
+                value = parsed
+            return value
+        
+        super().__init__(fget, slot_set)
+        self._slot_get = slot_get
+    
+    def isoformat(self, obj: Any) -> str | None:
+        """Return the ISO string of the field without parsing it."""
+        value = self._slot_get(obj)
+        if value is None or value.__class__ is str:
+            return value
+        return value.isoformat()
+
+
+def _lazy_datetimes(*names: str) -> Callable[[type], type]:
+    """Make datetime fields of a slotted dataclass decode lazily (apply after ``@dataclass``)."""
+    def decorate(cls: type) -> type:
+        for name in names:
+            setattr(cls, name, _LazyDatetime(cls.__dict__[name]))
+        return cls
+    return decorate
+
+
+def _isoformat(obj: Any, name: str) -> str | None:
+    """Serialize a lazy datetime field."""
+    return type(obj).__dict__[name].isoformat(obj)
+
+
+@_lazy_datetimes("completed_at", "validated_at", "penalty_applied_at")
+@dataclass(slots=True)
 class TaskChildStatus:
     """Represents the status of a task for a specific child."""
     child_id: str
@@ -28,22 +96,22 @@ class TaskChildStatus:
         return {
             "child_id": self.child_id,
             "status": self.status,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "validated_at": self.validated_at.isoformat() if self.validated_at else None,
-            "penalty_applied_at": self.penalty_applied_at.isoformat() if self.penalty_applied_at else None,
+            "completed_at": _isoformat(self, "completed_at"),
+            "validated_at": _isoformat(self, "validated_at"),
+            "penalty_applied_at": _isoformat(self, "penalty_applied_at"),
             "penalty_applied": self.penalty_applied,
-            "validation_history": self.validation_history,
+            "validation_history": list(self.validation_history),
         }
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TaskChildStatus:
         """Create from dictionary."""
         return cls(
-            child_id=data["child_id"],
-            status=data.get("status", TASK_STATUS_TODO),
-            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
-            validated_at=datetime.fromisoformat(data["validated_at"]) if data.get("validated_at") else None,
-            penalty_applied_at=datetime.fromisoformat(data["penalty_applied_at"]) if data.get("penalty_applied_at") else None,
+            child_id=_intern(data["child_id"]),
+            status=_intern(data.get("status", TASK_STATUS_TODO)),
+            completed_at=data.get("completed_at") or None,
+            validated_at=data.get("validated_at") or None,
+            penalty_applied_at=data.get("penalty_applied_at") or None,
             penalty_applied=data.get("penalty_applied", False),
             validation_history=data.get("validation_history", []),
         )
@@ -57,7 +125,8 @@ class TaskChildStatus:
         self.validation_history.append(validation_entry)
 
 
-@dataclass
+@_lazy_datetimes("created_at")
+@dataclass(slots=True)
 class Child:
     """Represents a child."""
     id: str
@@ -77,6 +146,8 @@ class Child:
     points_history: list[PointsHistoryEntry] = field(default_factory=list)  # Historique des 20 dernières modifications
     created_at: datetime = field(default_factory=datetime.now)
     card_customizations: dict[str, Any] = field(default_factory=dict)  # Personnalisations de la carte enfant
+    revision: int = field(default=0, compare=False, repr=False)  # Compteur de modifications (non persisté)
+    _spilled_history: list[PointsHistoryEntry] = field(default_factory=list, init=False, compare=False, repr=False)  # Entrées sorties de l'historique, à archiver
     
     @property
     def points_to_next_level(self) -> int:
@@ -209,7 +280,11 @@ class Child:
         return self.active_cosmetics.copy()
     
     def _add_to_points_history(self, action_type: str, points_delta: int, description: str, related_entity_id: str = None, related_entity_name: str = None) -> None:
-        """Add an entry to the points history and maintain max 20 entries."""
+        """Add an entry to the points history and maintain max 20 entries.
+        
+        Entries pushed out of the history are kept, oldest first, until
+        ``pop_spilled_history`` hands them over to the archive.
+        """
         entry = PointsHistoryEntry(
             timestamp=datetime.now(),
             action_type=action_type,
@@ -225,8 +300,14 @@ class Child:
         
         # Keep only last 20 entries
         if len(self.points_history) > 20:
+            self._spilled_history.extend(reversed(self.points_history[20:]))
             self.points_history = self.points_history[:20]
     
+    def pop_spilled_history(self) -> list[PointsHistoryEntry]:
+        """Return and forget the entries pushed out of the history, oldest first."""
+        spilled, self._spilled_history = self._spilled_history, []
+        return spilled
+    
     def get_points_history(self) -> list[dict[str, Any]]:
         """Get points history as list of dictionaries."""
         return [entry.to_dict() for entry in self.points_history]
@@ -259,19 +340,19 @@ class Child:
             "avatar_data": self.avatar_data,
             "card_gradient_start": self.card_gradient_start,
             "card_gradient_end": self.card_gradient_end,
-            "cosmetic_items": self.cosmetic_items,
-            "cosmetic_collection": self.cosmetic_collection,
-            "active_cosmetics": self.active_cosmetics,
+            "cosmetic_items": list(self.cosmetic_items),
+            "cosmetic_collection": {cosmetic_type: list(items) for cosmetic_type, items in self.cosmetic_collection.items()},
+            "active_cosmetics": dict(self.active_cosmetics),
             "points_history": [entry.to_dict() for entry in self.points_history],
-            "created_at": self.created_at.isoformat(),
-            "card_customizations": self.card_customizations,
+            "created_at": _isoformat(self, "created_at"),
+            "card_customizations": dict(self.card_customizations) if self.card_customizations else {},
         }
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Child:
         """Create from dictionary."""
         return cls(
-            id=data["id"],
+            id=_intern(data["id"]),
             name=data["name"],
             points=data.get("points", 0),
             coins=data.get("coins", 0),
@@ -286,12 +367,13 @@ class Child:
             cosmetic_collection=data.get("cosmetic_collection", {}),
             active_cosmetics=data.get("active_cosmetics", {}),
             points_history=[PointsHistoryEntry.from_dict(entry) for entry in data.get("points_history", [])],
-            created_at=datetime.fromisoformat(data.get("created_at", datetime.now().isoformat())),
+            created_at=data.get("created_at") or datetime.now(),
             card_customizations=data.get("card_customizations", {}),
         )
 
 
-@dataclass
+@_lazy_datetimes("created_at", "last_completed_at", "due_date", "suspended_until")
+@dataclass(slots=True)
 class Task:
     """Represents a task."""
     id: str
@@ -317,6 +399,8 @@ class Task:
     penalty_points: int = 0  # Points déduits si la tâche n'est pas faite à l'heure limite
     deadline_passed: bool = False  # Indique si l'heure limite est dépassée
     completed_by_child_id: str | None = None  # ID de l'enfant qui a complété la tâche (pour compatibilité)
+    revision: int = field(default=0, compare=False, repr=False)  # Compteur de modifications (non persisté)
+    _deadline_cache: tuple[str | None, time | None] | None = field(default=None, init=False, compare=False, repr=False)  # deadline_time analysé
     
     def complete_for_child(self, child_id: str, validation_required: bool = None) -> str:
         """Mark task as completed for a specific child."""
@@ -425,27 +509,47 @@ class Task:
         """Set assigned child IDs."""
         self.assigned_child_ids = child_ids
     
-    def check_deadline(self) -> bool:
+    def get_deadline(self) -> time | None:
+        """Return the parsed deadline time, re-parsed only when deadline_time changes."""
+        cache = self._deadline_cache
+        if cache is None or cache[0] != self.deadline_time:
+            # Parse deadline time (format "HH:MM")
+            try:
+                deadline_hour, deadline_minute = map(int, self.deadline_time.split(':'))
+                deadline = time(deadline_hour, deadline_minute)
+            except (ValueError, AttributeError):
+                # Format d'heure invalide
+                deadline = None
+            cache = self._deadline_cache = (self.deadline_time, deadline)
+        return cache[1]
+    
+    def next_deadline(self, now: datetime | None = None) -> datetime | None:
+        """Return when check_deadline() will next report a passed deadline.
+        
+        Returns ``now`` for an overdue task that was not handled yet, and None
+        when nothing is pending until the task changes (completed, already
+        penalized or without deadline).
+        """
+        deadline = self.get_deadline()
+        if deadline is None or self.status != TASK_STATUS_TODO or self.deadline_passed:
+            return None
+        
+        now = now or datetime.now()
+        return max(datetime.combine(now.date(), deadline), now)
+    
+    def check_deadline(self, now: datetime | None = None) -> bool:
         """Check if deadline has passed and update deadline_passed flag."""
-        if not self.deadline_time or self.status != TASK_STATUS_TODO:
+        deadline = self.get_deadline()
+        if deadline is None or self.status != TASK_STATUS_TODO:
             return False
             
-        now = datetime.now()
-        today = now.date()
+        now = now or datetime.now()
+        deadline_datetime = datetime.combine(now.date(), deadline)
         
-        # Parse deadline time (format "HH:MM")
-        try:
-            deadline_hour, deadline_minute = map(int, self.deadline_time.split(':'))
-            deadline_datetime = datetime.combine(today, time(deadline_hour, deadline_minute))
-            
-            # Si l'heure limite est dépassée et que la tâche n'est pas encore marquée comme dépassée
-            if now > deadline_datetime and not self.deadline_passed:
-                self.deadline_passed = True
-                return True  # Deadline vient d'être dépassée
-                
-        except (ValueError, AttributeError):
-            # Format d'heure invalide
-            return False
+        # Si l'heure limite est atteinte et que la tâche n'est pas encore marquée comme dépassée
+        if now >= deadline_datetime and not self.deadline_passed:
+            self.deadline_passed = True
+            return True  # Deadline vient d'être dépassée
             
         return False
     
@@ -485,16 +589,16 @@ class Task:
             "coins": self.coins,
             "frequency": self.frequency,
             "status": self.status,
-            "assigned_child_ids": self.assigned_child_ids,
+            "assigned_child_ids": list(self.assigned_child_ids),
             "child_statuses": {child_id: status.to_dict() for child_id, status in self.child_statuses.items()},
-            "created_at": self.created_at.isoformat(),
-            "last_completed_at": self.last_completed_at.isoformat() if self.last_completed_at else None,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "created_at": _isoformat(self, "created_at"),
+            "last_completed_at": _isoformat(self, "last_completed_at"),
+            "due_date": _isoformat(self, "due_date"),
             "validation_required": self.validation_required,
             "active": self.active,
             "suspended": self.suspended,
-            "suspended_until": self.suspended_until.isoformat() if self.suspended_until else None,
-            "weekly_days": self.weekly_days,
+            "suspended_until": _isoformat(self, "suspended_until"),
+            "weekly_days": list(self.weekly_days) if self.weekly_days is not None else None,
             "deadline_time": self.deadline_time,
             "penalty_points": self.penalty_points,
             "deadline_passed": self.deadline_passed,
@@ -508,38 +612,38 @@ class Task:
         child_statuses = {}
         if "child_statuses" in data:
             for child_id, status_data in data["child_statuses"].items():
-                child_statuses[child_id] = TaskChildStatus.from_dict(status_data)
+                child_statuses[_intern(child_id)] = TaskChildStatus.from_dict(status_data)
         
         task = cls(
-            id=data["id"],
+            id=_intern(data["id"]),
             name=data["name"],
             description=data.get("description", ""),
-            category=data.get("category", "other"),
+            category=_intern(data.get("category", "other")),
             icon=data.get("icon"),
             points=data.get("points", 10),
             coins=data.get("coins", 0),
-            frequency=data.get("frequency", FREQUENCY_DAILY),
-            status=data.get("status", TASK_STATUS_TODO),
-            assigned_child_ids=data.get("assigned_child_ids", []),
+            frequency=_intern(data.get("frequency", FREQUENCY_DAILY)),
+            status=_intern(data.get("status", TASK_STATUS_TODO)),
+            assigned_child_ids=[_intern(child_id) for child_id in data.get("assigned_child_ids", [])],
             child_statuses=child_statuses,
-            created_at=datetime.fromisoformat(data["created_at"]),
-            last_completed_at=datetime.fromisoformat(data["last_completed_at"]) if data.get("last_completed_at") else None,
-            due_date=datetime.fromisoformat(data["due_date"]) if data.get("due_date") else None,
+            created_at=data["created_at"],
+            last_completed_at=data.get("last_completed_at") or None,
+            due_date=data.get("due_date") or None,
             validation_required=data.get("validation_required", True),
             active=data.get("active", True),
             suspended=data.get("suspended", False),
-            suspended_until=datetime.fromisoformat(data["suspended_until"]) if data.get("suspended_until") else None,
+            suspended_until=data.get("suspended_until") or None,
             weekly_days=data.get("weekly_days"),
             deadline_time=data.get("deadline_time"),
             penalty_points=data.get("penalty_points", 0),
             deadline_passed=data.get("deadline_passed", False),
-            completed_by_child_id=data.get("completed_by_child_id"),
+            completed_by_child_id=_intern(data.get("completed_by_child_id")),
         )
         
         return task
 
 
-@dataclass
+@dataclass(slots=True)
 class Reward:
     """Represents a reward."""
     id: str
@@ -554,6 +658,7 @@ class Reward:
     remaining_quantity: int | None = None
     reward_type: str = "real"  # "real" ou "cosmetic"
     cosmetic_data: dict[str, Any] | None = field(default=None)  # Données pour cosmétiques
+    revision: int = field(default=0, compare=False, repr=False)  # Compteur de modifications (non persisté)
     
     def can_claim(self, child_points: int, child_coins: int = 0) -> bool:
         """Check if reward can be claimed."""
@@ -590,29 +695,30 @@ class Reward:
             "limited_quantity": self.limited_quantity,
             "remaining_quantity": self.remaining_quantity,
             "reward_type": self.reward_type,
-            "cosmetic_data": self.cosmetic_data,
+            "cosmetic_data": dict(self.cosmetic_data) if self.cosmetic_data is not None else None,
         }
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Reward:
         """Create from dictionary."""
         return cls(
-            id=data["id"],
+            id=_intern(data["id"]),
             name=data["name"],
             description=data.get("description", ""),
             cost=data.get("cost", 0),
             coin_cost=data.get("coin_cost", 0),
-            category=data.get("category", "fun"),
+            category=_intern(data.get("category", "fun")),
             icon=data.get("icon"),
             active=data.get("active", True),
             limited_quantity=data.get("limited_quantity"),
             remaining_quantity=data.get("remaining_quantity"),
-            reward_type=data.get("reward_type", "real"),
+            reward_type=_intern(data.get("reward_type", "real")),
             cosmetic_data=data.get("cosmetic_data"),
         )
 
 
-@dataclass
+@_lazy_datetimes("timestamp")
+@dataclass(slots=True)
 class PointsHistoryEntry:
     """Represents an entry in the points history."""
     timestamp: datetime
@@ -626,7 +732,7 @@ class PointsHistoryEntry:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _isoformat(self, "timestamp"),
             "action_type": self.action_type,
             "points_delta": self.points_delta,
             "description": self.description,
@@ -639,11 +745,12 @@ class PointsHistoryEntry:
     def from_dict(cls, data: dict[str, Any]) -> PointsHistoryEntry:
         """Create from dictionary."""
         return cls(
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            action_type=data["action_type"],
+            timestamp=data["timestamp"],
+            action_type=_intern(data["action_type"]),
             points_delta=data["points_delta"],
-            description=data["description"],
-            related_entity_id=data.get("related_entity_id"),
-            related_entity_name=data.get("related_entity_name"),
-            child_id=data.get("child_id"),
+            # Descriptions repeat for each completion of the same task
+            description=_intern(data["description"]),
+            related_entity_id=_intern(data.get("related_entity_id")),
+            related_entity_name=_intern(data.get("related_entity_name")),
+            child_id=_intern(data.get("child_id")),
         )
\ No newline at end of file
@@ -9,10 +9,10 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import KidsTasksDataUpdateCoordinator
+from .entity import KidsTasksEntity
 
 
 async def async_setup_entry(
@@ -32,12 +32,12 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class TaskPointsNumber(CoordinatorEntity, NumberEntity):
+class TaskPointsNumber(KidsTasksEntity, NumberEntity):
     """Number entity for task points."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, task_id: str) -> None:
         """Initialize the number."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("tasks", task_id))
         self.task_id = task_id
         self._attr_unique_id = f"{DOMAIN}_points_{task_id}"
         self._attr_native_min_value = 1
@@ -60,5 +60,6 @@ class TaskPointsNumber(CoordinatorEntity, NumberEntity):
         """Update the value."""
         if self.task_id in self.coordinator.tasks:
             self.coordinator.tasks[self.task_id].points = int(value)
+            self.coordinator.async_mark_changed(tasks=[self.task_id])
             await self.coordinator.async_save_data()
             await self.coordinator.async_request_refresh()
\ No newline at end of file
@@ -0,0 +1,169 @@
+# ============================================================================
+# scheduler.py
+# ============================================================================
+
+"""Deadline and reset scheduling for Kids Tasks integration."""
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import date, datetime, time, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+
+from .const import FREQUENCY_DAILY, FREQUENCY_MONTHLY, FREQUENCY_NONE, FREQUENCY_WEEKLY
+from .models import Task
+
+_LOGGER = logging.getLogger(__name__)
+
+RESET_FREQUENCIES = (FREQUENCY_DAILY, FREQUENCY_WEEKLY, FREQUENCY_MONTHLY)
+
+
+def reset_period_start(frequency: str, day: date) -> date:
+    """Return the first day of the reset period containing ``day``."""
+    if frequency == FREQUENCY_WEEKLY:
+        return day - timedelta(days=day.weekday())  # Monday
+    if frequency == FREQUENCY_MONTHLY:
+        return day.replace(day=1)
+    return day
+
+
+def next_reset_boundary(frequency: str, now: datetime) -> datetime:
+    """Return local midnight starting the next reset period after ``now``.
+
+    Computed on naive local dates, so the boundary stays at 00:00 across DST
+    changes; callers convert it with ``astimezone()`` when arming a timer.
+    """
+    period_start = reset_period_start(frequency, now.date())
+    if frequency == FREQUENCY_WEEKLY:
+        next_start = period_start + timedelta(days=7)
+    elif frequency == FREQUENCY_MONTHLY:
+        next_start = (period_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    else:
+        next_start = period_start + timedelta(days=1)
+    return datetime.combine(next_start, time.min)
+
+
+class DeadlineScheduler:
+    """Arm a single timer for the earliest upcoming task deadline.
+
+    Deadlines are kept in a min-heap of ``(instant, task_id)``. Entries are
+    invalidated lazily: ``_scheduled`` holds the current instant of every task
+    and heap entries that no longer match it are dropped when they surface.
+    Instants are naive local datetimes, like the rest of the models.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        action: Callable[[list[str], datetime], Awaitable[None]],
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._action = action
+        self._heap: list[tuple[datetime, str]] = []
+        self._scheduled: dict[str, datetime] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timer_at: datetime | None = None
+
+    @callback
+    def async_schedule(self, task: Task, now: datetime | None = None) -> None:
+        """(Re)schedule the next deadline of a task after it changed."""
+        when = None
+        if task.frequency != FREQUENCY_NONE:
+            when = task.next_deadline(now)
+
+        if when is None:
+            self._scheduled.pop(task.id, None)
+        elif self._scheduled.get(task.id) != when:
+            self._scheduled[task.id] = when
+            heapq.heappush(self._heap, (when, task.id))
+        self._arm()
+
+    @callback
+    def async_unschedule(self, task_id: str) -> None:
+        """Forget the deadline of a removed task."""
+        if self._scheduled.pop(task_id, None) is not None:
+            self._arm()
+
+    @callback
+    def async_rebuild(self, tasks: Iterable[Task]) -> None:
+        """Schedule every task from scratch, e.g. after loading or restoring data."""
+        now = datetime.now()
+        self._scheduled = {}
+        for task in tasks:
+            if task.frequency == FREQUENCY_NONE:
+                continue
+            when = task.next_deadline(now)
+            if when is not None:
+                self._scheduled[task.id] = when
+        self._heap = [(when, task_id) for task_id, when in self._scheduled.items()]
+        heapq.heapify(self._heap)
+        self._arm()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the pending timer."""
+        self._cancel_timer()
+        self._heap = []
+        self._scheduled = {}
+
+    @property
+    def next_deadline(self) -> datetime | None:
+        """Return the instant the timer is armed for."""
+        return self._timer_at
+
+    def _discard_stale(self) -> None:
+        """Pop heap entries that were superseded or unscheduled."""
+        heap = self._heap
+        while heap and self._scheduled.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _cancel_timer(self) -> None:
+        """Cancel the armed timer, if any."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._timer_at = None
+
+    def _arm(self) -> None:
+        """Make sure the timer fires at the earliest scheduled deadline."""
+        self._discard_stale()
+        if not self._heap:
+            self._cancel_timer()
+            return
+
+        when = self._heap[0][0]
+        if when == self._timer_at:
+            return
+
+        self._cancel_timer()
+        self._timer_at = when
+        # Naive local time -> aware datetime for the event helper
+        self._unsub_timer = async_track_point_in_time(
+            self.hass, self._async_fire, when.astimezone()
+        )
+
+    async def _async_fire(self, _fired_at: datetime) -> None:
+        """Hand every task whose deadline is reached to the action."""
+        self._unsub_timer = None
+        self._timer_at = None
+        now = datetime.now()
+
+        due: list[str] = []
+        heap = self._heap
+        self._discard_stale()
+        while heap and heap[0][0] <= now:
+            _, task_id = heapq.heappop(heap)
+            del self._scheduled[task_id]
+            due.append(task_id)
+            self._discard_stale()
+
+        try:
+            if due:
+                _LOGGER.debug("Deadline reached for tasks: %s", due)
+                await self._action(due, now)
+        finally:
+            self._arm()
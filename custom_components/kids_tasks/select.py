@@ -9,10 +9,10 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, TASK_STATUSES, CATEGORIES, FREQUENCIES
 from .coordinator import KidsTasksDataUpdateCoordinator
+from .entity import KidsTasksEntity
 
 
 async def async_setup_entry(
@@ -32,12 +32,12 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class TaskStatusSelect(CoordinatorEntity, SelectEntity):
+class TaskStatusSelect(KidsTasksEntity, SelectEntity):
     """Select entity for task status."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, task_id: str) -> None:
         """Initialize the select."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("tasks", task_id))
         self.task_id = task_id
         self._attr_unique_id = f"{DOMAIN}_status_{task_id}"
         self._attr_options = ["À faire", "En cours", "Terminé", "En attente validation", "Validé", "Échoué"]
@@ -78,5 +78,6 @@ class TaskStatusSelect(CoordinatorEntity, SelectEntity):
         
         if self.task_id in self.coordinator.tasks:
             self.coordinator.tasks[self.task_id].status = new_status
+            self.coordinator.async_mark_changed(tasks=[self.task_id])
             await self.coordinator.async_save_data()
             await self.coordinator.async_request_refresh()
\ No newline at end of file
@@ -18,10 +18,10 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import KidsTasksDataUpdateCoordinator
+from .entity import KidsTasksEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -78,12 +78,12 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ChildPointsSensor(CoordinatorEntity, SensorEntity):
+class ChildPointsSensor(KidsTasksEntity, SensorEntity):
     """Sensor for child points."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, child_id: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("children", child_id))
         self.child_id = child_id
         # Use child name for both unique_id and entity_id (safe for HA compatibility)
         safe_child_name = get_safe_child_name(coordinator, child_id)
@@ -127,12 +127,12 @@ class ChildPointsSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class ChildLevelSensor(CoordinatorEntity, SensorEntity):
+class ChildLevelSensor(KidsTasksEntity, SensorEntity):
     """Sensor for child level."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, child_id: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("children", child_id))
         self.child_id = child_id
         # Use child name for both unique_id and entity_id (safe for HA compatibility)
         safe_child_name = get_safe_child_name(coordinator, child_id)
@@ -152,12 +152,12 @@ class ChildLevelSensor(CoordinatorEntity, SensorEntity):
         return self.coordinator.data["children"].get(self.child_id, {}).get("level", 1)
 
 
-class ChildTasksCompletedTodaySensor(CoordinatorEntity, SensorEntity):
+class ChildTasksCompletedTodaySensor(KidsTasksEntity, SensorEntity):
     """Sensor for child tasks completed today."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, child_id: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("children", child_id))
         self.child_id = child_id
         # Use child name for both unique_id and entity_id (safe for HA compatibility)
         safe_child_name = get_safe_child_name(coordinator, child_id)
@@ -174,30 +174,10 @@ class ChildTasksCompletedTodaySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        today = datetime.now().date()
-        count = 0
-        
-        for task_data in self.coordinator.data.get("tasks", {}).values():
-            # Check if this child is assigned to the task
-            assigned_child_ids = task_data.get("assigned_child_ids", [])
-            if self.child_id in assigned_child_ids:
-                # Check the child's individual status
-                child_statuses = task_data.get("child_statuses", {})
-                if self.child_id in child_statuses:
-                    child_status = child_statuses[self.child_id]
-                    if (child_status.get("status") == "validated" and 
-                        child_status.get("validated_at")):
-                        try:
-                            validated_date = datetime.fromisoformat(child_status["validated_at"]).date()
-                            if validated_date == today:
-                                count += 1
-                        except (ValueError, TypeError):
-                            continue
-        
-        return count
+        return self.coordinator.count_validated_today(self.child_id)
 
 
-class PendingValidationsSensor(CoordinatorEntity, SensorEntity):
+class PendingValidationsSensor(KidsTasksEntity, SensorEntity):
     """Sensor for pending validations."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator) -> None:
@@ -215,29 +195,26 @@ class PendingValidationsSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        count = 0
-        for task_data in self.coordinator.data.get("tasks", {}).values():
-            if task_data.get("status") == "pending_validation":
-                count += 1
-        return count
+        return self.coordinator.task_index.pending_task_count
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
+        tasks = self.coordinator.data.get("tasks", {})
+        children = self.coordinator.data.get("children", {})
+        
+        # One entry per child awaiting validation, oldest completion first
         pending_tasks = []
-        for task_id, task_data in self.coordinator.data.get("tasks", {}).items():
-            if task_data.get("status") == "pending_validation":
-                child_name = "Unknown"
-                if task_data.get("assigned_child_id"):
-                    child_data = self.coordinator.data["children"].get(task_data["assigned_child_id"], {})
-                    child_name = child_data.get("name", "Unknown")
-                
-                pending_tasks.append({
-                    "task_id": task_id,
-                    "name": task_data.get("name", ""),
-                    "child": child_name,
-                    "points": task_data.get("points", 0),
-                })
+        for completed_at, task_id, child_id in self.coordinator.task_index.pending_validations():
+            task_data = tasks.get(task_id, {})
+            pending_tasks.append({
+                "task_id": task_id,
+                "name": task_data.get("name", ""),
+                "child_id": child_id,
+                "child": children.get(child_id, {}).get("name", "Unknown"),
+                "points": task_data.get("points", 0),
+                "completed_at": completed_at.isoformat() if completed_at else None,
+            })
         
         from .const import (
             CATEGORIES, FREQUENCIES, CATEGORY_LABELS, CATEGORY_ICONS,
@@ -256,7 +233,7 @@ class PendingValidationsSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class TotalTasksCompletedTodaySensor(CoordinatorEntity, SensorEntity):
+class TotalTasksCompletedTodaySensor(KidsTasksEntity, SensorEntity):
     """Sensor for total tasks completed today."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator) -> None:
@@ -274,26 +251,11 @@ class TotalTasksCompletedTodaySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        today = datetime.now().date()
-        count = 0
-        
-        for task_data in self.coordinator.data.get("tasks", {}).values():
-            # Count individual child validations, not global task status
-            child_statuses = task_data.get("child_statuses", {})
-            for child_id, child_status in child_statuses.items():
-                if (child_status.get("status") == "validated" and 
-                    child_status.get("validated_at")):
-                    try:
-                        validated_date = datetime.fromisoformat(child_status["validated_at"]).date()
-                        if validated_date == today:
-                            count += 1
-                    except (ValueError, TypeError):
-                        continue
-        
-        return count
+        # Count individual child validations, not global task status
+        return self.coordinator.count_validated_today()
 
 
-class ActiveTasksSensor(CoordinatorEntity, SensorEntity):
+class ActiveTasksSensor(KidsTasksEntity, SensorEntity):
     """Sensor for active tasks."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator) -> None:
@@ -311,14 +273,10 @@ class ActiveTasksSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        count = 0
-        for task_data in self.coordinator.data.get("tasks", {}).values():
-            if task_data.get("active", True):
-                count += 1
-        return count
+        return self.coordinator.task_index.active_task_count
 
 
-class AllTasksListSensor(CoordinatorEntity, SensorEntity):
+class AllTasksListSensor(KidsTasksEntity, SensorEntity):
     """Sensor that shows all tasks with their details."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator) -> None:
@@ -399,7 +357,7 @@ class AllTasksListSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class AllRewardsListSensor(CoordinatorEntity, SensorEntity):
+class AllRewardsListSensor(KidsTasksEntity, SensorEntity):
     """Sensor that shows all rewards with their details."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator) -> None:
@@ -448,12 +406,12 @@ class AllRewardsListSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class TaskSensor(CoordinatorEntity, SensorEntity):
+class TaskSensor(KidsTasksEntity, SensorEntity):
     """Individual sensor for each task."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, task_id: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("tasks", task_id))
         self.task_id = task_id
         self._attr_unique_id = f"kidtasks_task_{task_id}"
         # L'icône sera définie dynamiquement dans la propriété icon
@@ -541,12 +499,12 @@ class TaskSensor(CoordinatorEntity, SensorEntity):
         return self.task_id in self.coordinator.data.get("tasks", {})
 
 
-class RewardSensor(CoordinatorEntity, SensorEntity):
+class RewardSensor(KidsTasksEntity, SensorEntity):
     """Individual sensor for each reward."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, reward_id: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("rewards", reward_id))
         self.reward_id = reward_id
         self._attr_unique_id = f"kidtasks_reward_{reward_id}"
         # L'icône sera définie dynamiquement dans la propriété icon
@@ -611,12 +569,12 @@ class RewardSensor(CoordinatorEntity, SensorEntity):
         return self.reward_id in self.coordinator.data.get("rewards", {})
 
 
-class ChildPointsHistorySensor(CoordinatorEntity, SensorEntity):
+class ChildPointsHistorySensor(KidsTasksEntity, SensorEntity):
     """Sensor for child points history."""
 
     def __init__(self, coordinator: KidsTasksDataUpdateCoordinator, child_id: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("children", child_id))
         self.child_id = child_id
         # Use child name for both unique_id and entity_id (safe for HA compatibility)
         safe_child_name = get_safe_child_name(coordinator, child_id)
@@ -7,13 +7,15 @@ from __future__ import annotations
 
 import uuid
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers import config_validation as cv
 
+from .codec import CODECS
 from .const import DOMAIN, CATEGORIES, FREQUENCIES
 from .coordinator import KidsTasksDataUpdateCoordinator
 from .models import Child, Task, Reward
@@ -25,6 +27,7 @@ SERVICE_ADD_TASK = "add_task"
 SERVICE_ADD_REWARD = "add_reward"
 SERVICE_COMPLETE_TASK = "complete_task"
 SERVICE_VALIDATE_TASK = "validate_task"
+SERVICE_VALIDATE_ALL_TASKS = "validate_all_tasks"
 SERVICE_REJECT_TASK = "reject_task"
 SERVICE_CLAIM_REWARD = "claim_reward"
 SERVICE_RESET_TASK = "reset_task"
@@ -58,6 +61,7 @@ SERVICE_LIST_TASKS = "list_tasks"
 SERVICE_LIST_CHILDREN = "list_children"
 SERVICE_CLEANUP_OLD_ENTITIES = "cleanup_old_entities"
 SERVICE_GET_CHILD_HISTORY = "get_child_history"
+SERVICE_BATCH = "batch"
 
 SERVICE_ADD_CHILD_SCHEMA = vol.Schema(
     {
@@ -262,9 +266,36 @@ SERVICE_REMOVE_COINS_SCHEMA = vol.Schema(
 
 SERVICE_RESET_PENALTIES_SCHEMA = vol.Schema({})  # No parameters needed
 
+SERVICE_LIST_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("child_id"): cv.string,  # Limiter aux tâches d'un enfant
+    }
+)
+
+SERVICE_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("operations"): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required("action"): cv.string,
+                        vol.Optional("data", default={}): dict,
+                    }
+                )
+            ],
+        ),
+        vol.Optional("stop_on_error", default=False): cv.boolean,
+    }
+)
+
 SERVICE_LOAD_COSMETICS_SCHEMA = vol.Schema({})  # No parameters needed
 
-SERVICE_CREATE_COSMETIC_REWARDS_SCHEMA = vol.Schema({})  # No parameters needed
+SERVICE_CREATE_COSMETIC_REWARDS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("sync_existing", default=False): cv.boolean,  # Aligner prix/rareté des récompenses existantes
+    }
+)
 
 SERVICE_ACTIVATE_COSMETIC_SCHEMA = vol.Schema(
     {
@@ -298,21 +329,31 @@ SERVICE_REMOVE_REWARD_SCHEMA = vol.Schema(
 SERVICE_BACKUP_DATA_SCHEMA = vol.Schema(
     {
         vol.Optional("include_history", default=True): cv.boolean,
+        vol.Optional("format", default="json"): vol.In(list(CODECS)),
+        vol.Optional("filename"): cv.string,
+        vol.Optional("base"): cv.string,
     }
 )
 
-SERVICE_RESTORE_DATA_SCHEMA = vol.Schema(
-    {
-        vol.Required("backup_data"): cv.string,
-    }
+SERVICE_RESTORE_DATA_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive("backup_data", "backup_source"): cv.string,
+            vol.Exclusive("path", "backup_source"): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key("backup_data", "path"),
 )
 
 SERVICE_GET_CHILD_HISTORY_SCHEMA = vol.Schema(
     {
-        vol.Required("child_id"): cv.string,
-        vol.Optional("limit", default=20): vol.Coerce(int),
+        vol.Required("child_id"): vol.All(cv.ensure_list, [cv.string]),  # Un ou plusieurs enfants
+        vol.Optional("limit", default=20): vol.All(vol.Coerce(int), vol.Range(min=1)),
         vol.Optional("since_date"): cv.string,  # Format ISO date
-        vol.Optional("action_type"): cv.string,  # Filter by action type
+        vol.Optional("until_date"): cv.string,  # Format ISO date (journée incluse)
+        vol.Optional("action_type"): vol.All(cv.ensure_list, [cv.string]),  # Filter by action type(s)
+        # next_cursor de la page précédente, ou {child_id: cursor} pour plusieurs enfants
+        vol.Optional("cursor"): vol.Any(cv.string, {cv.string: vol.Any(cv.string, None)}),
     }
 )
 
@@ -444,6 +485,11 @@ async def async_setup_services(
         else:
             _LOGGER.warning("❌ Task validation failed: %s", task_id)
     
+    async def validate_all_tasks_service(call: ServiceCall) -> None:
+        """Validate every task completion awaiting validation."""
+        validated_count = await coordinator.async_validate_all_pending()
+        _LOGGER.info("✅ Validated %d pending task completions", validated_count)
+    
     async def claim_reward_service(call: ServiceCall) -> None:
         """Claim a reward."""
         await coordinator.async_claim_reward(
@@ -456,6 +502,7 @@ async def async_setup_services(
         task_id = call.data["task_id"]
         if task_id in coordinator.tasks:
             coordinator.tasks[task_id].reset()
+            coordinator.async_mark_changed(tasks=[task_id])
             await coordinator.async_save_data()
             await coordinator.async_request_refresh()
     
@@ -480,6 +527,10 @@ async def async_setup_services(
         DOMAIN, SERVICE_VALIDATE_TASK, validate_task_service, schema=SERVICE_VALIDATE_TASK_SCHEMA
     )
     
+    hass.services.async_register(
+        DOMAIN, SERVICE_VALIDATE_ALL_TASKS, validate_all_tasks_service, schema=vol.Schema({})
+    )
+    
     hass.services.async_register(
         DOMAIN, SERVICE_CLAIM_REWARD, claim_reward_service, schema=SERVICE_CLAIM_REWARD_SCHEMA
     )
@@ -631,16 +682,28 @@ async def async_setup_services(
         """Reset all monthly tasks."""
         await coordinator.async_reset_all_monthly_tasks()
     
-    async def backup_data_service(call: ServiceCall) -> None:
-        """Backup data."""
-        include_history = call.data.get("include_history", True)
-        backup = await coordinator.async_backup_data(include_history)
-        _LOGGER.info("Data backup created: %s", backup[:100] + "...")
+    async def backup_data_service(call: ServiceCall) -> ServiceResponse:
+        """Backup data to a gzip-compressed file, in full or since a base backup."""
+        return await coordinator.async_backup_to_file(
+            call.data.get("include_history", True),
+            call.data.get("format", "json"),
+            call.data.get("filename"),
+            call.data.get("base"),
+        )
     
-    async def restore_data_service(call: ServiceCall) -> None:
-        """Restore data."""
+    async def restore_data_service(call: ServiceCall) -> ServiceResponse:
+        """Restore data from a backup file or string."""
+        if "path" in call.data:
+            return await coordinator.async_restore_from_file(call.data["path"])
+        
         backup_data = call.data["backup_data"]
-        await coordinator.async_restore_data(backup_data)
+        started = time.monotonic()
+        success = await coordinator.async_restore_data(backup_data)
+        return {
+            "success": success,
+            "size": len(backup_data.encode("utf-8")),
+            "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        }
     
     # Register all services
     hass.services.async_register(
@@ -728,11 +791,19 @@ async def async_setup_services(
     )
     
     hass.services.async_register(
-        DOMAIN, SERVICE_BACKUP_DATA, backup_data_service, schema=SERVICE_BACKUP_DATA_SCHEMA
+        DOMAIN,
+        SERVICE_BACKUP_DATA,
+        backup_data_service,
+        schema=SERVICE_BACKUP_DATA_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     
     hass.services.async_register(
-        DOMAIN, SERVICE_RESTORE_DATA, restore_data_service, schema=SERVICE_RESTORE_DATA_SCHEMA
+        DOMAIN,
+        SERVICE_RESTORE_DATA,
+        restore_data_service,
+        schema=SERVICE_RESTORE_DATA_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     
     async def clear_all_data_service(call: ServiceCall) -> None:
@@ -750,10 +821,16 @@ async def async_setup_services(
     )
     
     async def list_tasks_service(call: ServiceCall) -> None:
-        """List all tasks with details."""
+        """List all tasks, or the tasks of one child, with details."""
         try:
+            if child_id := call.data.get("child_id"):
+                tasks = coordinator.tasks_for_child(child_id)
+            else:
+                tasks = list(coordinator.tasks.values())
+            
             tasks_list = []
-            for task_id, task in coordinator.tasks.items():
+            for task in tasks:
+                task_id = task.id
                 # Get child names if assigned
                 child_names = []
                 for child_id in task.assigned_child_ids:
@@ -785,7 +862,7 @@ async def async_setup_services(
             raise
     
     hass.services.async_register(
-        DOMAIN, SERVICE_LIST_TASKS, list_tasks_service
+        DOMAIN, SERVICE_LIST_TASKS, list_tasks_service, schema=SERVICE_LIST_TASKS_SCHEMA
     )
     
     async def list_children_service(call: ServiceCall) -> None:
@@ -823,6 +900,7 @@ async def async_setup_services(
                 if task.penalty_points > 0:
                     _LOGGER.info(f"Resetting penalty_points for task '{task.name}' from {task.penalty_points} to 0")
                     task.penalty_points = 0
+                    coordinator.async_mark_changed(tasks=[task_id])
                     tasks_updated += 1
             
             # Save the changes
@@ -852,7 +930,9 @@ async def async_setup_services(
     async def create_cosmetic_rewards_service(call: ServiceCall) -> None:
         """Create cosmetic rewards from catalog."""
         try:
-            created_count = await coordinator.async_create_cosmetic_rewards_from_catalog()
+            created_count = await coordinator.async_create_cosmetic_rewards_from_catalog(
+                call.data.get("sync_existing", False)
+            )
             _LOGGER.info("Created %d cosmetic rewards from catalog", created_count)
                            
         except Exception as e:
@@ -880,26 +960,23 @@ async def async_setup_services(
             # Get entity registry
             er = entity_registry.async_get(hass)
             
-            # Find and remove old format entities
+            # Find and remove old format entities, among our config entries only
             old_entities_removed = []
             
-            for entity_id, entity_entry in er.entities.items():
-                # Remove old tache_ format entities
-                if (entity_id.startswith('sensor.tache_') and 
-                    entity_entry.config_entry_id and 
-                    entity_entry.config_entry_id in hass.data.get(DOMAIN, {})):
-                    er.async_remove(entity_id)
-                    old_entities_removed.append(entity_id)
-                    _LOGGER.info("Removed old entity: %s", entity_id)
-                    
-                # Remove old button entities with old naming
-                elif (entity_id.startswith('button.') and 
-                      'tache' in entity_id and
-                      entity_entry.config_entry_id and 
-                      entity_entry.config_entry_id in hass.data.get(DOMAIN, {})):
-                    er.async_remove(entity_id)
-                    old_entities_removed.append(entity_id)
-                    _LOGGER.info("Removed old button entity: %s", entity_id)
+            for entry_id in list(hass.data.get(DOMAIN, {})):
+                for entity_entry in entity_registry.async_entries_for_config_entry(er, entry_id):
+                    entity_id = entity_entry.entity_id
+                    # Remove old tache_ format entities
+                    if entity_id.startswith('sensor.tache_'):
+                        er.async_remove(entity_id)
+                        old_entities_removed.append(entity_id)
+                        _LOGGER.info("Removed old entity: %s", entity_id)
+                        
+                    # Remove old button entities with old naming
+                    elif entity_id.startswith('button.') and 'tache' in entity_id:
+                        er.async_remove(entity_id)
+                        old_entities_removed.append(entity_id)
+                        _LOGGER.info("Removed old button entity: %s", entity_id)
             
             _LOGGER.info("🧹 Cleanup completed - Removed %d old entities", len(old_entities_removed))
             
@@ -918,31 +995,202 @@ async def async_setup_services(
         DOMAIN, SERVICE_CLEANUP_OLD_ENTITIES, cleanup_old_entities_service
     )
     
-    async def get_child_history_service(call: ServiceCall) -> None:
-        """Get child history with optional filtering."""
+    async def get_child_history_service(call: ServiceCall) -> ServiceResponse:
+        """Return a page of history for each requested child."""
         try:
-            child_id = call.data["child_id"]
-            limit = call.data.get("limit", 20)
-            since_date = call.data.get("since_date")
-            action_type = call.data.get("action_type")
-            
-            history = await coordinator.async_get_child_history(
-                child_id, limit, since_date, action_type
-            )
+            child_ids = call.data["child_id"]
+            cursor = call.data.get("cursor")
             
-            _LOGGER.info("Retrieved history for child %s: %d entries", child_id, len(history))
+            children: dict[str, Any] = {}
+            for child_id in child_ids:
+                child_cursor = cursor.get(child_id) if isinstance(cursor, dict) else cursor
+                page = await coordinator.async_get_child_history(
+                    child_id,
+                    call.data["limit"],
+                    call.data.get("since_date"),
+                    call.data.get("action_type"),
+                    child_cursor,
+                    call.data.get("until_date"),
+                )
+                children[child_id] = {"child_name": coordinator.children[child_id].name, **page}
             
-            # Log the history for visibility (since we can't return data directly from services)
-            for entry in history:
-                _LOGGER.info("History entry: %s - %s points (%s)", 
-                           entry.get("description", "Unknown action"),
-                           entry.get("points_delta", 0),
-                           entry.get("timestamp", "Unknown time"))
+            _LOGGER.debug(
+                "Retrieved history for children %s: %s entries",
+                child_ids, [len(page["entries"]) for page in children.values()],
+            )
+            return {"children": children}
                            
         except Exception as e:
             _LOGGER.error("Failed to get child history: %s", e)
             raise
     
     hass.services.async_register(
-        DOMAIN, SERVICE_GET_CHILD_HISTORY, get_child_history_service, schema=SERVICE_GET_CHILD_HISTORY_SCHEMA
-    )
\ No newline at end of file
+        DOMAIN,
+        SERVICE_GET_CHILD_HISTORY,
+        get_child_history_service,
+        schema=SERVICE_GET_CHILD_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    
+    async def batch_reset_task(data: dict[str, Any]) -> bool:
+        """Reset a task inside a batch."""
+        task = coordinator.tasks.get(data["task_id"])
+        if task is None:
+            return False
+        task.reset()
+        coordinator.async_mark_changed(tasks=[task.id])
+        await coordinator.async_save_data()
+        await coordinator.async_request_refresh()
+        return True
+    
+    async def batch_suspend_task(data: dict[str, Any]) -> bool:
+        """Suspend a task inside a batch, failing on an invalid date."""
+        from datetime import datetime
+        until_date = data.get("until_date")
+        return await coordinator.async_suspend_task(
+            data["task_id"], datetime.fromisoformat(until_date) if until_date else None
+        )
+    
+    async def batch_remove_task(data: dict[str, Any]) -> bool:
+        """Remove a task inside a batch, failing on an unknown task."""
+        if data["task_id"] not in coordinator.tasks:
+            return False
+        await coordinator.async_remove_task(data["task_id"])
+        return True
+    
+    async def batch_remove_reward(data: dict[str, Any]) -> bool:
+        """Remove a reward inside a batch, failing on an unknown reward."""
+        if data["reward_id"] not in coordinator.rewards:
+            return False
+        await coordinator.async_remove_reward(data["reward_id"])
+        return True
+    
+    # Operations accepted by the batch service: action -> (schema, handler)
+    batch_actions = {
+        SERVICE_COMPLETE_TASK: (
+            SERVICE_COMPLETE_TASK_SCHEMA,
+            lambda data: coordinator.async_complete_task(
+                data["task_id"], data["child_id"], data.get("validation_required")
+            ),
+        ),
+        SERVICE_VALIDATE_TASK: (
+            SERVICE_VALIDATE_TASK_SCHEMA,
+            lambda data: coordinator.async_validate_task(data["task_id"]),
+        ),
+        SERVICE_VALIDATE_ALL_TASKS: (
+            vol.Schema({}),
+            lambda data: coordinator.async_validate_all_pending(),
+        ),
+        SERVICE_REJECT_TASK: (
+            SERVICE_REJECT_TASK_SCHEMA,
+            lambda data: coordinator.async_reject_task(data["task_id"]),
+        ),
+        SERVICE_RESET_TASK: (SERVICE_RESET_TASK_SCHEMA, batch_reset_task),
+        SERVICE_CLAIM_REWARD: (
+            SERVICE_CLAIM_REWARD_SCHEMA,
+            lambda data: coordinator.async_claim_reward(data["reward_id"], data["child_id"]),
+        ),
+        SERVICE_ADD_POINTS: (
+            SERVICE_ADD_POINTS_SCHEMA,
+            lambda data: coordinator.async_add_points(data["child_id"], data["points"]),
+        ),
+        SERVICE_REMOVE_POINTS: (
+            SERVICE_REMOVE_POINTS_SCHEMA,
+            lambda data: coordinator.async_remove_points(data["child_id"], data["points"]),
+        ),
+        SERVICE_SET_POINTS: (
+            SERVICE_SET_POINTS_SCHEMA,
+            lambda data: coordinator.async_set_points(
+                data["child_id"], data["points"], data.get("description")
+            ),
+        ),
+        SERVICE_ADD_COINS: (
+            SERVICE_ADD_COINS_SCHEMA,
+            lambda data: coordinator.async_add_coins(data["child_id"], data["coins"]),
+        ),
+        SERVICE_REMOVE_COINS: (
+            SERVICE_REMOVE_COINS_SCHEMA,
+            lambda data: coordinator.async_remove_coins(data["child_id"], data["coins"]),
+        ),
+        SERVICE_SET_COINS: (
+            SERVICE_SET_COINS_SCHEMA,
+            lambda data: coordinator.async_set_coins(data["child_id"], data["coins"]),
+        ),
+        SERVICE_ADD_CURRENCY: (
+            SERVICE_ADD_CURRENCY_SCHEMA,
+            lambda data: coordinator.async_add_currency(
+                data["child_id"], data.get("points", 0), data.get("coins", 0)
+            ),
+        ),
+        SERVICE_SET_LEVEL: (
+            SERVICE_SET_LEVEL_SCHEMA,
+            lambda data: coordinator.async_set_level(
+                data["child_id"], data["level"], data.get("description")
+            ),
+        ),
+        SERVICE_UPDATE_CHILD: (
+            SERVICE_UPDATE_CHILD_SCHEMA,
+            lambda data: coordinator.async_update_child(
+                data["child_id"], {k: v for k, v in data.items() if k != "child_id"}
+            ),
+        ),
+        SERVICE_UPDATE_TASK: (
+            SERVICE_UPDATE_TASK_SCHEMA,
+            lambda data: coordinator.async_update_task(
+                data["task_id"], {k: v for k, v in data.items() if k != "task_id"}
+            ),
+        ),
+        SERVICE_SUSPEND_TASK: (SERVICE_SUSPEND_TASK_SCHEMA, batch_suspend_task),
+        SERVICE_RESUME_TASK: (
+            SERVICE_RESUME_TASK_SCHEMA,
+            lambda data: coordinator.async_resume_task(data["task_id"]),
+        ),
+        SERVICE_REMOVE_TASK: (SERVICE_REMOVE_TASK_SCHEMA, batch_remove_task),
+        SERVICE_UPDATE_REWARD: (
+            SERVICE_UPDATE_REWARD_SCHEMA,
+            lambda data: coordinator.async_update_reward(
+                data["reward_id"], {k: v for k, v in data.items() if k != "reward_id"}
+            ),
+        ),
+        SERVICE_REMOVE_REWARD: (SERVICE_REMOVE_REWARD_SCHEMA, batch_remove_reward),
+    }
+    
+    async def batch_service(call: ServiceCall) -> ServiceResponse:
+        """Apply several operations with a single save and a single refresh."""
+        stop_on_error = call.data["stop_on_error"]
+        results: list[dict[str, Any]] = []
+        
+        async with coordinator.async_batch():
+            for operation in call.data["operations"]:
+                action = operation["action"]
+                outcome: dict[str, Any] = {"action": action}
+                try:
+                    if action not in batch_actions:
+                        raise vol.Invalid(f"Unsupported batch action: {action}")
+                    schema, handler = batch_actions[action]
+                    # Une opération en échec est annulée sans toucher aux autres
+                    async with coordinator.transaction():
+                        result = await handler(schema(operation["data"]))
+                    # Coordinator methods report unknown ids with False
+                    outcome["success"] = result is not False
+                    if result is not None and not isinstance(result, bool):
+                        outcome["result"] = result
+                except Exception as e:
+                    _LOGGER.warning("Batch operation %s failed: %s", action, e)
+                    outcome["success"] = False
+                    outcome["error"] = str(e)
+                results.append(outcome)
+                if stop_on_error and not outcome["success"]:
+                    break
+        
+        succeeded = sum(1 for outcome in results if outcome["success"])
+        _LOGGER.info("Batch applied: %d/%d operations succeeded", succeeded, len(results))
+        return {"results": results}
+    
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BATCH,
+        batch_service,
+        schema=SERVICE_BATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,187 @@
+# ============================================================================
+# storage.py
+# ============================================================================
+
+"""Sharded storage for Kids Tasks integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_KEY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+SHARDS = ("children", "tasks", "rewards", "history", "system")
+
+
+class KidsTasksStorage:
+    """Persist the data in one ``Store`` per collection.
+
+    Exposes the ``Store`` methods the coordinator uses, on the single-document
+    layout (``children``/``tasks``/``rewards``/``system``). Points histories
+    are kept apart from the children, and a write only rewrites the shards
+    whose content differs from the last written one. Unchanged objects keep
+    the same (copy-on-write) snapshot dicts, so the comparison is cheap.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shard stores."""
+        self.hass = hass
+        self._stores = {
+            shard: Store(hass, STORAGE_VERSION, f"{DOMAIN}.{shard}") for shard in SHARDS
+        }
+        # Single-document layout used before the data was sharded
+        self._legacy_store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        # Content last loaded or written, per shard
+        self._written: dict[str, dict[str, Any]] = {}
+        # child_id -> (child dict, child dict without history, history)
+        self._child_parts: dict[str, tuple[dict[str, Any], dict[str, Any], list[Any]]] = {}
+        self._data_func: Callable[[], dict[str, Any]] | None = None
+        self._unsub_delay: CALLBACK_TYPE | None = None
+        # Called with the document once it is on disk
+        self._listeners: list[Callable[[dict[str, Any]], None]] = []
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the data, migrating the single-document layout on first use."""
+        legacy_data = await self._legacy_store.async_load()
+        if legacy_data is not None:
+            # Shards are only authoritative once the legacy document is gone
+            await self._async_migrate(legacy_data)
+            return legacy_data
+
+        loaded = await asyncio.gather(*(self._stores[shard].async_load() for shard in SHARDS))
+        if all(data is None for data in loaded):
+            return None
+
+        self._written = {shard: data or {} for shard, data in zip(SHARDS, loaded)}
+        history = self._written["history"]
+        children = {
+            child_id: {**child_data, "points_history": history.get(child_id, [])}
+            for child_id, child_data in self._written["children"].items()
+        }
+        return {
+            "children": children,
+            "tasks": self._written["tasks"],
+            "rewards": self._written["rewards"],
+            "system": self._written["system"],
+        }
+
+    async def _async_migrate(self, legacy_data: dict[str, Any]) -> None:
+        """Write the single-document data to the shards, then remove it."""
+        _LOGGER.info("Migrating %s to per-collection storage", STORAGE_KEY)
+        self._written = {}
+        await self._async_write(legacy_data)
+        await self._legacy_store.async_remove()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[dict[str, Any]], None]) -> CALLBACK_TYPE:
+        """Call ``listener`` with the saved document after every write."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    @callback
+    def async_delay_save(self, data_func: Callable[[], dict[str, Any]], delay: float = 0) -> None:
+        """Write the data returned by ``data_func`` after ``delay`` seconds.
+
+        Like ``Store.async_delay_save``, a new call postpones the write and the
+        data is only serialized when the write happens.
+        """
+        self._data_func = data_func
+        self._cancel_delay()
+        self._unsub_delay = async_call_later(self.hass, delay, self._async_delayed_write)
+
+    async def _async_delayed_write(self, _now: Any) -> None:
+        """Write the data of the pending delayed save."""
+        self._unsub_delay = None
+        data_func, self._data_func = self._data_func, None
+        if data_func is not None:
+            await self._async_write(data_func())
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Write the data now, cancelling any pending delayed save."""
+        self._cancel_delay()
+        self._data_func = None
+        await self._async_write(data)
+
+    async def async_remove(self) -> None:
+        """Remove every shard, and the legacy document if still present."""
+        self._cancel_delay()
+        self._data_func = None
+        self._written = {}
+        self._child_parts = {}
+        await asyncio.gather(
+            self._legacy_store.async_remove(),
+            *(store.async_remove() for store in self._stores.values()),
+        )
+
+    def _cancel_delay(self) -> None:
+        """Cancel the pending delayed save, if any."""
+        if self._unsub_delay is not None:
+            self._unsub_delay()
+            self._unsub_delay = None
+
+    async def _async_write(self, data: dict[str, Any]) -> None:
+        """Save the shards whose content changed since they were last written."""
+        children, history = self._split_children(data.get("children", {}))
+        shards = {
+            "children": children,
+            "tasks": data.get("tasks", {}),
+            "rewards": data.get("rewards", {}),
+            "history": history,
+            "system": data.get("system", {}),
+        }
+
+        changed = [
+            shard
+            for shard, shard_data in shards.items()
+            if shard not in self._written
+            or (self._written[shard] is not shard_data and self._written[shard] != shard_data)
+        ]
+        if changed:
+            _LOGGER.debug("Writing storage shards: %s", changed)
+            # The system shard holds the journal sequence the other shards
+            # cover: it is written last, so after a crash in between it
+            # points at or before them and replay catches them up
+            data_shards = [shard for shard in changed if shard != "system"]
+            await asyncio.gather(*(self._stores[shard].async_save(shards[shard]) for shard in data_shards))
+            for shard in data_shards:
+                self._written[shard] = shards[shard]
+            if "system" in changed:
+                await self._stores["system"].async_save(shards["system"])
+                self._written["system"] = shards["system"]
+
+        for listener in list(self._listeners):
+            listener(data)
+
+    def _split_children(
+        self, children: dict[str, dict[str, Any]]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, list[Any]]]:
+        """Split the child dicts into ``(children without history, histories)``.
+
+        Parts of a child whose dict did not change are reused as is, and parts
+        equal to the previous ones keep the previous object.
+        """
+        child_parts = {}
+        for child_id, child_data in children.items():
+            parts = self._child_parts.get(child_id)
+            if parts is None or parts[0] is not child_data:
+                fields = {key: value for key, value in child_data.items() if key != "points_history"}
+                history = child_data.get("points_history", [])
+                if parts is not None:
+                    fields = parts[1] if parts[1] == fields else fields
+                    history = parts[2] if parts[2] == history else history
+                parts = (child_data, fields, history)
+            child_parts[child_id] = parts
+
+        self._child_parts = child_parts
+        return (
+            {child_id: parts[1] for child_id, parts in child_parts.items()},
+            {child_id: parts[2] for child_id, parts in child_parts.items()},
+        )
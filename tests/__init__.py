@@ -0,0 +1 @@
+"""Tests for the Kids Tasks integration."""
@@ -0,0 +1,19 @@
+"""Stand-ins shared by the tests."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+
+class MemoryStore:
+    """Storage stand-in that loads nothing and keeps nothing."""
+
+    async def async_load(self) -> None:
+        """Start from empty data."""
+        return None
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Drop the data."""
+
+    def async_delay_save(self, data_func: Callable[[], dict[str, Any]], delay: float = 0) -> None:
+        """Drop the delayed save."""
@@ -0,0 +1,16 @@
+"""Shared helpers for the Kids Tasks tests (Home Assistant must be importable)."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> str:
+    """Return a Home Assistant configuration directory with a ``.storage`` folder."""
+    (tmp_path / ".storage").mkdir()
+    return str(tmp_path)
@@ -0,0 +1,57 @@
+"""Cosmetic rewards created and synced from the catalog."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.kids_tasks.coordinator import KidsTasksDataUpdateCoordinator
+from custom_components.kids_tasks.cosmetics import CosmeticsCatalog
+from custom_components.kids_tasks.models import Child
+
+from .common import MemoryStore
+
+
+def _write_catalog(cosmetics_dir: Path, cosmetic_type: str, items: list[dict], mtime: int) -> None:
+    """Write the catalog file of a type with a given modification time."""
+    path = cosmetics_dir / cosmetic_type / "catalog.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"items": items}), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_catalog_sync_and_activation(config_dir: str, tmp_path: Path) -> None:
+    """Existing rewards follow the catalog; a cosmetic only activates as its type."""
+    cosmetics_dir = tmp_path / "cosmetics"
+    ninja = {"id": "ninja", "name": "Ninja", "cost": 100, "rarity": "rare"}
+    _write_catalog(cosmetics_dir, "avatars", [ninja], 1_000)
+
+    async def run() -> tuple[int, int, int, bool, bool]:
+        hass = HomeAssistant(config_dir)
+        coordinator = KidsTasksDataUpdateCoordinator(hass, MemoryStore(), "entry")
+        coordinator.cosmetics_catalog = CosmeticsCatalog(hass, str(cosmetics_dir))
+        await coordinator.async_refresh()
+        await coordinator.async_add_child(
+            Child(id="c1", name="A", cosmetic_collection={"avatars": ["ninja"]})
+        )
+
+        created = await coordinator.async_create_cosmetic_rewards_from_catalog()
+        _write_catalog(cosmetics_dir, "avatars", [{**ninja, "cost": 150}], 2_000)
+        recreated = await coordinator.async_create_cosmetic_rewards_from_catalog(sync_existing=True)
+        (reward,) = coordinator.rewards.values()
+
+        wrong_type = await coordinator.async_activate_cosmetic("c1", "ninja", "themes")
+        right_type = await coordinator.async_activate_cosmetic("c1", "ninja", "avatars")
+
+        coordinator.async_cancel_timers()
+        await hass.async_stop(force=True)
+        return created, recreated, reward.cost, wrong_type, right_type
+
+    created, recreated, cost, wrong_type, right_type = asyncio.run(run())
+
+    assert (created, recreated, cost) == (1, 0, 150)
+    assert not wrong_type
+    assert right_type
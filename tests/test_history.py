@@ -0,0 +1,62 @@
+"""Points history entries whose stored timestamp cannot be parsed."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.kids_tasks.coordinator import KidsTasksDataUpdateCoordinator
+from custom_components.kids_tasks.models import Child
+
+from .common import MemoryStore
+
+
+def _child_with_malformed_entry() -> Child:
+    """Return a child with a full history whose oldest entry has a malformed timestamp."""
+    now = datetime.now()
+    history = [
+        {
+            "timestamp": (now - timedelta(minutes=index)).isoformat(),
+            "action_type": "manual_adjustment",
+            "points_delta": 1,
+            "description": f"entry {index}",
+        }
+        for index in range(19)
+    ]
+    history.append({**history[-1], "timestamp": "not a date", "description": "malformed"})
+    return Child.from_dict({"id": "c1", "name": "A", "points": 20, "points_history": history})
+
+
+def test_malformed_timestamp_is_skipped(config_dir: str) -> None:
+    """The entry stays out of the archive and of the history pages."""
+
+    async def run() -> tuple[dict, list[str]]:
+        hass = HomeAssistant(config_dir)
+        coordinator = KidsTasksDataUpdateCoordinator(hass, MemoryStore(), "entry")
+        await coordinator.async_refresh()
+        await coordinator.async_add_child(_child_with_malformed_entry())
+
+        # Pushes the malformed entry out of the in-memory history, to the archive
+        await coordinator.async_add_points("c1", 5)
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        await coordinator.history_archive.async_flush()
+        months = await coordinator.history_archive.async_months()
+
+        # Same with the entry still in memory
+        coordinator.children["c1"] = _child_with_malformed_entry()
+        page = await coordinator.async_get_child_history(
+            "c1", limit=50, until_date=datetime.now().isoformat()
+        )
+
+        coordinator.async_cancel_timers()
+        await hass.async_stop(force=True)
+        return page, months
+
+    page, months = asyncio.run(run())
+
+    assert months == []
+    descriptions = [entry["description"] for entry in page["entries"]]
+    assert "malformed" not in descriptions
+    assert len(descriptions) == 19
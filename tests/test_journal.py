@@ -0,0 +1,99 @@
+"""Replay of the journal after a restart that missed the delayed store write."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.kids_tasks.coordinator import KidsTasksDataUpdateCoordinator
+from custom_components.kids_tasks.models import Child, Reward, Task, TaskChildStatus
+from custom_components.kids_tasks.storage import KidsTasksStorage
+
+
+def _coordinator(hass: HomeAssistant) -> KidsTasksDataUpdateCoordinator:
+    """Return a coordinator on the configuration's storage, with delayed writes."""
+    storage = KidsTasksStorage(hass)
+    coordinator = KidsTasksDataUpdateCoordinator(hass, storage, "entry", save_delay=1000)
+    storage.async_add_listener(coordinator.journal.async_snapshot_written)
+    return coordinator
+
+
+async def _crash(coordinator: KidsTasksDataUpdateCoordinator) -> None:
+    """Stop before the delayed store write, keeping only the journal."""
+    await coordinator.journal.async_flush()
+    coordinator.async_cancel_timers()
+    coordinator.store._cancel_delay()
+
+
+def _completed_household(
+    config_dir: str, claim: bool = False, validate: bool = False
+) -> tuple[KidsTasksDataUpdateCoordinator, list]:
+    """Complete (and validate) a task that awards points, optionally claim a reward, crash and restart."""
+
+    async def run() -> tuple[KidsTasksDataUpdateCoordinator, list]:
+        hass = HomeAssistant(config_dir)
+        coordinator = _coordinator(hass)
+        await coordinator.async_refresh()
+        await coordinator.async_add_child(Child(id="c1", name="A", points=936, coins=80))
+        await coordinator.async_add_task(
+            Task(
+                id="t1",
+                name="T",
+                points=10,
+                coins=1,
+                assigned_child_ids=["c1"],
+                validation_required=validate,
+                child_statuses={"c1": TaskChildStatus(child_id="c1")},
+            )
+        )
+        await coordinator.async_add_reward(Reward(id="r1", name="R", cost=50))
+        await coordinator.async_flush_data()
+        flushed_seq = coordinator.journal.seq
+
+        await coordinator.async_complete_task("t1", "c1")
+        if validate:
+            await coordinator.async_validate_task("t1")
+        if claim:
+            await coordinator.async_claim_reward("r1", "c1")
+        await _crash(coordinator)
+
+        with open(coordinator.journal.path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        entries = [entry for entry in entries if entry["seq"] > flushed_seq]
+
+        # Only the loading: the first refresh would also run the periodic resets
+        restarted = _coordinator(hass)
+        await restarted._load_data()
+        restarted.async_cancel_timers()
+        await hass.async_stop(force=True)
+        return restarted, entries
+
+    return asyncio.run(run())
+
+
+def test_replay_restores_completion_award(config_dir: str) -> None:
+    """A completion validated on the spot replays its points and coins."""
+    coordinator, _ = _completed_household(config_dir)
+
+    assert coordinator.tasks["t1"].child_statuses["c1"].status == "validated"
+    assert coordinator.children["c1"].points == 946
+    assert coordinator.children["c1"].coins == 81
+
+
+def test_replay_restores_validation_award(config_dir: str) -> None:
+    """A completion validated by a parent replays its points and coins."""
+    coordinator, _ = _completed_household(config_dir, validate=True)
+
+    assert coordinator.tasks["t1"].child_statuses["c1"].status == "validated"
+    assert coordinator.children["c1"].points == 946
+    assert coordinator.children["c1"].coins == 81
+
+
+def test_journal_keeps_award_and_claim_apart(config_dir: str) -> None:
+    """The award and a following reward claim are journaled as separate deltas."""
+    coordinator, entries = _completed_household(config_dir, claim=True)
+
+    deltas = [entry["delta"] for entry in entries if entry.get("event") == "points"]
+    assert deltas == [10, -50]
+    assert coordinator.children["c1"].points == 896
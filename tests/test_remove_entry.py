@@ -0,0 +1,39 @@
+"""Removal of the integration."""
+from __future__ import annotations
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry
+
+from custom_components.kids_tasks import async_remove_entry
+from custom_components.kids_tasks.coordinator import KidsTasksDataUpdateCoordinator
+from custom_components.kids_tasks.models import Child
+from custom_components.kids_tasks.storage import KidsTasksStorage
+
+
+def test_remove_entry_deletes_journal_and_history(config_dir: str) -> None:
+    """Nothing of the removed entry is left for a new one to replay."""
+
+    async def run() -> list[str]:
+        hass = HomeAssistant(config_dir)
+        await entity_registry.async_load(hass)
+        coordinator = KidsTasksDataUpdateCoordinator(hass, KidsTasksStorage(hass), "entry")
+        await coordinator.async_refresh()
+        await coordinator.async_add_child(Child(id="c1", name="A"))
+        for _ in range(25):
+            await coordinator.async_add_points("c1", 1)
+        await coordinator.async_flush_data()
+        await coordinator.journal.async_flush()
+        await coordinator.history_archive.async_flush()
+        coordinator.async_cancel_timers()
+        assert os.path.exists(coordinator.journal.path)
+        assert os.path.isdir(coordinator.history_archive.archive_dir)
+
+        await async_remove_entry(hass, SimpleNamespace(entry_id="entry"))
+        await hass.async_stop(force=True)
+        return os.listdir(os.path.join(config_dir, ".storage"))
+
+    assert asyncio.run(run()) == []
@@ -0,0 +1,50 @@
+"""Periodic resets of the tasks."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.kids_tasks.coordinator import KidsTasksDataUpdateCoordinator
+from custom_components.kids_tasks.models import Child, Task, TaskChildStatus
+
+from .common import MemoryStore
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def test_daily_reset_skips_task_off_its_weekdays(config_dir: str) -> None:
+    """A daily task not due today is indexed and journaled as validated."""
+
+    async def run() -> tuple[Task, int, list[dict]]:
+        hass = HomeAssistant(config_dir)
+        coordinator = KidsTasksDataUpdateCoordinator(hass, MemoryStore(), "entry")
+        await coordinator.async_refresh()
+        await coordinator.async_add_child(Child(id="c1", name="A"))
+        today = datetime.now().strftime("%a").lower()
+        task = Task(
+            id="t1",
+            name="T",
+            frequency="daily",
+            weekly_days=[day for day in WEEKDAYS if day != today],
+            assigned_child_ids=["c1"],
+            child_statuses={"c1": TaskChildStatus(child_id="c1", status="validated")},
+        )
+        await coordinator.async_add_task(task)
+
+        entries: list[dict] = []
+        coordinator.journal._append = entries.append
+        await coordinator._reset_tasks_with_penalty([task], "daily")
+        validated = coordinator.count_validated_today("c1")
+
+        coordinator.async_cancel_timers()
+        await hass.async_stop(force=True)
+        return task, validated, entries
+
+    task, validated, entries = asyncio.run(run())
+
+    assert task.status == "validated"
+    assert validated == 1
+    # Validated before and after the reset: no transition for a replay to revive
+    assert [entry["to"] for entry in entries if entry["event"] == "status"] == []